@@ -1,20 +1,230 @@
 """ArXiv API client for paper retrieval."""
 
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+import asyncio
+import re
+import weakref
+from urllib.parse import urlencode, urlparse
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
 import aiohttp
 from models import ArxivPaper
 from config import Config
-from utils import debug_print, AsyncContextManager, RateLimiter
+from utils import debug_print, RateLimiter, LRUCache, chunk_list, handle_rate_limit_retry
+
+# XML parsing imports
+try:
+    from lxml import etree as ET  # type: ignore
+    _XML_PARSER = ET.XMLParser(huge_tree=False, resolve_entities=False, no_network=True)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSER = None
+
+# Fully-qualified (Clark notation) Atom tags, so lookups need no namespace map
+_ATOM = 'http://www.w3.org/2005/Atom'
+_TAG_ENTRY = f'{{{_ATOM}}}entry'
+_TAG_TITLE = f'{{{_ATOM}}}title'
+_TAG_AUTHOR = f'{{{_ATOM}}}author'
+_TAG_NAME = f'{{{_ATOM}}}name'
+_TAG_SUMMARY = f'{{{_ATOM}}}summary'
+_TAG_ID = f'{{{_ATOM}}}id'
+_TAG_PUBLISHED = f'{{{_ATOM}}}published'
+_TAG_LINK = f'{{{_ATOM}}}link'
+_TAG_CATEGORY = f'{{{_ATOM}}}category'
+
+# Concurrency bound per event loop, shared by every ArxivClient running on it
+_LOOP_SEMAPHORES = weakref.WeakKeyDictionary()
+
+# Size of the chunks fed to the incremental parser while a response streams in
+_STREAM_CHUNK_SIZE = 16384
+
+# Trailing version suffix of an ArXiv ID (e.g. the "v2" in 2301.12345v2)
+_VERSION_RE = re.compile(r'v\d+$')
+
+# Versionless ArXiv ID in an entry's abs URL; also matches old-style IDs like cs/0301001
+_ABS_RE = re.compile(r'/abs/(.+?)(?:v\d+)?$')
+
+
+def _parse_xml(xml_content: Union[str, bytes]):
+    """Parse an XML document with the fastest available backend.
+    
+    Bytes are handed to the parser as-is; str input is encoded first because
+    lxml rejects str documents that carry an encoding declaration.
+    """
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode('utf-8')
+    return ET.fromstring(xml_content, _XML_PARSER)
+
+
+def _new_pull_parser():
+    """Create an incremental parser reporting element start and end events."""
+    if _XML_PARSER is not None:
+        return ET.XMLPullParser(
+            events=('start', 'end'),
+            huge_tree=False,
+            resolve_entities=False,
+            no_network=True
+        )
+    return ET.XMLPullParser(events=('start', 'end'))
+
+
+def _loop_semaphore() -> asyncio.Semaphore:
+    """Get the ArXiv request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LOOP_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LOOP_SEMAPHORES[loop] = asyncio.Semaphore(Config.ARXIV_MAX_CONCURRENCY)
+    return semaphore
 
 
 class ArxivClient:
-    """Client for interacting with ArXiv API."""
+    """Client for interacting with ArXiv API.
+    
+    A single HTTP session is shared by every request made through the client so
+    that the connection pool, keep-alive connections and DNS cache are reused.
+    Use the client as an async context manager (or call ``close()``) to release it.
+    """
     
     def __init__(self, debug: bool = Config.DEBUG_MODE):
         self.debug = debug
-        self.rate_limiter = RateLimiter()
         self.base_url = Config.ARXIV_BASE_URL
+        # Pacing is shared by every client hitting the ArXiv host
+        self.rate_limiter = RateLimiter.for_host(urlparse(self.base_url).netloc)
+        self._query_prefix = f"{self.base_url}?"
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Parsed entries keyed by query URL, so repeated lookups skip the network
+        self._cache = LRUCache(Config.ARXIV_CACHE_SIZE)
+    
+    async def __aenter__(self) -> 'ArxivClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers=Config.get_api_headers(),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=Config.ARXIV_MAX_CONCURRENCY,
+                    ttl_dns_cache=300
+                )
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _fetch(
+        self,
+        query_url: str,
+        read: Optional[Callable[[aiohttp.ClientResponse], Awaitable]] = None
+    ):
+        """GET an ArXiv API URL and return the response body, or None on failure.
+        
+        Requests are bounded by the per-loop ArXiv semaphore and retried with
+        exponential backoff when ArXiv answers 429 or 503. ``read`` consumes a
+        successful response; by default the raw body bytes are returned.
+        """
+        session = self._get_session()
+        
+        async def make_request():
+            await self.rate_limiter.wait()
+            return await session.get(query_url)
+        
+        try:
+            async with _loop_semaphore():
+                response = await handle_rate_limit_retry(
+                    make_request, debug=self.debug, retry_statuses=(429, 503)
+                )
+                if response is None:
+                    return None
+                
+                async with response:
+                    if response.status == 200:
+                        if read is None:
+                            return await response.read()
+                        return await read(response)
+                    debug_print(f"ArXiv API error {response.status} for {query_url}", self.debug)
+                    return None
+        except Exception as e:
+            debug_print(f"Error requesting ArXiv {query_url}: {str(e)}", self.debug)
+            return None
+    
+    def _build_url(self, params: List[Tuple[str, str]]) -> str:
+        """Build an ArXiv API URL with properly encoded query parameters."""
+        # Commas and colons are legal in query strings and keep id_list/field prefixes readable
+        return self._query_prefix + urlencode(params, safe=',:')
+    
+    def _build_search_url(
+        self,
+        search_query: str,
+        max_results: int,
+        sort_by: str,
+        sort_order: str
+    ) -> str:
+        """Build a ``search_query`` URL; spaces in the query are encoded as '+'."""
+        return self._build_url([
+            ('search_query', search_query),
+            ('start', '0'),
+            ('max_results', str(max_results)),
+            ('sortBy', sort_by),
+            ('sortOrder', sort_order)
+        ])
+    
+    async def _fetch_entries(self, query_url: str) -> Optional[List[ArxivPaper]]:
+        """GET an ArXiv API URL and parse its entries while the body streams in.
+        
+        Successful results are cached by URL; failed requests are not cached.
+        """
+        papers = self._cache.get(query_url)
+        if papers is not None:
+            debug_print(f"ArXiv cache hit: {query_url}", self.debug)
+            return list(papers)
+        
+        papers = await self._fetch(query_url, self._stream_entries)
+        if papers is not None:
+            self._cache.set(query_url, papers)
+            return list(papers)
+        return None
+    
+    async def _stream_entries(self, response: aiohttp.ClientResponse) -> Optional[List[ArxivPaper]]:
+        """Incrementally parse Atom entries from a streaming response.
+        
+        Each entry is converted as soon as its closing tag arrives and then
+        dropped from the tree, so parsing overlaps the download and only about
+        one entry is held in memory at a time. Returns None for malformed XML.
+        """
+        papers = []
+        parser = _new_pull_parser()
+        root = None
+        
+        try:
+            async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == 'start':
+                        if root is None:
+                            root = elem
+                    elif elem.tag == _TAG_ENTRY:
+                        paper = self._parse_entry(elem)
+                        if paper:
+                            papers.append(paper)
+                        elem.clear()
+                        if elem is not root:
+                            root.remove(elem)
+            parser.close()
+            
+            debug_print(f"Parsed {len(papers)} papers from ArXiv response", self.debug)
+            
+        except ET.ParseError as e:
+            debug_print(f"Error parsing ArXiv XML stream: {str(e)}", self.debug)
+            return None
+        
+        return papers
     
     async def get_paper_by_id(self, arxiv_id: str) -> Optional[ArxivPaper]:
         """Retrieve a single paper by ArXiv ID."""
@@ -23,22 +233,53 @@ class ArxivClient:
         # Clean the ArXiv ID
         clean_id = arxiv_id.replace('arXiv:', '').strip()
         
-        query_url = f"{self.base_url}?id_list={clean_id}"
+        query_url = self._build_url([('id_list', clean_id)])
         
-        async with AsyncContextManager() as session:
-            await self.rate_limiter.wait()
-            
-            try:
-                async with session.get(query_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        return self._parse_arxiv_response(content)
-                    else:
-                        debug_print(f"ArXiv API error: {response.status}", self.debug)
-                        return None
-            except Exception as e:
-                debug_print(f"Error fetching ArXiv paper {arxiv_id}: {str(e)}", self.debug)
-                return None
+        papers = await self._fetch_entries(query_url)
+        if not papers:
+            debug_print("No entry found in ArXiv response", self.debug)
+            return None
+        
+        return papers[0]
+    
+    async def get_papers_by_ids(self, arxiv_ids: List[str]) -> List[Optional[ArxivPaper]]:
+        """Retrieve several papers using batched ``id_list`` queries.
+        
+        Results are returned in the order of ``arxiv_ids``; IDs that could not
+        be resolved map to ``None``. A batch that fails or comes back empty is
+        retried one ID at a time.
+        """
+        debug_print(f"Fetching {len(arxiv_ids)} ArXiv papers", self.debug)
+        
+        clean_ids = [arxiv_id.replace('arXiv:', '').strip() for arxiv_id in arxiv_ids]
+        
+        batches = await asyncio.gather(*(
+            self._fetch_id_batch(chunk)
+            for chunk in chunk_list(clean_ids, Config.ARXIV_ID_BATCH_SIZE)
+        ))
+        
+        papers_by_id: Dict[str, ArxivPaper] = {}
+        for papers in batches:
+            for paper in papers:
+                papers_by_id[_VERSION_RE.sub('', paper.arxiv_id)] = paper
+        
+        return [papers_by_id.get(_VERSION_RE.sub('', clean_id)) for clean_id in clean_ids]
+    
+    async def _fetch_id_batch(self, clean_ids: List[str]) -> List[ArxivPaper]:
+        """Fetch one ``id_list`` batch of papers."""
+        query_url = self._build_url([
+            ('id_list', ','.join(clean_ids)),
+            ('max_results', str(len(clean_ids)))
+        ])
+        
+        papers = await self._fetch_entries(query_url)
+        if papers or len(clean_ids) == 1:
+            return papers or []
+        
+        # ArXiv rejects the whole id_list when any one ID is malformed, so fall back to single lookups
+        debug_print(f"ArXiv batch of {len(clean_ids)} IDs failed, fetching individually", self.debug)
+        papers = await asyncio.gather(*(self.get_paper_by_id(clean_id) for clean_id in clean_ids))
+        return [paper for paper in papers if paper is not None]
     
     async def search_papers(
         self, 
@@ -50,124 +291,61 @@ class ArxivClient:
         """Search for papers on ArXiv."""
         debug_print(f"Searching ArXiv for: {query}", self.debug)
         
-        # Construct search query
-        search_query = query.replace(' ', '+AND+')
-        query_url = (
-            f"{self.base_url}?"
-            f"search_query=all:{search_query}&"
-            f"start=0&"
-            f"max_results={max_results}&"
-            f"sortBy={sort_by}&"
-            f"sortOrder={sort_order}"
-        )
+        # Construct search query: every term must match
+        search_query = 'all:' + ' AND '.join(query.split())
+        query_url = self._build_search_url(search_query, max_results, sort_by, sort_order)
         
-        async with AsyncContextManager() as session:
-            await self.rate_limiter.wait()
-            
-            try:
-                async with session.get(query_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        return self._parse_arxiv_search_response(content)
-                    else:
-                        debug_print(f"ArXiv search error: {response.status}", self.debug)
-                        return []
-            except Exception as e:
-                debug_print(f"Error searching ArXiv: {str(e)}", self.debug)
-                return []
+        return await self._fetch_entries(query_url) or []
     
     async def search_by_author(self, author_name: str, max_results: int = 10) -> List[ArxivPaper]:
         """Search for papers by author name."""
         debug_print(f"Searching ArXiv by author: {author_name}", self.debug)
         
-        author_query = author_name.replace(' ', '+')
-        query_url = (
-            f"{self.base_url}?"
-            f"search_query=au:{author_query}&"
-            f"start=0&"
-            f"max_results={max_results}&"
-            f"sortBy=submittedDate&"
-            f"sortOrder=descending"
+        query_url = self._build_search_url(
+            f"au:{author_name}", max_results, "submittedDate", "descending"
         )
         
-        async with AsyncContextManager() as session:
-            await self.rate_limiter.wait()
-            
-            try:
-                async with session.get(query_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        return self._parse_arxiv_search_response(content)
-                    else:
-                        debug_print(f"ArXiv author search error: {response.status}", self.debug)
-                        return []
-            except Exception as e:
-                debug_print(f"Error searching ArXiv by author: {str(e)}", self.debug)
-                return []
+        return await self._fetch_entries(query_url) or []
     
     async def search_by_category(self, category: str, max_results: int = 10) -> List[ArxivPaper]:
         """Search for papers by category."""
         debug_print(f"Searching ArXiv by category: {category}", self.debug)
         
-        query_url = (
-            f"{self.base_url}?"
-            f"search_query=cat:{category}&"
-            f"start=0&"
-            f"max_results={max_results}&"
-            f"sortBy=submittedDate&"
-            f"sortOrder=descending"
+        query_url = self._build_search_url(
+            f"cat:{category}", max_results, "submittedDate", "descending"
         )
         
-        async with AsyncContextManager() as session:
-            await self.rate_limiter.wait()
-            
-            try:
-                async with session.get(query_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        return self._parse_arxiv_search_response(content)
-                    else:
-                        debug_print(f"ArXiv category search error: {response.status}", self.debug)
-                        return []
-            except Exception as e:
-                debug_print(f"Error searching ArXiv by category: {str(e)}", self.debug)
-                return []
-    
-    def _parse_arxiv_response(self, xml_content: str) -> Optional[ArxivPaper]:
+        return await self._fetch_entries(query_url) or []
+    
+    def _parse_arxiv_response(self, xml_content: Union[str, bytes]) -> Optional[ArxivPaper]:
         """Parse ArXiv API XML response for a single paper."""
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Define namespace
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
+            root = _parse_xml(xml_content)
             
             # Find the first entry
-            entry = root.find('atom:entry', ns)
+            entry = root.find(_TAG_ENTRY)
             if entry is None:
                 debug_print("No entry found in ArXiv response", self.debug)
                 return None
             
-            return self._parse_entry(entry, ns)
+            return self._parse_entry(entry)
             
         except ET.ParseError as e:
             debug_print(f"Error parsing ArXiv XML: {str(e)}", self.debug)
             return None
     
-    def _parse_arxiv_search_response(self, xml_content: str) -> List[ArxivPaper]:
+    def _parse_arxiv_search_response(self, xml_content: Union[str, bytes]) -> List[ArxivPaper]:
         """Parse ArXiv API XML response for search results."""
         papers = []
         
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Define namespace
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
+            root = _parse_xml(xml_content)
             
             # Find all entries
-            entries = root.findall('atom:entry', ns)
+            entries = root.findall(_TAG_ENTRY)
             
             for entry in entries:
-                paper = self._parse_entry(entry, ns)
+                paper = self._parse_entry(entry)
                 if paper:
                     papers.append(paper)
             
@@ -178,50 +356,41 @@ class ArxivClient:
         
         return papers
     
-    def _parse_entry(self, entry, ns: dict) -> Optional[ArxivPaper]:
-        """Parse a single entry from ArXiv XML."""
+    def _parse_entry(self, entry) -> Optional[ArxivPaper]:
+        """Parse a single entry from ArXiv XML in one pass over its children."""
         try:
-            # Extract basic information
-            title = entry.find('atom:title', ns)
-            title_text = title.text.strip().replace('\n', ' ') if title is not None else "Unknown Title"
-            
-            # Extract authors
+            title_text = "Unknown Title"
             authors = []
-            for author in entry.findall('atom:author', ns):
-                name_elem = author.find('atom:name', ns)
-                if name_elem is not None:
-                    authors.append(name_elem.text.strip())
-            
-            # Extract abstract
-            summary = entry.find('atom:summary', ns)
-            abstract = summary.text.strip().replace('\n', ' ') if summary is not None else ""
-            
-            # Extract ArXiv ID from the ID field
-            id_elem = entry.find('atom:id', ns)
+            abstract = ""
             arxiv_id = ""
-            if id_elem is not None:
-                # Extract ID from URL like http://arxiv.org/abs/2301.12345v1
-                id_url = id_elem.text
-                if '/abs/' in id_url:
-                    arxiv_id = id_url.split('/abs/')[-1]
-            
-            # Extract published date
-            published = entry.find('atom:published', ns)
-            published_date = published.text if published is not None else ""
-            
-            # Extract PDF URL
+            published_date = ""
             pdf_url = ""
-            for link in entry.findall('atom:link', ns):
-                if link.get('type') == 'application/pdf':
-                    pdf_url = link.get('href', '')
-                    break
-            
-            # Extract categories
             categories = []
-            for category in entry.findall('atom:category', ns):
-                term = category.get('term')
-                if term:
-                    categories.append(term)
+            
+            for child in entry:
+                tag = child.tag
+                if tag == _TAG_TITLE:
+                    title_text = child.text.strip().replace('\n', ' ')
+                elif tag == _TAG_AUTHOR:
+                    name_elem = child.find(_TAG_NAME)
+                    if name_elem is not None:
+                        authors.append(name_elem.text.strip())
+                elif tag == _TAG_SUMMARY:
+                    abstract = child.text.strip().replace('\n', ' ')
+                elif tag == _TAG_ID:
+                    # Extract ID from URL like http://arxiv.org/abs/2301.12345v1
+                    match = _ABS_RE.search(child.text)
+                    if match:
+                        arxiv_id = match.group(1)
+                elif tag == _TAG_PUBLISHED:
+                    published_date = child.text
+                elif tag == _TAG_LINK:
+                    if not pdf_url and child.get('type') == 'application/pdf':
+                        pdf_url = child.get('href', '')
+                elif tag == _TAG_CATEGORY:
+                    term = child.get('term')
+                    if term:
+                        categories.append(term)
             
             return ArxivPaper(
                 title=title_text,
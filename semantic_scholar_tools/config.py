@@ -17,16 +17,43 @@ class Config:
     DEFAULT_RATE_LIMIT_DELAY: float = 1.0  # seconds
     MAX_RETRIES: int = 3
     BACKOFF_FACTOR: float = 2.0
+    MAX_RATE_LIMIT_DELAY: float = 30.0  # upper bound for adaptive request spacing
+    RATE_LIMIT_RECOVERY_FACTOR: float = 0.9  # spacing multiplier after each success
+    ARXIV_MAX_CONCURRENCY: int = 4  # in-flight ArXiv requests
+    PAPER_FETCH_CONCURRENCY: int = 8  # concurrent Semantic Scholar paper lookups per tool call
+    SEMANTIC_SCHOLAR_MAX_CONNECTIONS: int = 16  # pooled keep-alive connections to the API
+    SEARCH_INDEX_READ_WORKERS: int = 16  # threads reading changed markdown files into the search index
+    PDF_EXTRACT_WORKERS: int = min(os.cpu_count() or 1, 4)  # processes extracting PDF pages in parallel
+    # Smaller page ranges are extracted in-process. pypdf takes ~4.5 ms per text page
+    # in-process, while the first pooled call pays ~0.35 s to spawn the workers and
+    # each worker re-opens the PDF; with 4 workers the pool only wins from ~100 pages.
+    PDF_PARALLEL_MIN_PAGES: int = 100
+    PDF_DOCUMENT_CACHE_SIZE: int = 8  # parsed PDFs kept open across extract/convert calls
     
     # Batch Processing
     BATCH_SIZE: int = 500  # Semantic Scholar batch limit
     MAX_SEARCH_RESULTS: int = 100
+    ARXIV_ID_BATCH_SIZE: int = 100  # ArXiv ids per id_list query
+    PAPER_BATCH_MAX: int = 100  # paper lookups coalesced into one /paper/batch request
+    PAPER_BATCH_WINDOW: float = 0.01  # seconds to wait for more lookups before sending a batch
+    
+    # Caching
+    ARXIV_CACHE_SIZE: int = 4096  # parsed ArXiv responses kept per client
+    PAPER_CACHE_SIZE: int = 1024  # Semantic Scholar papers kept by the analysis tools
+    PAPER_CACHE_TTL: float = 3600.0  # seconds
+    NEGATIVE_CACHE_TTL: float = 60.0  # seconds to remember papers that were not found
+    PAPER_STORE_TTL: float = 7 * 24 * 3600.0  # seconds papers are kept in the on-disk store
+    PERSISTENT_CACHE_PURGE_INTERVAL: int = 1000  # writes between sweeps of expired on-disk entries
+    API_RESPONSE_CACHE_SIZE: int = 4096  # paper/author lookups kept per Semantic Scholar client (the tools bypass it for papers)
+    API_RESPONSE_CACHE_TTL: float = 600.0  # seconds
     
     # File Paths
     BASE_DIR: Path = Path(__file__).parent.parent  # Go up from beta/ to project root
     PAPERS_DIR: Path = BASE_DIR / 'papers'
     JSON_FILES_DIR: Path = BASE_DIR / 'json_files'
     MD_FILES_DIR: Path = BASE_DIR / 'md_files'
+    PAPER_STORE_PATH: Path = Path(os.getenv('PAPER_STORE_PATH', BASE_DIR / 'cache' / 'papers.sqlite3'))
+    _directories_ready: bool = False
     
     # Debug Mode
     DEBUG_MODE: bool = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
@@ -49,6 +76,18 @@ class Config:
         'venue', 'url', 'externalIds'
     ]
     
+    # Nested paper fields requested alongside authors in /author/search
+    AUTHOR_PAPER_FIELDS = [
+        'papers.paperId', 'papers.title', 'papers.abstract', 'papers.authors',
+        'papers.year', 'papers.citationCount', 'papers.referenceCount',
+        'papers.influentialCitationCount', 'papers.venue', 'papers.url',
+        'papers.externalIds', 'papers.publicationTypes', 'papers.publicationDate',
+        'papers.journal'
+    ]
+    
+    # Memoized comma-joined field lists, keyed by attribute name
+    _fields_strings: dict = {}
+    
     @classmethod
     def get_api_headers(cls) -> dict:
         """Get headers for Semantic Scholar API requests."""
@@ -59,25 +98,41 @@ class Config:
     
     @classmethod
     def ensure_directories(cls) -> None:
-        """Ensure all required directories exist."""
+        """Ensure all required directories exist.
+        
+        Called on first write rather than at import; later calls are no-ops.
+        """
+        if cls._directories_ready:
+            return
         for directory in [cls.PAPERS_DIR, cls.JSON_FILES_DIR, cls.MD_FILES_DIR]:
             directory.mkdir(parents=True, exist_ok=True)
+        cls._directories_ready = True
+    
+    @classmethod
+    def _joined_fields(cls, name: str) -> str:
+        """Comma-join a field list attribute, memoized until the list is replaced."""
+        fields = getattr(cls, name)
+        cached = cls._fields_strings.get(name)
+        if cached is None or cached[0] is not fields:
+            cached = cls._fields_strings[name] = (fields, ','.join(fields))
+        return cached[1]
     
     @classmethod
     def get_paper_fields_string(cls) -> str:
         """Get comma-separated paper fields for API requests."""
-        return ','.join(cls.PAPER_FIELDS)
+        return cls._joined_fields('PAPER_FIELDS')
     
     @classmethod
     def get_author_fields_string(cls) -> str:
         """Get comma-separated author fields for API requests."""
-        return ','.join(cls.AUTHOR_FIELDS)
+        return cls._joined_fields('AUTHOR_FIELDS')
     
     @classmethod
     def get_citation_fields_string(cls) -> str:
         """Get comma-separated citation fields for API requests."""
-        return ','.join(cls.CITATION_FIELDS)
-
-
-# Initialize directories on import
-Config.ensure_directories()
\ No newline at end of file
+        return cls._joined_fields('CITATION_FIELDS')
+    
+    @classmethod
+    def get_author_paper_fields_string(cls) -> str:
+        """Get comma-separated nested paper fields for author search requests."""
+        return cls._joined_fields('AUTHOR_PAPER_FIELDS')
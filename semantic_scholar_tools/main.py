@@ -7,77 +7,122 @@
 """
 
 import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-# FastMCP imports
-from fastmcp import FastMCP
-
 # 配置和工具类
 from config import Config
 from utils import debug_print
 
-# 导入所有工具函数
-from paper_analysis_tools import (
-    analyze_paper_citations,
-    search_papers_by_keywords,
-    search_papers_by_author,
-    get_paper_details,
-    get_arxiv_paper,
-    search_arxiv_papers,
-    save_paper_to_markdown,
-    save_arxiv_paper_to_markdown,
-    organize_papers_by_topic,
-    generate_literature_review,
-    create_requirement_based_review,
-    search_papers_in_collection,
-    get_paper_recommendations
-)
-
-from pdf_processing_tools import (
-    download_arxiv_pdf,
-    extract_pdf_text,
-    convert_pdf_to_text,
-    process_arxiv_paper
-)
-
-from service_tools import get_service_info
-
-# 检查PDF处理可用性
-try:
-    from pypdf import PdfReader
-except ImportError:
-    PdfReader = None
-
-# 创建FastMCP应用
-mcp = FastMCP("Unified MCP Server")
-
-# 注册论文分析工具
-mcp.tool()(analyze_paper_citations)
-mcp.tool()(search_papers_by_keywords)
-mcp.tool()(search_papers_by_author)
-mcp.tool()(get_paper_details)
-mcp.tool()(get_arxiv_paper)
-mcp.tool()(search_arxiv_papers)
-mcp.tool()(save_paper_to_markdown)
-mcp.tool()(save_arxiv_paper_to_markdown)
-mcp.tool()(organize_papers_by_topic)
-mcp.tool()(generate_literature_review)
-mcp.tool()(create_requirement_based_review)
-mcp.tool()(search_papers_in_collection)
-mcp.tool()(get_paper_recommendations)
-
-# 注册PDF处理工具
-mcp.tool()(download_arxiv_pdf)
-mcp.tool()(extract_pdf_text)
-mcp.tool()(convert_pdf_to_text)
-mcp.tool()(process_arxiv_paper)
-
-# 注册服务信息工具
-mcp.tool()(get_service_info)
-
-# Export the app for testing
-app = mcp
+# FastMCP、工具模块和pypdf都在_bootstrap()中按需导入，
+# 使 --list-tools / --help 无需加载这些重量级依赖
+_mcp = None
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """在服务运行期间复用ArXiv、Semantic Scholar和PDF下载会话，停止时关闭连接池与PDF提取进程池。"""
+    from paper_analysis_tools import get_arxiv_client, get_semantic_scholar_client
+    from pdf_processing_tools import close_download_session, close_pdf_pool
+    
+    try:
+        async with get_arxiv_client(), get_semantic_scholar_client():
+            yield
+    finally:
+        await close_download_session()
+        await asyncio.to_thread(close_pdf_pool)
+
+
+def _bootstrap():
+    """导入FastMCP及全部工具模块，创建并注册MCP应用（仅执行一次）。"""
+    global _mcp
+    if _mcp is not None:
+        return _mcp
+    
+    # FastMCP imports
+    from fastmcp import FastMCP
+    
+    # 导入所有工具函数
+    from paper_analysis_tools import (
+        analyze_paper_citations,
+        search_papers_by_keywords,
+        search_papers_by_author,
+        get_paper_details,
+        get_arxiv_paper,
+        search_arxiv_papers,
+        save_paper_to_markdown,
+        save_arxiv_paper_to_markdown,
+        organize_papers_by_topic,
+        generate_literature_review,
+        create_requirement_based_review,
+        search_papers_in_collection,
+        get_paper_recommendations
+    )
+    
+    from pdf_processing_tools import (
+        download_arxiv_pdf,
+        extract_pdf_text,
+        convert_pdf_to_text,
+        process_arxiv_paper
+    )
+    
+    from service_tools import get_service_info
+    
+    # 创建FastMCP应用
+    mcp = FastMCP("Unified MCP Server", lifespan=lifespan)
+    
+    # 注册全部工具：论文分析、PDF处理、服务信息
+    for tool in (
+        analyze_paper_citations,
+        search_papers_by_keywords,
+        search_papers_by_author,
+        get_paper_details,
+        get_arxiv_paper,
+        search_arxiv_papers,
+        save_paper_to_markdown,
+        save_arxiv_paper_to_markdown,
+        organize_papers_by_topic,
+        generate_literature_review,
+        create_requirement_based_review,
+        search_papers_in_collection,
+        get_paper_recommendations,
+        download_arxiv_pdf,
+        extract_pdf_text,
+        convert_pdf_to_text,
+        process_arxiv_paper,
+        get_service_info
+    ):
+        mcp.tool()(tool)
+    
+    _mcp = mcp
+    return _mcp
+
+
+def _pdf_available() -> bool:
+    """检查PDF处理可用性（只查找模块，不导入）。"""
+    return importlib.util.find_spec('pypdf') is not None
+
+
+def _install_uvloop() -> bool:
+    """若已安装uvloop，则将其设为事件循环策略（Windows不支持）。"""
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+    # uvloop.install()在Python 3.12+上已弃用，直接设置事件循环策略
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def __getattr__(name: str):
+    """按需创建应用：`from main import app` 时才执行_bootstrap()。"""
+    # Export the app for testing
+    if name in ('app', 'mcp'):
+        return _bootstrap()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     import argparse
@@ -144,7 +189,7 @@ if __name__ == "__main__":
         print("\n📋 服务信息工具:")
         print("  • get_service_info - 获取服务信息")
         
-        if not PdfReader:
+        if not _pdf_available():
             print("\n⚠️  PDF处理功能不可用，请安装: pip install pypdf")
         
         print("\n💡 使用示例:")
@@ -157,14 +202,18 @@ if __name__ == "__main__":
     if args.debug:
         Config.DEBUG_MODE = True
     
+    # 在创建事件循环之前切换到uvloop
+    uvloop_enabled = _install_uvloop()
+    
     print(f"\n🚀 启动统一MCP服务器")
     print(f"🔧 调试模式: {'开启' if args.debug else '关闭'}")
-    print(f"📄 PDF处理: {'可用' if PdfReader else '不可用 (需要安装pypdf)'}")
+    print(f"📄 PDF处理: {'可用' if _pdf_available() else '不可用 (需要安装pypdf)'}")
     print(f"📡 传输协议: STDIO")
+    print(f"⚡ 事件循环: {'uvloop' if uvloop_enabled else 'asyncio'}")
     print(f"\n按 Ctrl+C 停止服务器\n")
     
     try:
         # FastMCP默认使用STDIO传输协议，不需要host和port参数
-        mcp.run()
+        _bootstrap().run()
     except KeyboardInterrupt:
         print("\n👋 服务器已停止")
\ No newline at end of file
@@ -1,12 +1,87 @@
 """Data models for ArXiv and Semantic Scholar papers."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import MISSING, dataclass, asdict, fields, is_dataclass
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
 
+# JSON serialization imports
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(obj: Any) -> str:
+    """Serialize a model or plain object to indented JSON."""
+    if orjson is not None:
+        # orjson walks dataclasses natively, skipping the asdict copy
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    if is_dataclass(obj):
+        obj = asdict(obj)
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _slots_dict(obj: Any) -> Dict[str, Any]:
+    """Build a dict straight from a flat model's slots.
+    
+    Field values are already JSON-ready (strings, numbers, plain lists and
+    dicts from the API), so the recursive deep copy done by ``asdict`` is
+    skipped; nested values are shared with the model.
+    """
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
+# Semantic Scholar API field names mapped to model field names
+_PAPER_FIELD_MAPPING = {
+    'paperId': 'paper_id',
+    'citationCount': 'citation_count',
+    'referenceCount': 'reference_count',
+    'influentialCitationCount': 'influential_citation_count',
+    'arxivId': 'arxiv_id',
+    'corpusId': 'corpus_id',
+    'externalIds': 'external_ids',
+    'publicationTypes': 'publication_types',
+    'publicationDate': 'publication_date'
+}
+
+# Immutable defaults for paper fields the API may omit
+_PAPER_DEFAULTS = {
+    'citation_count': 0,
+    'reference_count': 0,
+    'influential_citation_count': 0,
+    'arxiv_id': None,
+    'doi': None,
+    'corpus_id': None
+}
+
+def _convert_paper_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map API field names to model field names and fill in defaults."""
+    # Start from the defaults so fields present in the data simply overwrite them
+    converted_data = {**_PAPER_DEFAULTS, 'authors': []}
+    
+    # Convert field names, keeping only fields defined in the model
+    for key, value in data.items():
+        new_key = _PAPER_KEY_MAP.get(key)
+        if new_key is not None:
+            converted_data[new_key] = value
+    
+    return converted_data
+
+
+_AUTHOR_FIELD_MAPPING = {
+    'authorId': 'author_id',
+    'paperCount': 'paper_count',
+    'citationCount': 'citation_count',
+    'hIndex': 'h_index'
+}
+
+
+@dataclass(slots=True)
 class ArxivPaper:
     """Data model for ArXiv papers."""
     title: str
@@ -19,11 +94,11 @@ class ArxivPaper:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _slots_dict(self)
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ArxivPaper':
@@ -31,7 +106,7 @@ class ArxivPaper:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticScholarPaper:
     """Data model for Semantic Scholar papers."""
     paper_id: str
@@ -58,63 +133,35 @@ class SemanticScholarPaper:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _slots_dict(self)
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return _dumps(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SemanticScholarPaper':
         """Create instance from dictionary."""
-        # Map API field names to model field names
-        field_mapping = {
-            'paperId': 'paper_id',
-            'citationCount': 'citation_count',
-            'referenceCount': 'reference_count',
-            'influentialCitationCount': 'influential_citation_count',
-            'arxivId': 'arxiv_id',
-            'corpusId': 'corpus_id',
-            'externalIds': 'external_ids',
-            'publicationTypes': 'publication_types',
-            'publicationDate': 'publication_date'
-        }
-        
-        # Get valid field names for this class
-        import inspect
-        valid_fields = set(inspect.signature(cls).parameters.keys())
-        
-        # Convert field names
-        converted_data = {}
-        for key, value in data.items():
-            new_key = field_mapping.get(key, key)
-            # Only include fields that are defined in the model
-            if new_key in valid_fields:
-                converted_data[new_key] = value
-        
-        # Set default values for required fields if missing
-        defaults = {
-            'citation_count': 0,
-            'reference_count': 0,
-            'influential_citation_count': 0,
-            'authors': [],
-            'arxiv_id': None,
-            'doi': None,
-            'corpus_id': None
-        }
-        
-        for key, default_value in defaults.items():
-            if key not in converted_data:
-                converted_data[key] = default_value
+        return cls(**_convert_paper_data(data))
+    
+    @staticmethod
+    def dict_from_api(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an API paper object straight to the ``to_dict`` form.
         
-        return cls(**converted_data)
+        Equivalent to ``from_dict(data).to_dict()`` without building the model.
+        """
+        converted_data = _convert_paper_data(data)
+        missing = _PAPER_REQUIRED_FIELDS.difference(converted_data)
+        if missing:
+            raise TypeError(f"Paper data missing required fields: {', '.join(sorted(missing))}")
+        return {name: converted_data.get(name) for name in _PAPER_FIELD_NAMES}
     
     def get_author_names(self) -> List[str]:
         """Extract author names from author objects."""
         return [author.get('name', '') for author in self.authors if author.get('name')]
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthorInfo:
     """Data model for author information."""
     author_id: str
@@ -128,29 +175,39 @@ class AuthorInfo:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _slots_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AuthorInfo':
         """Create instance from dictionary."""
-        # Map API field names to model field names
-        field_mapping = {
-            'authorId': 'author_id',
-            'paperCount': 'paper_count',
-            'citationCount': 'citation_count',
-            'hIndex': 'h_index'
-        }
-        
-        # Convert field names
+        # Convert field names, keeping only fields defined in the model
         converted_data = {}
         for key, value in data.items():
-            new_key = field_mapping.get(key, key)
-            converted_data[new_key] = value
+            new_key = _AUTHOR_FIELD_MAPPING.get(key, key)
+            if new_key in _AUTHOR_VALID_FIELDS:
+                converted_data[new_key] = value
         
         return cls(**converted_data)
 
 
-@dataclass
+# Model field names, computed once instead of on every from_dict call
+_PAPER_FIELD_NAMES = tuple(f.name for f in fields(SemanticScholarPaper))
+_PAPER_VALID_FIELDS = frozenset(_PAPER_FIELD_NAMES)
+_PAPER_REQUIRED_FIELDS = frozenset(
+    f.name for f in fields(SemanticScholarPaper)
+    if f.default is MISSING and f.default_factory is MISSING
+)
+_AUTHOR_VALID_FIELDS = frozenset(f.name for f in fields(AuthorInfo))
+
+# Every accepted input key (API or model name) mapped to its paper field, so
+# conversion needs one lookup per key
+_PAPER_KEY_MAP = {name: name for name in _PAPER_FIELD_NAMES}
+_PAPER_KEY_MAP.update(
+    (key, name) for key, name in _PAPER_FIELD_MAPPING.items() if name in _PAPER_VALID_FIELDS
+)
+
+
+@dataclass(slots=True)
 class CitationAnalysisResult:
     """Result of citation analysis."""
     main_paper: SemanticScholarPaper
@@ -173,10 +230,10 @@ class CitationAnalysisResult:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return _dumps(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Search result from Semantic Scholar API."""
     total: int
@@ -1,19 +1,158 @@
 """论文分析工具模块 - 包含所有论文搜索、分析和管理功能"""
 
+import asyncio
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from config import Config
-from utils import debug_print, extract_arxiv_id, get_timestamp
-from models import SemanticScholarPaper, ArxivPaper, CitationAnalysisResult
+from utils import canonical_paper_id, catch_tool_errors, debug_print, get_timestamp, LRUCache, MicroBatcher, PersistentCache, SingleFlight
+from models import SemanticScholarPaper, ArxivPaper
 from arxiv_client import ArxivClient
 from semantic_scholar_client import SemanticScholarClient
 from paper_manager import PaperManager
 
-# Initialize clients
-arxiv_client = ArxivClient(debug=Config.DEBUG_MODE)
-semantic_scholar_client = SemanticScholarClient(debug=Config.DEBUG_MODE)
-paper_manager = PaperManager(debug=Config.DEBUG_MODE)
 
+# 客户端在首次使用时才创建，导入本模块不会建立目录或构造客户端
+@lru_cache(maxsize=1)
+def get_arxiv_client() -> ArxivClient:
+    """返回共享的ArXiv客户端。"""
+    return ArxivClient(debug=Config.DEBUG_MODE)
 
+
+@lru_cache(maxsize=1)
+def get_semantic_scholar_client() -> SemanticScholarClient:
+    """返回共享的Semantic Scholar客户端。"""
+    return SemanticScholarClient(debug=Config.DEBUG_MODE)
+
+
+@lru_cache(maxsize=1)
+def get_paper_manager() -> PaperManager:
+    """返回共享的PaperManager（首次创建时建立论文目录）。"""
+    return PaperManager(debug=Config.DEBUG_MODE)
+
+
+# 论文与推荐结果缓存（TTL+LRU），未找到的论文只短暂缓存
+_paper_cache = LRUCache(Config.PAPER_CACHE_SIZE, ttl=Config.PAPER_CACHE_TTL)
+_recommendation_cache = LRUCache(Config.PAPER_CACHE_SIZE, ttl=Config.PAPER_CACHE_TTL)
+_MISSING = object()
+
+# 论文元数据基本不变，持久化到磁盘以便重启后复用（未找到的论文不落盘）
+_paper_store = PersistentCache(Config.PAPER_STORE_PATH, ttl=Config.PAPER_STORE_TTL)
+
+# 合并对同一论文的并发请求，只向上游发送一次
+_single_flight = SingleFlight()
+
+
+# 短时间窗口内的单篇论文请求合并为一次/paper/batch请求
+# 论文已由_paper_cache和_paper_store缓存，绕过客户端的响应缓存，避免刷新时需等三层缓存都过期
+async def _get_papers_batch(paper_ids: List[str]) -> List[Any]:
+    """批量获取论文，结果与输入一一对应；批量接口失败时退回逐篇请求。"""
+    if len(paper_ids) == 1:
+        return [await get_semantic_scholar_client().get_paper(paper_ids[0], cache=False)]
+    
+    papers = await get_semantic_scholar_client().get_paper_batch(paper_ids)
+    if papers is not None:
+        return papers
+    
+    debug_print(f"Batch lookup of {len(paper_ids)} papers failed, fetching individually", Config.DEBUG_MODE)
+    semaphore = asyncio.Semaphore(Config.PAPER_FETCH_CONCURRENCY)
+    
+    async def fetch(paper_id: str) -> Optional[SemanticScholarPaper]:
+        async with semaphore:
+            return await get_semantic_scholar_client().get_paper(paper_id, cache=False)
+    
+    return await asyncio.gather(*(fetch(pid) for pid in paper_ids), return_exceptions=True)
+
+
+_paper_batcher = MicroBatcher(_get_papers_batch, Config.PAPER_BATCH_MAX, Config.PAPER_BATCH_WINDOW)
+
+# get_paper_details中可选数据对应的计数字段
+_DETAIL_COUNT_KEYS = {
+    'citations': 'citation_count',
+    'references': 'reference_count'
+}
+
+
+async def _cached_get_paper(paper_id: str) -> Optional[SemanticScholarPaper]:
+    """带缓存的semantic_scholar_client.get_paper：先查内存缓存，再查磁盘缓存，最后请求API。
+    
+    ArXiv URL与ID先归一为同一ID；缓存键与发往上游的ID始终相同。
+    """
+    key = canonical_paper_id(paper_id)
+    paper = _paper_cache.get(key, _MISSING)
+    if paper is not _MISSING:
+        return paper
+    
+    async def load() -> Optional[SemanticScholarPaper]:
+        data = await _paper_store.get(key)
+        if data is not None:
+            return SemanticScholarPaper.from_dict(data)
+        
+        fetched = await _paper_batcher.submit(key)
+        if fetched:
+            await _paper_store.set(key, fetched.to_dict())
+        return fetched
+    
+    paper = await _single_flight.do(('paper', key), load)
+    _paper_cache.set(key, paper, ttl=None if paper else Config.NEGATIVE_CACHE_TTL)
+    return paper
+
+
+async def _cached_get_recommendations(paper_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    """带缓存的semantic_scholar_client.get_paper_recommendations，直接返回论文字典。"""
+    paper_id = canonical_paper_id(paper_id)
+    key = (paper_id, limit)
+    recommendations = _recommendation_cache.get(key)
+    if recommendations is None:
+        recommendations = await _single_flight.do(
+            ('recommendations',) + key,
+            lambda: get_semantic_scholar_client().get_paper_recommendations(paper_id, limit=limit, raw=True)
+        )
+        # 客户端失败时返回空列表，只短暂缓存
+        _recommendation_cache.set(
+            key, recommendations, ttl=None if recommendations else Config.NEGATIVE_CACHE_TTL
+        )
+    return list(recommendations)
+
+
+async def _get_citations(paper_id: str) -> List[SemanticScholarPaper]:
+    """获取引用论文，合并并发的重复请求。"""
+    paper_id = canonical_paper_id(paper_id)
+    return await _single_flight.do(
+        ('citations', paper_id),
+        lambda: get_semantic_scholar_client().get_paper_citations(paper_id)
+    )
+
+
+async def _get_references(paper_id: str) -> List[SemanticScholarPaper]:
+    """获取参考文献，合并并发的重复请求。"""
+    paper_id = canonical_paper_id(paper_id)
+    return await _single_flight.do(
+        ('references', paper_id),
+        lambda: get_semantic_scholar_client().get_paper_references(paper_id)
+    )
+
+
+async def _fetch_papers(paper_ids: List[str], debug: bool = Config.DEBUG_MODE) -> List[SemanticScholarPaper]:
+    """并发获取多篇论文，跳过未找到或请求失败的ID，保持输入顺序。
+    
+    单篇失败只记录日志；取消则通过TaskGroup传播并取消其余请求。
+    """
+    results: List[Optional[SemanticScholarPaper]] = [None] * len(paper_ids)
+    
+    async def fetch(index: int, paper_id: str) -> None:
+        try:
+            results[index] = await _cached_get_paper(paper_id)
+        except Exception as e:
+            debug_print(f"Failed to fetch paper {paper_id}: {str(e)}", debug)
+    
+    async with asyncio.TaskGroup() as tg:
+        for index, paper_id in enumerate(paper_ids):
+            tg.create_task(fetch(index, paper_id))
+    
+    return [paper for paper in results if paper]
+
+
+@catch_tool_errors("Error analyzing citations")
 async def analyze_paper_citations(
     paper_identifier: str,
     debug: bool = Config.DEBUG_MODE
@@ -29,49 +168,31 @@ async def analyze_paper_citations(
     """
     debug_print(f"Starting citation analysis for: {paper_identifier}", debug)
     
-    try:
-        # Extract ArXiv ID if it's a URL
-        clean_id = extract_arxiv_id(paper_identifier) or paper_identifier
-        
-        # Get comprehensive analysis from Semantic Scholar
-        analysis = await semantic_scholar_client.analyze_paper_citations(clean_id)
-        
-        if 'error' in analysis:
-            return analysis
-        
-        # Create result object
-        main_paper = SemanticScholarPaper.from_dict(analysis['main_paper'])
-        citing_papers = [SemanticScholarPaper.from_dict(p) for p in analysis['citing_papers']]
-        referenced_papers = [SemanticScholarPaper.from_dict(p) for p in analysis['referenced_papers']]
-        
-        result = CitationAnalysisResult(
-            main_paper=main_paper,
-            citing_papers=citing_papers,
-            referenced_papers=referenced_papers,
-            total_citations=analysis['citation_count'],
-            total_references=analysis['reference_count'],
-            analysis_timestamp=get_timestamp()
-        )
-        
-        debug_print(f"Analysis complete: {result.total_citations} citations, {result.total_references} references", debug)
-        
-        return {
-            'success': True,
-            'main_paper': result.main_paper.to_dict(),
-            'total_citations': result.total_citations,
-            'total_references': result.total_references,
-            'citing_papers': [p.to_dict() for p in result.citing_papers],
-            'referenced_papers': [p.to_dict() for p in result.referenced_papers],
-            'recommendations': analysis.get('recommendations', []),
-            'timestamp': result.analysis_timestamp
-        }
-        
-    except Exception as e:
-        error_msg = f"Error analyzing citations: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # Extract ArXiv ID if it's a URL
+    clean_id = canonical_paper_id(paper_identifier)
+    
+    # Get comprehensive analysis from Semantic Scholar
+    analysis = await get_semantic_scholar_client().analyze_paper_citations(clean_id)
+    
+    if 'error' in analysis:
+        return analysis
+    
+    # The client already returns plain dicts, so pass them through as-is
+    debug_print(f"Analysis complete: {analysis['citation_count']} citations, {analysis['reference_count']} references", debug)
+    
+    return {
+        'success': True,
+        'main_paper': analysis['main_paper'],
+        'total_citations': analysis['citation_count'],
+        'total_references': analysis['reference_count'],
+        'citing_papers': analysis['citing_papers'],
+        'referenced_papers': analysis['referenced_papers'],
+        'recommendations': analysis.get('recommendations', []),
+        'timestamp': get_timestamp()
+    }
 
 
+@catch_tool_errors("Error searching papers")
 async def search_papers_by_keywords(
     query: str,
     max_results: int = 20,
@@ -95,29 +216,25 @@ async def search_papers_by_keywords(
     """
     debug_print(f"Searching papers with query: {query}", debug)
     
-    try:
-        search_result = await semantic_scholar_client.search_papers(
-            query=query,
-            year=year,
-            venue=venue,
-            min_citation_count=min_citation_count,
-            limit=max_results
-        )
-        
-        return {
-            'success': True,
-            'total_found': search_result.total,
-            'returned_count': len(search_result.papers),
-            'papers': [paper.to_dict() for paper in search_result.papers],
-            'next_offset': search_result.next_offset
-        }
-        
-    except Exception as e:
-        error_msg = f"Error searching papers: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    search_result = await get_semantic_scholar_client().search_papers(
+        query=query,
+        year=year,
+        venue=venue,
+        min_citation_count=min_citation_count,
+        limit=max_results,
+        raw=True
+    )
+    
+    return {
+        'success': True,
+        'total_found': search_result.total,
+        'returned_count': len(search_result.papers),
+        'papers': search_result.papers,
+        'next_offset': search_result.next_offset
+    }
 
 
+@catch_tool_errors("Error searching papers by author")
 async def search_papers_by_author(
     author_name: str,
     max_results: int = 20,
@@ -135,34 +252,25 @@ async def search_papers_by_author(
     """
     debug_print(f"Searching papers by author: {author_name}", debug)
     
-    try:
-        # First search for the author
-        authors = await semantic_scholar_client.search_authors(author_name, limit=1)
-        
-        if not authors:
-            return {'success': False, 'error': f'Author "{author_name}" not found'}
-        
-        author = authors[0]
-        
-        # Get author's papers
-        papers = await semantic_scholar_client.get_author_papers(
-            author.author_id, 
-            limit=max_results
-        )
-        
-        return {
-            'success': True,
-            'author_info': author.to_dict(),
-            'paper_count': len(papers),
-            'papers': [paper.to_dict() for paper in papers]
-        }
-        
-    except Exception as e:
-        error_msg = f"Error searching papers by author: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # Search for the author and their papers in a single request
+    authors = await get_semantic_scholar_client().search_authors_with_papers(
+        author_name, limit=1, paper_limit=max_results
+    )
+    
+    if not authors:
+        return {'success': False, 'error': f'Author "{author_name}" not found'}
+    
+    author, papers = authors[0]
+    
+    return {
+        'success': True,
+        'author_info': author.to_dict(),
+        'paper_count': len(papers),
+        'papers': [paper.to_dict() for paper in papers]
+    }
 
 
+@catch_tool_errors("Error getting paper details")
 async def get_paper_details(
     paper_id: str,
     include_citations: bool = False,
@@ -184,41 +292,44 @@ async def get_paper_details(
     """
     debug_print(f"Getting paper details for: {paper_id}", debug)
     
-    try:
-        # Get main paper details
-        paper = await semantic_scholar_client.get_paper(paper_id)
-        
-        if not paper:
-            return {'success': False, 'error': f'Paper "{paper_id}" not found'}
-        
-        result = {
-            'success': True,
-            'paper': paper.to_dict()
-        }
-        
-        # Add optional data
-        if include_citations:
-            citations = await semantic_scholar_client.get_paper_citations(paper_id)
-            result['citations'] = [p.to_dict() for p in citations]
-            result['citation_count'] = len(citations)
-        
-        if include_references:
-            references = await semantic_scholar_client.get_paper_references(paper_id)
-            result['references'] = [p.to_dict() for p in references]
-            result['reference_count'] = len(references)
-        
-        if include_recommendations:
-            recommendations = await semantic_scholar_client.get_paper_recommendations(paper_id)
-            result['recommendations'] = [p.to_dict() for p in recommendations]
-        
-        return result
-        
-    except Exception as e:
-        error_msg = f"Error getting paper details: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # 主论文与可选数据相互独立，并发请求
+    fetches = {'paper': _cached_get_paper(paper_id)}
+    if include_citations:
+        fetches['citations'] = _get_citations(paper_id)
+    if include_references:
+        fetches['references'] = _get_references(paper_id)
+    if include_recommendations:
+        fetches['recommendations'] = _cached_get_recommendations(paper_id)
+    
+    results = dict(zip(fetches, await asyncio.gather(*fetches.values(), return_exceptions=True)))
+    
+    paper = results.pop('paper')
+    if isinstance(paper, BaseException):
+        raise paper
+    if not paper:
+        return {'success': False, 'error': f'Paper "{paper_id}" not found'}
+    
+    result = {
+        'success': True,
+        'paper': paper.to_dict()
+    }
+    
+    # Add optional data; a failed sub-fetch is reported without failing the whole call
+    for key, papers in results.items():
+        if isinstance(papers, BaseException):
+            debug_print(f"Failed to fetch {key} for {paper_id}: {str(papers)}", debug)
+            result[f'{key}_error'] = str(papers)
+            continue
+        
+        # Recommendations already arrive as dicts
+        result[key] = papers if key == 'recommendations' else [p.to_dict() for p in papers]
+        if key in _DETAIL_COUNT_KEYS:
+            result[_DETAIL_COUNT_KEYS[key]] = len(papers)
+    
+    return result
 
 
+@catch_tool_errors("Error getting ArXiv paper")
 async def get_arxiv_paper(
     arxiv_id: str,
     debug: bool = Config.DEBUG_MODE
@@ -234,27 +345,22 @@ async def get_arxiv_paper(
     """
     debug_print(f"Getting ArXiv paper: {arxiv_id}", debug)
     
-    try:
-        # Extract clean ArXiv ID
-        clean_id = extract_arxiv_id(arxiv_id) or arxiv_id
-        
-        # Get paper from ArXiv
-        paper = await arxiv_client.get_paper_by_id(clean_id)
-        
-        if not paper:
-            return {'success': False, 'error': f'ArXiv paper "{arxiv_id}" not found'}
-        
-        return {
-            'success': True,
-            'paper': paper.to_dict()
-        }
-        
-    except Exception as e:
-        error_msg = f"Error getting ArXiv paper: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # Extract clean ArXiv ID
+    clean_id = canonical_paper_id(arxiv_id)
+    
+    # Get paper from ArXiv
+    paper = await get_arxiv_client().get_paper_by_id(clean_id)
+    
+    if not paper:
+        return {'success': False, 'error': f'ArXiv paper "{arxiv_id}" not found'}
+    
+    return {
+        'success': True,
+        'paper': paper.to_dict()
+    }
 
 
+@catch_tool_errors("Error searching ArXiv")
 async def search_arxiv_papers(
     query: str,
     max_results: int = 10,
@@ -274,25 +380,20 @@ async def search_arxiv_papers(
     """
     debug_print(f"Searching ArXiv with query: {query}", debug)
     
-    try:
-        papers = await arxiv_client.search_papers(
-            query=query,
-            max_results=max_results,
-            sort_by=sort_by
-        )
-        
-        return {
-            'success': True,
-            'paper_count': len(papers),
-            'papers': [paper.to_dict() for paper in papers]
-        }
-        
-    except Exception as e:
-        error_msg = f"Error searching ArXiv: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    papers = await get_arxiv_client().search_papers(
+        query=query,
+        max_results=max_results,
+        sort_by=sort_by
+    )
+    
+    return {
+        'success': True,
+        'paper_count': len(papers),
+        'papers': [paper.to_dict() for paper in papers]
+    }
 
 
+@catch_tool_errors("Error saving paper")
 async def save_paper_to_markdown(
     paper_id: str,
     topic: str = "general",
@@ -312,28 +413,23 @@ async def save_paper_to_markdown(
     """
     debug_print(f"Saving paper to markdown: {paper_id}", debug)
     
-    try:
-        # Get paper details
-        paper = await semantic_scholar_client.get_paper(paper_id)
-        
-        if not paper:
-            return {'success': False, 'error': f'Paper "{paper_id}" not found'}
-        
-        # Save to markdown
-        filepath = paper_manager.save_paper_to_markdown(paper, topic, notes)
-        
-        return {
-            'success': True,
-            'filepath': filepath,
-            'paper_title': paper.title
-        }
-        
-    except Exception as e:
-        error_msg = f"Error saving paper: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # Get paper details
+    paper = await _cached_get_paper(paper_id)
+    
+    if not paper:
+        return {'success': False, 'error': f'Paper "{paper_id}" not found'}
+    
+    # Save to markdown
+    filepath = await asyncio.to_thread(get_paper_manager().save_paper_to_markdown, paper, topic, notes)
+    
+    return {
+        'success': True,
+        'filepath': filepath,
+        'paper_title': paper.title
+    }
 
 
+@catch_tool_errors("Error saving ArXiv paper")
 async def save_arxiv_paper_to_markdown(
     arxiv_id: str,
     topic: str = "general",
@@ -353,31 +449,26 @@ async def save_arxiv_paper_to_markdown(
     """
     debug_print(f"Saving ArXiv paper to markdown: {arxiv_id}", debug)
     
-    try:
-        # Extract clean ArXiv ID
-        clean_id = extract_arxiv_id(arxiv_id) or arxiv_id
-        
-        # Get paper from ArXiv
-        paper = await arxiv_client.get_paper_by_id(clean_id)
-        
-        if not paper:
-            return {'success': False, 'error': f'ArXiv paper "{arxiv_id}" not found'}
-        
-        # Save to markdown
-        filepath = paper_manager.save_arxiv_paper_to_markdown(paper, topic, notes)
-        
-        return {
-            'success': True,
-            'filepath': filepath,
-            'paper_title': paper.title
-        }
-        
-    except Exception as e:
-        error_msg = f"Error saving ArXiv paper: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # Extract clean ArXiv ID
+    clean_id = canonical_paper_id(arxiv_id)
+    
+    # Get paper from ArXiv
+    paper = await get_arxiv_client().get_paper_by_id(clean_id)
+    
+    if not paper:
+        return {'success': False, 'error': f'ArXiv paper "{arxiv_id}" not found'}
+    
+    # Save to markdown
+    filepath = await asyncio.to_thread(get_paper_manager().save_arxiv_paper_to_markdown, paper, topic, notes)
+    
+    return {
+        'success': True,
+        'filepath': filepath,
+        'paper_title': paper.title
+    }
 
 
+@catch_tool_errors("Error organizing papers")
 async def organize_papers_by_topic(
     debug: bool = Config.DEBUG_MODE
 ) -> Dict[str, Any]:
@@ -391,22 +482,19 @@ async def organize_papers_by_topic(
     """
     debug_print("Organizing papers by topic", debug)
     
-    try:
-        organized = paper_manager.organize_papers_by_topic()
-        stats = paper_manager.get_paper_statistics()
-        
-        return {
-            'success': True,
-            'organization': organized,
-            'statistics': stats
-        }
-        
-    except Exception as e:
-        error_msg = f"Error organizing papers: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # 统计信息直接由同一次目录遍历的结果得出，无需再次扫描
+    manager = get_paper_manager()
+    organized = await asyncio.to_thread(manager.organize_papers_by_topic)
+    stats = manager.get_paper_statistics(organized)
+    
+    return {
+        'success': True,
+        'organization': organized,
+        'statistics': stats
+    }
 
 
+@catch_tool_errors("Error generating literature review")
 async def generate_literature_review(
     topic: str,
     requirements: List[str],
@@ -426,24 +514,19 @@ async def generate_literature_review(
     """
     debug_print(f"Generating literature review for topic: {topic}", debug)
     
-    try:
-        filepath = paper_manager.generate_literature_review(
-            topic, requirements, output_filename
-        )
-        
-        return {
-            'success': True,
-            'filepath': filepath,
-            'topic': topic,
-            'requirements_count': len(requirements)
-        }
-        
-    except Exception as e:
-        error_msg = f"Error generating literature review: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    filepath = await asyncio.to_thread(
+        get_paper_manager().generate_literature_review, topic, requirements, output_filename
+    )
+    
+    return {
+        'success': True,
+        'filepath': filepath,
+        'topic': topic,
+        'requirements_count': len(requirements)
+    }
 
 
+@catch_tool_errors("Error creating requirement-based review")
 async def create_requirement_based_review(
     paper_ids: List[str],
     requirements: List[str],
@@ -463,35 +546,26 @@ async def create_requirement_based_review(
     """
     debug_print(f"Creating requirement-based review for {len(paper_ids)} papers", debug)
     
-    try:
-        # Get paper details
-        papers = []
-        for paper_id in paper_ids:
-            paper = await semantic_scholar_client.get_paper(paper_id)
-            if paper:
-                papers.append(paper)
-        
-        if not papers:
-            return {'success': False, 'error': 'No valid papers found'}
-        
-        # Create review
-        filepath = paper_manager.create_requirement_based_review(
-            papers, requirements, output_filename
-        )
-        
-        return {
-            'success': True,
-            'filepath': filepath,
-            'papers_analyzed': len(papers),
-            'requirements_count': len(requirements)
-        }
-        
-    except Exception as e:
-        error_msg = f"Error creating requirement-based review: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    # Get paper details
+    papers = await _fetch_papers(paper_ids, debug)
+    
+    if not papers:
+        return {'success': False, 'error': 'No valid papers found'}
+    
+    # Create review
+    filepath = await asyncio.to_thread(
+        get_paper_manager().create_requirement_based_review, papers, requirements, output_filename
+    )
+    
+    return {
+        'success': True,
+        'filepath': filepath,
+        'papers_analyzed': len(papers),
+        'requirements_count': len(requirements)
+    }
 
 
+@catch_tool_errors("Error searching local collection")
 async def search_papers_in_collection(
     keyword: str,
     debug: bool = Config.DEBUG_MODE
@@ -507,22 +581,17 @@ async def search_papers_in_collection(
     """
     debug_print(f"Searching local collection for keyword: {keyword}", debug)
     
-    try:
-        matching_papers = paper_manager.search_papers_by_keyword(keyword)
-        
-        return {
-            'success': True,
-            'keyword': keyword,
-            'matches_found': len(matching_papers),
-            'papers': matching_papers
-        }
-        
-    except Exception as e:
-        error_msg = f"Error searching local collection: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
+    matching_papers = await asyncio.to_thread(get_paper_manager().search_papers_by_keyword, keyword)
+    
+    return {
+        'success': True,
+        'keyword': keyword,
+        'matches_found': len(matching_papers),
+        'papers': matching_papers
+    }
 
 
+@catch_tool_errors("Error getting recommendations")
 async def get_paper_recommendations(
     paper_id: str,
     max_results: int = 10,
@@ -540,19 +609,11 @@ async def get_paper_recommendations(
     """
     debug_print(f"Getting recommendations for paper: {paper_id}", debug)
     
-    try:
-        recommendations = await semantic_scholar_client.get_paper_recommendations(
-            paper_id, limit=max_results
-        )
-        
-        return {
-            'success': True,
-            'paper_id': paper_id,
-            'recommendation_count': len(recommendations),
-            'recommendations': [paper.to_dict() for paper in recommendations]
-        }
-        
-    except Exception as e:
-        error_msg = f"Error getting recommendations: {str(e)}"
-        debug_print(error_msg, debug)
-        return {'success': False, 'error': error_msg}
\ No newline at end of file
+    recommendations = await _cached_get_recommendations(paper_id, limit=max_results)
+    
+    return {
+        'success': True,
+        'paper_id': paper_id,
+        'recommendation_count': len(recommendations),
+        'recommendations': recommendations
+    }
\ No newline at end of file
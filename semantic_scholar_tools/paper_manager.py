@@ -1,12 +1,79 @@
 """Paper management functionality for organizing and saving papers."""
 
+import asyncio
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional, Sequence, Set, Tuple, Union
 from models import ArxivPaper, SemanticScholarPaper
 from config import Config
-from utils import debug_print, sanitize_filename, format_authors, save_json_to_file
+from utils import debug_print, get_timestamp, sanitize_filename, format_authors, save_json_to_file
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Header and technology lookups for literature review summaries
+_REVIEW_TECH_KEYWORDS = ('learning', 'neural', 'deep', 'machine', 'AI', 'algorithm', 'model')
+_REVIEW_TECH_RE = re.compile('|'.join(tech.lower() for tech in _REVIEW_TECH_KEYWORDS))
+_REVIEW_ARXIV_LINE_RE = re.compile(r'^.*(?:arxiv\.org/abs/|\*\*ArXiv\*\*:).*$', re.M)
+
+# A directory modified this recently may still change within the same mtime tick
+_RACY_LISTING_NS = 1_000_000_000
+
+
+@dataclass(slots=True)
+class _ReviewPaper:
+    """What the literature review shows for a saved paper."""
+    filename: str
+    title: str
+    arxiv_link: str
+    technologies: str
+    requirements: Set[int]
+
+
+def _requirement_matcher(requirements: List[str]) -> Callable[[str], Set[int]]:
+    """Build a function mapping a lowercased text to the indices of the requirements it matches.
+    
+    A requirement matches when any of its lowercased words occurs in the text.
+    With pyahocorasick installed every text is scanned once for all keywords.
+    """
+    keyword_requirements: Dict[str, Set[int]] = {}
+    for index, requirement in enumerate(requirements):
+        for keyword in requirement.lower().split():
+            keyword_requirements.setdefault(keyword, set()).add(index)
+    
+    if not keyword_requirements:
+        return lambda text: set()
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keyword_requirements:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        
+        def match(text: str) -> Set[int]:
+            matched: Set[int] = set()
+            for _, keyword in automaton.iter(text):
+                matched |= keyword_requirements[keyword]
+            return matched
+    else:
+        def match(text: str) -> Set[int]:
+            matched: Set[int] = set()
+            for keyword, indices in keyword_requirements.items():
+                if not indices <= matched and keyword in text:
+                    matched |= indices
+            return matched
+    
+    return match
 
 
 class PaperManager:
@@ -17,6 +84,17 @@ class PaperManager:
         self.papers_dir = Config.PAPERS_DIR
         self.md_files_dir = Config.MD_FILES_DIR
         
+        # Keyword search index over the markdown files, refreshed by mtime and size
+        self._search_lock = threading.Lock()
+        self._indexed_files: Dict[Path, Tuple[Tuple[int, int], str, frozenset]] = {}
+        self._postings: Dict[str, Set[Path]] = {}
+        # Literature review fields per file, kept in step with the search index:
+        # (signature, title, arxiv_link, technologies)
+        self._review_fields_cache: Dict[Path, Tuple[Tuple[int, int], str, str, str]] = {}
+        
+        # Directory listings keyed by directory: (mtime_ns, entries)
+        self._dir_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+        
         # Ensure directories exist
         self._ensure_directory_structure()
     
@@ -47,8 +125,9 @@ class PaperManager:
         content = self._generate_paper_markdown(paper, notes)
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_bytes(content.encode('utf-8'))
+        self._index_saved_file(filepath, content)
+        self._invalidate_listing(topic_dir)
         
         debug_print(f"Paper saved to: {filepath}", self.debug)
         return str(filepath)
@@ -74,27 +153,39 @@ class PaperManager:
         content = self._generate_arxiv_paper_markdown(paper, notes)
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_bytes(content.encode('utf-8'))
+        self._index_saved_file(filepath, content)
+        self._invalidate_listing(topic_dir)
         
         debug_print(f"ArXiv paper saved to: {filepath}", self.debug)
         return str(filepath)
     
+    async def save_papers_to_markdown(
+        self, 
+        papers: Sequence[Union[SemanticScholarPaper, ArxivPaper]], 
+        topic: str = "general", 
+        notes: str = ""
+    ) -> List[str]:
+        """Save several papers concurrently, each write running in a worker thread.
+        
+        Returns the file paths in the same order as ``papers``.
+        """
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(
+                self.save_arxiv_paper_to_markdown if isinstance(paper, ArxivPaper) else self.save_paper_to_markdown,
+                paper, topic, notes
+            )
+            for paper in papers
+        )))
+    
     def organize_papers_by_topic(self) -> Dict[str, List[str]]:
         """List all papers organized by topic."""
         debug_print("Organizing papers by topic", self.debug)
         
         organized_papers = {}
         
-        for topic_dir in self.md_files_dir.iterdir():
-            if topic_dir.is_dir():
-                topic_name = topic_dir.name
-                papers = []
-                
-                for paper_file in topic_dir.glob('*.md'):
-                    papers.append(paper_file.name)
-                
-                organized_papers[topic_name] = papers
+        for topic_name, paper_files in self._scan_tree():
+            organized_papers[topic_name] = [paper_file.name for paper_file in paper_files]
         
         return organized_papers
     
@@ -113,21 +204,26 @@ class PaperManager:
             topic_dir.mkdir(parents=True, exist_ok=True)
             return f"Topic directory '{topic}' was created but contains no papers yet."
         
-        # Read all papers in the topic
-        papers_content = []
-        for paper_file in topic_dir.glob('*.md'):
-            with open(paper_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                papers_content.append({
-                    'filename': paper_file.name,
-                    'content': content
-                })
-        
-        if not papers_content:
+        # Summarize the papers in the topic, re-reading only files that changed
+        match = _requirement_matcher(requirements)
+        papers = []
+        with self._search_lock:
+            for paper_file in self._list_md_files(topic_dir):
+                title, arxiv_link, technologies, lowered = self._review_fields(paper_file)
+                papers.append(_ReviewPaper(
+                    filename=paper_file.name,
+                    title=title,
+                    arxiv_link=arxiv_link,
+                    technologies=technologies,
+                    # This is a simple keyword-based matching - could be enhanced with NLP
+                    requirements=match(lowered)
+                ))
+        
+        if not papers:
             return f"No papers found in topic '{topic}'."
         
         # Generate review content
-        review_content = self._generate_review_markdown(topic, requirements, papers_content)
+        review_content = self._generate_review_markdown(topic, requirements, papers)
         
         # Save review
         if output_filename is None:
@@ -135,8 +231,7 @@ class PaperManager:
             output_filename = f"literature_review_{topic}_{timestamp}.md"
         
         review_filepath = self.md_files_dir / output_filename
-        with open(review_filepath, 'w', encoding='utf-8') as f:
-            f.write(review_content)
+        review_filepath.write_bytes(review_content.encode('utf-8'))
         
         debug_print(f"Literature review saved to: {review_filepath}", self.debug)
         return str(review_filepath)
@@ -145,27 +240,150 @@ class PaperManager:
         """Search for papers containing a specific keyword."""
         debug_print(f"Searching papers by keyword: {keyword}", self.debug)
         
+        keyword = keyword.lower()
         matching_papers = []
         
-        for topic_dir in self.md_files_dir.iterdir():
-            if topic_dir.is_dir():
-                for paper_file in topic_dir.glob('*.md'):
-                    try:
-                        with open(paper_file, 'r', encoding='utf-8') as f:
-                            content = f.read().lower()
-                            if keyword.lower() in content:
-                                matching_papers.append({
-                                    'topic': topic_dir.name,
-                                    'filename': paper_file.name,
-                                    'filepath': str(paper_file)
-                                })
-                    except Exception as e:
-                        debug_print(f"Error reading file {paper_file}: {str(e)}", self.debug)
+        with self._search_lock:
+            paper_files = self._refresh_search_index()
+            candidates = self._keyword_candidates(keyword)
+            
+            for topic, paper_file in paper_files:
+                if candidates is not None and paper_file not in candidates:
+                    continue
+                entry = self._indexed_files.get(paper_file)
+                if entry is not None and keyword in entry[1]:
+                    matching_papers.append({
+                        'topic': topic,
+                        'filename': paper_file.name,
+                        'filepath': str(paper_file)
+                    })
         
         return matching_papers
     
-    def get_paper_statistics(self) -> Dict[str, Any]:
-        """Get statistics about saved papers."""
+    def _refresh_search_index(self) -> List[Tuple[str, Path]]:
+        """Re-read markdown files that changed since they were indexed.
+        
+        Returns every (topic, file) pair in directory listing order.
+        """
+        paper_files = []
+        changed = []
+        
+        for topic_name, topic_files in self._scan_tree():
+            for paper_file in topic_files:
+                paper_files.append((topic_name, paper_file))
+                try:
+                    stat = paper_file.stat()
+                except Exception as e:
+                    debug_print(f"Error reading file {paper_file}: {str(e)}", self.debug)
+                    continue
+                
+                signature = (stat.st_mtime_ns, stat.st_size)
+                entry = self._indexed_files.get(paper_file)
+                if entry is None or entry[0] != signature:
+                    self._unindex(paper_file)
+                    changed.append((paper_file, signature))
+        
+        # Read changed files concurrently so their disk latency overlaps
+        if len(changed) > 1:
+            workers = min(Config.SEARCH_INDEX_READ_WORKERS, len(changed))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                contents = list(executor.map(self._read_for_index, [path for path, _ in changed]))
+        else:
+            contents = [self._read_for_index(path) for path, _ in changed]
+        
+        for (paper_file, signature), content in zip(changed, contents):
+            if content is not None:
+                self._index_content(paper_file, signature, content)
+        
+        # Forget files that were deleted or moved
+        current = {paper_file for _, paper_file in paper_files}
+        for stale in [path for path in self._indexed_files if path not in current]:
+            self._unindex(stale)
+        
+        return paper_files
+    
+    def _read_for_index(self, paper_file: Path) -> Optional[str]:
+        """Read a markdown file's lowercased content, or None if it cannot be read."""
+        try:
+            with open(paper_file, 'r', encoding='utf-8') as f:
+                return f.read().lower()
+        except Exception as e:
+            debug_print(f"Error reading file {paper_file}: {str(e)}", self.debug)
+            return None
+    
+    def _index_content(self, paper_file: Path, signature: Tuple[int, int], content: str) -> None:
+        """Add a file's lowercased content to the search index."""
+        tokens = frozenset(_TOKEN_RE.findall(content))
+        self._indexed_files[paper_file] = (signature, content, tokens)
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(paper_file)
+    
+    def _index_saved_file(self, paper_file: Path, content: str) -> None:
+        """Index a file that was just written, so the next search need not re-read it."""
+        try:
+            stat = paper_file.stat()
+        except OSError:
+            return
+        with self._search_lock:
+            self._unindex(paper_file)
+            self._index_content(paper_file, (stat.st_mtime_ns, stat.st_size), content.lower())
+    
+    def _unindex(self, paper_file: Path) -> None:
+        """Remove a file from the search index."""
+        self._review_fields_cache.pop(paper_file, None)
+        entry = self._indexed_files.pop(paper_file, None)
+        if entry is None:
+            return
+        for token in entry[2]:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(paper_file)
+                if not postings:
+                    del self._postings[token]
+    
+    def _keyword_candidates(self, keyword: str) -> Optional[Set[Path]]:
+        """Narrow a substring search down to the files that can match, using the index.
+        
+        Inner words of the keyword must appear as whole words in a match. The
+        first and last words may be cut off mid-word, so any indexed word that
+        ends or starts with them qualifies. Returns None if the keyword has no
+        words to look up.
+        """
+        words = _TOKEN_RE.findall(keyword)
+        if not words:
+            return None
+        
+        last = len(words) - 1
+        candidates: Optional[Set[Path]] = None
+        # Exact lookups for inner words first: they are cheap and most selective
+        for i in sorted(range(len(words)), key=lambda i: i in (0, last)):
+            word = words[i]
+            if 0 < i < last:
+                matching = self._postings.get(word, set())
+            else:
+                if last == 0:
+                    qualifies = lambda token: word in token
+                elif i == 0:
+                    qualifies = lambda token: token.endswith(word)
+                else:
+                    qualifies = lambda token: token.startswith(word)
+                matching = set()
+                for token, paths in self._postings.items():
+                    if qualifies(token):
+                        matching |= paths
+            
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                break
+        
+        return candidates
+    
+    def get_paper_statistics(self, organized: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """Get statistics about saved papers.
+        
+        Pass the result of organize_papers_by_topic() as ``organized`` to
+        reuse its directory walk instead of scanning again.
+        """
         debug_print("Calculating paper statistics", self.debug)
         
         stats = {
@@ -174,22 +392,73 @@ class PaperManager:
             'topics': []
         }
         
-        for topic_dir in self.md_files_dir.iterdir():
-            if topic_dir.is_dir():
-                topic_name = topic_dir.name
-                paper_count = len(list(topic_dir.glob('*.md')))
-                
-                stats['papers_by_topic'][topic_name] = paper_count
-                stats['total_papers'] += paper_count
-                stats['topics'].append(topic_name)
+        if organized is None:
+            topics = [(topic_name, len(paper_files)) for topic_name, paper_files in self._scan_tree()]
+        else:
+            topics = [(topic_name, len(papers)) for topic_name, papers in organized.items()]
+        
+        for topic_name, paper_count in topics:
+            stats['papers_by_topic'][topic_name] = paper_count
+            stats['total_papers'] += paper_count
+            stats['topics'].append(topic_name)
         
         return stats
     
+    def _scan_tree(self) -> List[Tuple[str, List[Path]]]:
+        """Walk md_files_dir once, returning (topic, markdown files) per topic directory."""
+        return [(topic_dir.name, self._list_md_files(topic_dir)) for topic_dir in self._list_topic_dirs()]
+    
+    def _list_topic_dirs(self) -> List[Path]:
+        """List the topic directories under md_files_dir, cached by directory mtime."""
+        def list_entries() -> List[Path]:
+            # DirEntry.is_dir() answers from the directory listing without a stat per entry
+            with os.scandir(self.md_files_dir) as entries:
+                return [self.md_files_dir / entry.name for entry in entries if entry.is_dir()]
+        
+        return self._cached_listing(self.md_files_dir, list_entries)
+    
+    def _list_md_files(self, topic_dir: Path) -> List[Path]:
+        """List the markdown files in a topic directory, cached by directory mtime."""
+        def list_entries() -> List[Path]:
+            with os.scandir(topic_dir) as entries:
+                return [
+                    topic_dir / entry.name for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()
+                ]
+        
+        try:
+            return self._cached_listing(topic_dir, list_entries)
+        except OSError:
+            return []
+    
+    def _cached_listing(self, directory: Path, list_entries) -> List[Path]:
+        """Return a directory listing, re-running list_entries only when the directory changed.
+        
+        Listings of directories modified within the last second are not reused,
+        since a further change may land in the same mtime tick.
+        """
+        mtime_ns = directory.stat().st_mtime_ns
+        cached = self._dir_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        entries = list_entries()
+        if time.time_ns() - mtime_ns > _RACY_LISTING_NS:
+            self._dir_cache[directory] = (mtime_ns, entries)
+        else:
+            self._dir_cache.pop(directory, None)
+        return entries
+    
+    def _invalidate_listing(self, topic_dir: Path) -> None:
+        """Drop cached listings after a file was written into topic_dir."""
+        self._dir_cache.pop(topic_dir, None)
+        self._dir_cache.pop(self.md_files_dir, None)
+    
     def _generate_paper_markdown(self, paper: SemanticScholarPaper, notes: str = "") -> str:
         """Generate markdown content for a Semantic Scholar paper."""
         authors_str = format_authors(paper.authors)
         
-        content = f"""# {paper.title}
+        parts = [f"""# {paper.title}
 
 ## Metadata
 - **Paper ID**: {paper.paper_id}
@@ -201,44 +470,44 @@ class PaperManager:
 - **Influential Citations**: {paper.influential_citation_count}
 
 ## Links
-"""
+"""]
         
         if paper.url:
-            content += f"- **Paper URL**: {paper.url}\n"
+            parts.append(f"- **Paper URL**: {paper.url}\n")
         
         if paper.arxiv_id:
-            content += f"- **ArXiv**: https://arxiv.org/abs/{paper.arxiv_id}\n"
+            parts.append(f"- **ArXiv**: https://arxiv.org/abs/{paper.arxiv_id}\n")
         
         if paper.doi:
-            content += f"- **DOI**: https://doi.org/{paper.doi}\n"
+            parts.append(f"- **DOI**: https://doi.org/{paper.doi}\n")
         
-        content += "\n## Abstract\n\n"
+        parts.append("\n## Abstract\n\n")
         
         if paper.abstract:
-            content += paper.abstract
+            parts.append(paper.abstract)
         else:
-            content += "No abstract available."
+            parts.append("No abstract available.")
         
         if paper.tldr and paper.tldr.get('text'):
-            content += f"\n\n## TL;DR\n\n{paper.tldr['text']}"
+            parts.append(f"\n\n## TL;DR\n\n{paper.tldr['text']}")
         
         if notes:
-            content += f"\n\n## Notes\n\n{notes}"
+            parts.append(f"\n\n## Notes\n\n{notes}")
         
-        content += f"\n\n## External IDs\n\n"
+        parts.append(f"\n\n## External IDs\n\n")
         if paper.external_ids:
             for key, value in paper.external_ids.items():
-                content += f"- **{key}**: {value}\n"
+                parts.append(f"- **{key}**: {value}\n")
         
-        content += f"\n\n---\n*Saved on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        parts.append(f"\n\n---\n*Saved on {get_timestamp()}*\n")
         
-        return content
+        return ''.join(parts)
     
     def _generate_arxiv_paper_markdown(self, paper: ArxivPaper, notes: str = "") -> str:
         """Generate markdown content for an ArXiv paper."""
         authors_str = ", ".join(paper.authors) if paper.authors else "Unknown"
         
-        content = f"""# {paper.title}
+        parts = [f"""# {paper.title}
 
 ## Metadata
 - **ArXiv ID**: {paper.arxiv_id}
@@ -253,104 +522,128 @@ class PaperManager:
 ## Abstract
 
 {paper.abstract if paper.abstract else 'No abstract available.'}
-"""
+"""]
         
         if notes:
-            content += f"\n\n## Notes\n\n{notes}"
+            parts.append(f"\n\n## Notes\n\n{notes}")
         
-        content += f"\n\n---\n*Saved on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        parts.append(f"\n\n---\n*Saved on {get_timestamp()}*\n")
         
-        return content
+        return ''.join(parts)
     
     def _generate_review_markdown(
         self, 
         topic: str, 
         requirements: List[str], 
-        papers_content: List[Dict[str, str]]
+        papers: List[_ReviewPaper]
     ) -> str:
-        """Generate literature review markdown content."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        """Generate literature review markdown content from _ReviewPaper entries built by _review_fields."""
+        timestamp = get_timestamp()
         
-        content = f"""# Literature Review: {topic.title()}
+        parts = [f"""# Literature Review: {topic.title()}
 
 *Generated on {timestamp}*
 
 ## Overview
 
-This literature review covers {len(papers_content)} papers in the {topic} domain, organized according to the following requirements:
+This literature review covers {len(papers)} papers in the {topic} domain, organized according to the following requirements:
 
-"""
+"""]
         
         for i, req in enumerate(requirements, 1):
-            content += f"{i}. {req}\n"
+            parts.append(f"{i}. {req}\n")
         
-        content += "\n## Papers by Requirements\n\n"
+        parts.append("\n## Papers by Requirements\n\n")
         
         # Organize papers by requirements
         for i, requirement in enumerate(requirements, 1):
-            content += f"### Requirement {i}: {requirement}\n\n"
+            parts.append(f"### Requirement {i}: {requirement}\n\n")
             
-            # Find papers that might match this requirement
-            # This is a simple keyword-based matching - could be enhanced with NLP
-            req_keywords = requirement.lower().split()
-            matching_papers = []
-            
-            for paper in papers_content:
-                paper_text = paper['content'].lower()
-                if any(keyword in paper_text for keyword in req_keywords):
-                    matching_papers.append(paper)
+            matching_papers = [paper for paper in papers if i - 1 in paper.requirements]
             
             if matching_papers:
                 for paper in matching_papers:
-                    # Extract title from markdown content
-                    lines = paper['content'].split('\n')
-                    title = lines[0].replace('# ', '') if lines else paper['filename']
-                    
-                    # Extract ArXiv link if available
-                    arxiv_link = "Unknown"
-                    for line in lines:
-                        if 'arxiv.org/abs/' in line:
-                            arxiv_link = line.split('](')[0].split('[')[-1] if '](' in line else line.strip()
-                            break
-                        elif '**ArXiv**:' in line:
-                            arxiv_link = line.split('**ArXiv**: ')[-1].strip()
-                            break
-                    
                     # Extract key features (this could be enhanced)
                     key_features = "Advanced research in the field"
                     
-                    # Extract technologies (simple keyword extraction)
-                    tech_keywords = ['learning', 'neural', 'deep', 'machine', 'AI', 'algorithm', 'model']
-                    found_tech = []
-                    for line in lines:
-                        for tech in tech_keywords:
-                            if tech.lower() in line.lower() and tech not in found_tech:
-                                found_tech.append(tech.title())
-                    
-                    technologies = ', '.join(found_tech[:3]) if found_tech else "Machine Learning"
-                    
-                    content += f"""#### {title}
-- ArXiv链接: `{arxiv_link}`
+                    parts.append(f"""#### {paper.title}
+- ArXiv链接: `{paper.arxiv_link}`
 - 关键特点: {key_features}
-- 相关技术: {technologies}
+- 相关技术: {paper.technologies}
 
-"""
+""")
             else:
-                content += "No papers found matching this requirement.\n\n"
+                parts.append("No papers found matching this requirement.\n\n")
         
         # Add summary section
-        content += "## Summary\n\n"
-        content += f"This review analyzed {len(papers_content)} papers across {len(requirements)} requirements. "
-        content += "The papers demonstrate significant advances in the field and provide valuable insights for future research.\n\n"
+        parts.append("## Summary\n\n")
+        parts.append(f"This review analyzed {len(papers)} papers across {len(requirements)} requirements. ")
+        parts.append("The papers demonstrate significant advances in the field and provide valuable insights for future research.\n\n")
         
         # Add all papers list
-        content += "## All Papers Reviewed\n\n"
-        for paper in papers_content:
-            lines = paper['content'].split('\n')
-            title = lines[0].replace('# ', '') if lines else paper['filename']
-            content += f"- {title}\n"
+        parts.append("## All Papers Reviewed\n\n")
+        for paper in papers:
+            parts.append(f"- {paper.title}\n")
         
-        return content
+        return ''.join(parts)
+    
+    def _review_fields(self, paper_file: Path) -> Tuple[str, str, str, str]:
+        """Return (title, arxiv_link, technologies, lowercased content) for a saved paper.
+        
+        The file is only read if it changed since it was last indexed; the
+        lowercased content is shared with the keyword search index. Callers
+        must hold _search_lock.
+        """
+        stat = paper_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._review_fields_cache.get(paper_file)
+        entry = self._indexed_files.get(paper_file)
+        if cached is not None and cached[0] == signature and entry is not None and entry[0] == signature:
+            return cached[1], cached[2], cached[3], entry[1]
+        
+        with open(paper_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        lowered = content.lower()
+        self._unindex(paper_file)
+        self._index_content(paper_file, signature, lowered)
+        
+        title, arxiv_link, technologies = self._extract_review_fields(content, lowered)
+        self._review_fields_cache[paper_file] = (signature, title, arxiv_link, technologies)
+        return title, arxiv_link, technologies, lowered
+    
+    @staticmethod
+    def _extract_review_fields(content: str, lowered: str) -> Tuple[str, str, str]:
+        """Extract the title, ArXiv link and technologies the literature review shows for a paper."""
+        # Extract title from markdown content
+        title = content.partition('\n')[0].replace('# ', '')
+        
+        # Extract ArXiv link if available
+        arxiv_link = "Unknown"
+        arxiv_match = _REVIEW_ARXIV_LINE_RE.search(content)
+        if arxiv_match:
+            line = arxiv_match.group()
+            if 'arxiv.org/abs/' in line:
+                arxiv_link = line.split('](')[0].split('[')[-1] if '](' in line else line.strip()
+            else:
+                arxiv_link = line.split('**ArXiv**: ')[-1].strip()
+        
+        # Extract technologies (simple keyword extraction), line by line until three are found
+        found_tech = []
+        pos = 0
+        while len(found_tech) < 3:
+            tech_match = _REVIEW_TECH_RE.search(lowered, pos)
+            if not tech_match:
+                break
+            start = lowered.rfind('\n', 0, tech_match.start()) + 1
+            end = lowered.find('\n', tech_match.end())
+            if end == -1:
+                end = len(lowered)
+            line = lowered[start:end]
+            found_tech.extend(tech.title() for tech in _REVIEW_TECH_KEYWORDS if tech.lower() in line)
+            pos = end + 1
+        
+        technologies = ', '.join(found_tech[:3]) if found_tech else "Machine Learning"
+        return title, arxiv_link, technologies
     
     def create_requirement_based_review(
         self,
@@ -361,13 +654,14 @@ This literature review covers {len(papers_content)} papers in the {topic} domain
         """Create a requirement-based literature review from a list of papers."""
         debug_print(f"Creating requirement-based review for {len(papers)} papers", self.debug)
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
         
         if output_filename is None:
-            timestamp_file = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp_file = now.strftime("%Y%m%d_%H%M%S")
             output_filename = f"requirement_review_{timestamp_file}.md"
         
-        content = f"""# Literature Review
+        parts = [f"""# Literature Review
 
 *Generated on {timestamp}*
 
@@ -375,20 +669,19 @@ This literature review covers {len(papers_content)} papers in the {topic} domain
 
 This review analyzes {len(papers)} papers according to the specified requirements.
 
-"""
+"""]
+        
+        # Simple keyword matching - could be enhanced
+        match = _requirement_matcher(requirements)
+        paper_matches = [match(f"{paper.title} {paper.abstract or ''}".lower()) for paper in papers]
         
         # Organize papers by requirements
         for i, requirement in enumerate(requirements, 1):
-            content += f"## 需求{i}-相关\n\n"
-            
-            # Simple keyword matching - could be enhanced
-            req_keywords = requirement.lower().split()
-            matching_papers = []
+            parts.append(f"## 需求{i}-相关\n\n")
             
-            for paper in papers:
-                paper_text = f"{paper.title} {paper.abstract or ''}".lower()
-                if any(keyword in paper_text for keyword in req_keywords):
-                    matching_papers.append(paper)
+            matching_papers = [
+                paper for paper, matched in zip(papers, paper_matches) if i - 1 in matched
+            ]
             
             for paper in matching_papers:
                 arxiv_link = f"https://arxiv.org/abs/{paper.arxiv_id}" if paper.arxiv_id else paper.url or "Unknown"
@@ -404,45 +697,36 @@ This review analyzes {len(papers)} papers according to the specified requirement
                     if 'nlp' in paper.abstract.lower() or 'language' in paper.abstract.lower():
                         technologies = "NLP, " + technologies
                 
-                content += f"""### {paper.title}
+                parts.append(f"""### {paper.title}
 - ArXiv链接: `{arxiv_link}`
 - 关键特点: {key_features}
 - 相关技术: {technologies}
 
-"""
+""")
         
         # Add intersection section if multiple requirements
         if len(requirements) > 1:
-            content += f"## 需求1 & 需求2 都相关的论文\n\n"
+            parts.append(f"## 需求1 & 需求2 都相关的论文\n\n")
             # Find papers that match multiple requirements
-            multi_match_papers = []
-            for paper in papers:
-                paper_text = f"{paper.title} {paper.abstract or ''}".lower()
-                match_count = 0
-                for requirement in requirements:
-                    req_keywords = requirement.lower().split()
-                    if any(keyword in paper_text for keyword in req_keywords):
-                        match_count += 1
-                
-                if match_count >= 2:
-                    multi_match_papers.append(paper)
+            multi_match_papers = [
+                paper for paper, matched in zip(papers, paper_matches) if len(matched) >= 2
+            ]
             
             for paper in multi_match_papers:
                 arxiv_link = f"https://arxiv.org/abs/{paper.arxiv_id}" if paper.arxiv_id else paper.url or "Unknown"
                 key_features = paper.abstract[:100] + "..." if paper.abstract else "Comprehensive research approach"
                 technologies = "Multi-domain Machine Learning"
                 
-                content += f"""### {paper.title}
+                parts.append(f"""### {paper.title}
 - ArXiv链接: `{arxiv_link}`
 - 关键特点: {key_features}
 - 相关技术: {technologies}
 
-"""
+""")
         
         # Save the review
         review_filepath = self.md_files_dir / output_filename
-        with open(review_filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        review_filepath.write_bytes(''.join(parts).encode('utf-8'))
         
         debug_print(f"Requirement-based review saved to: {review_filepath}", self.debug)
         return str(review_filepath)
\ No newline at end of file
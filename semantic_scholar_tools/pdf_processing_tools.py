@@ -1,12 +1,25 @@
 """PDF处理工具模块 - 包含所有PDF下载、文本提取和转换功能"""
 
+import asyncio
+import functools
+import multiprocessing
 import os
-import urllib.request
-import urllib.parse
+import re
+import shutil
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import aiohttp
+
+# PDF处理相关导入：优先使用基于MuPDF的PyMuPDF，文本提取远快于pypdf
+try:
+    import fitz  # type: ignore
+except ImportError:
+    fitz = None
 
-# PDF处理相关导入
 try:
     from pypdf import PdfReader  # type: ignore
     PDF_READER_AVAILABLE = True
@@ -15,13 +28,254 @@ except ImportError:
         from PyPDF2 import PdfReader  # type: ignore
         PDF_READER_AVAILABLE = True
     except ImportError:
-        print("Warning: PDF processing unavailable. Install pypdf: pip install pypdf")
         PdfReader = None  # type: ignore
-        PDF_READER_AVAILABLE = False
+        PDF_READER_AVAILABLE = fitz is not None
+        if not PDF_READER_AVAILABLE:
+            print("Warning: PDF processing unavailable. Install pypdf: pip install pypdf")
 
 from config import Config
 from utils import debug_print, extract_arxiv_id
 
+# poppler的pdftotext（C++实现，单遍解析）可用时，整本转换直接调用它
+_PDFTOTEXT = shutil.which("pdftotext")
+
+_ARXIV_URL_RE = re.compile(r'^http.*arxiv\.org/(?:abs/(.*)|pdf/(.*?)(?:\.pdf)?)$')
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 下载复用同一个会话（连接池与TLS连接），会话与创建它的事件循环绑定，每个循环各一个
+_DOWNLOAD_SESSIONS = weakref.WeakKeyDictionary()
+
+
+def _get_download_session() -> aiohttp.ClientSession:
+    """Return the PDF download session for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    session = _DOWNLOAD_SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = _DOWNLOAD_SESSIONS[loop] = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60),
+            headers=_DOWNLOAD_HEADERS,
+            connector=aiohttp.TCPConnector(limit_per_host=Config.ARXIV_MAX_CONCURRENCY, ttl_dns_cache=300)
+        )
+    return session
+
+
+async def close_download_session() -> None:
+    """Close the PDF download session of the running event loop."""
+    session = _DOWNLOAD_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _preallocate(f, size: int) -> None:
+    """Reserve disk space for a download of known size so the file is laid out contiguously."""
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        # 文件系统不支持预分配时直接顺序写入
+        pass
+
+
+def _open_pdf(pdf_path: str):
+    """Open a PDF with PyMuPDF when installed, otherwise with pypdf."""
+    return fitz.open(pdf_path) if fitz is not None else PdfReader(pdf_path)
+
+
+def _close_pdf(document) -> None:
+    """Release a document opened by _open_pdf (pypdf readers need no cleanup)."""
+    if fitz is not None:
+        document.close()
+
+
+def _read_page_texts(document, indices: range) -> List[Tuple[int, str]]:
+    """Extract (1-based page number, text) pairs, loading only the requested pages."""
+    if fitz is not None:
+        return [(i + 1, document.load_page(i).get_text("text")) for i in indices]
+    return [(i + 1, document.pages[i].extract_text()) for i in indices]
+
+
+@functools.lru_cache(maxsize=Config.PDF_DOCUMENT_CACHE_SIZE)
+def _open_doc(pdf_path: str, mtime: float) -> Tuple[Any, threading.Lock]:
+    """Open a PDF once per (path, mtime) and share it between extraction calls.
+    
+    The mtime in the key keeps a re-downloaded file from being served from a
+    stale handle. Handles are not thread-safe, so each comes with a lock that
+    must be held while reading it; evicted documents close when collected.
+    """
+    return _open_pdf(pdf_path), threading.Lock()
+
+
+# 多页提取共用一个进程池，首次需要时创建；用spawn启动，避免从线程池中fork
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the shared page-extraction process pool, creating it on first use."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=Config.PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _pdf_pool
+
+
+def close_pdf_pool() -> None:
+    """Shut down the shared page-extraction process pool."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def _extract_page_chunk(pdf_path: str, indices: range) -> List[Tuple[int, str]]:
+    """Extract the given pages in a worker process, which opens the PDF itself."""
+    document = _open_pdf(pdf_path)
+    try:
+        return _read_page_texts(document, indices)
+    finally:
+        _close_pdf(document)
+
+
+def _extract_pages(
+    pdf_path: str,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    num_workers: int = Config.PDF_EXTRACT_WORKERS
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """Extract the text of a page range.
+    
+    Returns the total page count and a (1-based page number, text) pair for
+    every page in the range, using PyMuPDF when installed and pypdf otherwise.
+    Large ranges are split into contiguous chunks extracted by a process pool.
+    """
+    # 复用已解析的文档句柄，同一文件的提取与转换只解析一次
+    document, lock = _open_doc(pdf_path, os.path.getmtime(pdf_path))
+    with lock:
+        total_pages = document.page_count if fitz is not None else len(document.pages)
+        # 确定页面范围（与列表切片语义一致），只加载范围内的页面
+        indices = range(total_pages)[start_page:end_page + 1 if end_page is not None else None]
+        
+        if num_workers <= 1 or len(indices) < Config.PDF_PARALLEL_MIN_PAGES:
+            return total_pages, _read_page_texts(document, indices)
+    
+    # 按连续页块分配给各进程，结果按块顺序拼接，保持页序
+    chunk_size = -(-len(indices) // num_workers)
+    chunks = [indices[k:k + chunk_size] for k in range(0, len(indices), chunk_size)]
+    try:
+        results = list(_get_pdf_pool().map(_extract_page_chunk, [pdf_path] * len(chunks), chunks))
+    except Exception as e:
+        # 进程池不可用或子进程出错时退回单进程提取；进程池损坏则丢弃，下次重建
+        debug_print(f"Parallel page extraction failed, extracting in-process: {e}")
+        if isinstance(e, BrokenProcessPool):
+            close_pdf_pool()
+        with lock:
+            results = [_read_page_texts(document, indices)]
+    
+    return total_pages, [page for chunk in results for page in chunk]
+
+
+def _extract_text(
+    pdf_path: str,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None
+) -> Tuple[int, int, str, int, int]:
+    """Extract a page range as marked-up text.
+    
+    Returns (total pages, extracted pages, stripped text, word count, character
+    count); the counts are taken before stripping.
+    """
+    total_pages, pages_to_extract = _extract_pages(pdf_path, start_page, end_page)
+    
+    # 逐页累计词数与字符数，避免为整篇文本建立单词列表
+    parts = []
+    word_count = 0
+    char_count = 0
+    for page_number, page_text in pages_to_extract:
+        if page_text.strip():
+            header = f"\n--- Page {page_number} ---\n"
+            parts.append(header)
+            parts.append(page_text)
+            parts.append("\n")
+            word_count += 4 + len(page_text.split())  # 页码标记计4个词
+            char_count += len(header) + len(page_text) + 1
+    
+    return total_pages, len(pages_to_extract), "".join(parts).strip(), word_count, char_count
+
+
+def _save_text(output_file_path: Path, text: str) -> int:
+    """Write text to a UTF-8 file, creating its directory, and return the file size."""
+    output_file_path.parent.mkdir(parents=True, exist_ok=True)
+    # 只编码一次，写入的字节数即文件大小
+    data = text.encode('utf-8')
+    output_file_path.write_bytes(data)
+    return len(data)
+
+
+def _write_pages_text(
+    pages: List[Tuple[int, str]],
+    output_file_path: Path,
+    include_page_numbers: bool,
+    encoding: str
+) -> Tuple[int, int]:
+    """Write page texts to a file one page at a time, returning (word count, character count).
+    
+    The file content matches joining every non-blank page and stripping the
+    result; trailing whitespace is held back until more text follows.
+    """
+    word_count = 0
+    char_count = 0
+    pending = ""
+    started = False
+    # 页码标记的选择提到循环外，空模板的format结果为空字符串
+    page_header = "\n--- Page {} ---\n" if include_page_numbers else ""
+    
+    with open(output_file_path, 'w', encoding=encoding) as f:
+        for page_number, page_text in pages:
+            if not page_text.strip():
+                continue
+            
+            piece = page_header.format(page_number) + page_text + "\n"
+            word_count += len(piece.split())
+            char_count += len(piece)
+            
+            if not started:
+                piece = piece.lstrip()
+                started = True
+            body = piece.rstrip()
+            f.write(pending)
+            f.write(body)
+            pending = piece[len(body):]
+    
+    return word_count, char_count
+
+
+async def _run_pdftotext(pdf_path: str, output_file_path: Path) -> Optional[Tuple[int, int, int]]:
+    """Convert a whole PDF with pdftotext, returning (page count, word count, character count).
+    
+    Returns None when pdftotext fails, so the caller can fall back to the
+    in-process extractor.
+    """
+    process = await asyncio.create_subprocess_exec(
+        _PDFTOTEXT, '-enc', 'UTF-8', pdf_path, str(output_file_path),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    if await process.wait() != 0:
+        return None
+    
+    text = await asyncio.to_thread(output_file_path.read_text, encoding='utf-8')
+    # pdftotext在每页末尾输出换页符；逐页计词，避免为整篇文本建立单词列表
+    pages = text.split('\f')
+    return len(pages) - 1, sum(len(page.split()) for page in pages), len(text)
+
 
 async def download_arxiv_pdf(
     arxiv_id: str,
@@ -43,15 +297,11 @@ async def download_arxiv_pdf(
     debug_print(f"Downloading ArXiv PDF: {arxiv_id}", debug)
     
     try:
-        # 清理ArXiv ID格式
+        # 清理ArXiv ID格式（从abs/pdf链接中取出ID）
         clean_id = arxiv_id.strip()
-        if clean_id.startswith("http"):
-            if "arxiv.org/abs/" in clean_id:
-                clean_id = clean_id.split("arxiv.org/abs/")[-1]
-            elif "arxiv.org/pdf/" in clean_id:
-                clean_id = clean_id.split("arxiv.org/pdf/")[-1]
-                if clean_id.endswith(".pdf"):
-                    clean_id = clean_id[:-4]
+        match = _ARXIV_URL_RE.match(clean_id)
+        if match:
+            clean_id = match.group(1) if match.group(1) is not None else match.group(2)
         
         # 设置下载目录
         download_path = Path(download_dir)
@@ -68,37 +318,45 @@ async def download_arxiv_pdf(
         # 构建ArXiv PDF URL
         pdf_url = f"https://arxiv.org/pdf/{clean_id}.pdf"
         
-        # 下载PDF文件
-        req = urllib.request.Request(
-            pdf_url,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        )
-        
-        with urllib.request.urlopen(req) as response:
+        # 下载PDF文件（异步请求，多个下载可并发进行）
+        async with _get_download_session().get(pdf_url) as response:
             if response.status == 200:
-                with open(full_path, 'wb') as f:
-                    f.write(response.read())
-                
-                file_size = os.path.getsize(full_path)
-                
-                return {
-                    'success': True,
-                    'arxiv_id': clean_id,
-                    'pdf_url': pdf_url,
-                    'local_path': str(full_path),
-                    'file_size_bytes': file_size,
-                    'file_size_mb': round(file_size / (1024 * 1024), 2)
-                }
+                expected_size = response.content_length
+                received = 0
+                # 先写入临时文件，校验完整后再原子替换目标文件；
+                # 已缓存的PDF句柄与并发读取者永远不会看到被截断或残缺的文件
+                part_path = full_path.with_name(full_path.name + '.part')
+                try:
+                    # 分块写入磁盘，避免把整个PDF读入内存
+                    with open(part_path, 'wb') as f:
+                        if expected_size:
+                            _preallocate(f, expected_size)
+                        async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            received += len(chunk)
+                        if expected_size:
+                            f.truncate(received)
+                    
+                    if expected_size is None or received == expected_size:
+                        os.replace(part_path, full_path)
+                        # 写入的字节数即文件大小，无需再stat
+                        return {
+                            'success': True,
+                            'arxiv_id': clean_id,
+                            'pdf_url': pdf_url,
+                            'local_path': str(full_path),
+                            'file_size_bytes': received,
+                            'file_size_mb': round(received / (1024 * 1024), 2)
+                        }
+                    
+                    error_msg = f"Incomplete download: received {received} of {expected_size} bytes"
+                finally:
+                    # 下载中断、校验失败或任何异常时删除残缺的临时文件（替换成功后已不存在）
+                    part_path.unlink(missing_ok=True)
+            elif response.status == 404:
+                error_msg = f"ArXiv paper '{arxiv_id}' not found. Please check the ID."
             else:
-                raise Exception(f"HTTP {response.status}: Failed to download PDF")
-                
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            error_msg = f"ArXiv paper '{arxiv_id}' not found. Please check the ID."
-        else:
-            error_msg = f"HTTP {e.code}: {e.reason}"
+                error_msg = f"HTTP {response.status}: {response.reason}"
         
         debug_print(error_msg, debug)
         return {
@@ -121,6 +379,7 @@ async def extract_pdf_text(
     pdf_path: str,
     start_page: Optional[int] = None,
     end_page: Optional[int] = None,
+    save_to: Optional[str] = None,
     debug: bool = Config.DEBUG_MODE
 ) -> Dict[str, Any]:
     """Extract text content from a PDF file.
@@ -129,6 +388,7 @@ async def extract_pdf_text(
         pdf_path: Path to the PDF file
         start_page: Start page number (0-indexed, optional)
         end_page: End page number (0-indexed, optional)
+        save_to: Also write the extracted text to this file (optional)
         debug: Enable debug output
     
     Returns:
@@ -149,45 +409,33 @@ async def extract_pdf_text(
                 'error': f'PDF file not found: {pdf_path}'
             }
         
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
-        
-        # 确定页面范围
-        if start_page is not None and end_page is not None:
-            pages_to_extract = reader.pages[start_page:end_page + 1]
-            actual_start = start_page
-        elif start_page is not None:
-            pages_to_extract = reader.pages[start_page:]
-            actual_start = start_page
-        elif end_page is not None:
-            pages_to_extract = reader.pages[:end_page + 1]
-            actual_start = 0
-        else:
-            pages_to_extract = reader.pages
-            actual_start = 0
-        
-        # 提取文本
-        extracted_text = ""
-        for i, page in enumerate(pages_to_extract):
-            page_text = page.extract_text()
-            if page_text.strip():
-                extracted_text += f"\n--- Page {actual_start + i + 1} ---\n"
-                extracted_text += page_text
-                extracted_text += "\n"
-        
-        word_count = len(extracted_text.split())
-        char_count = len(extracted_text)
+        # 解析与文本拼接都在工作线程中完成，不阻塞事件循环
+        total_pages, extracted_pages, extracted_text, word_count, char_count = await asyncio.to_thread(
+            _extract_text, pdf_path, start_page, end_page
+        )
         
-        return {
+        result = {
             'success': True,
             'pdf_path': pdf_path,
             'total_pages': total_pages,
-            'extracted_pages': len(pages_to_extract),
+            'extracted_pages': extracted_pages,
             'word_count': word_count,
             'character_count': char_count,
-            'text_content': extracted_text.strip()
+            'text_content': extracted_text
         }
         
+        # 同一次提取的结果直接写入文本文件，无需再次解析PDF
+        if save_to:
+            try:
+                output_file_path = Path(save_to)
+                result['output_file_size_bytes'] = await asyncio.to_thread(_save_text, output_file_path, extracted_text)
+                result['output_path'] = str(output_file_path)
+            except OSError as e:
+                result['save_error'] = f"Error saving text file: {str(e)}"
+                debug_print(result['save_error'], debug)
+        
+        return result
+        
     except Exception as e:
         error_msg = f"Error extracting PDF text: {str(e)}"
         debug_print(error_msg, debug)
@@ -246,39 +494,32 @@ async def convert_pdf_to_text(
         # 确保输出目录存在
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
-        
-        # 确定页面范围
-        if start_page is not None and end_page is not None:
-            pages_to_extract = reader.pages[start_page:end_page + 1]
-            actual_start = start_page
-        elif start_page is not None:
-            pages_to_extract = reader.pages[start_page:]
-            actual_start = start_page
-        elif end_page is not None:
-            pages_to_extract = reader.pages[:end_page + 1]
-            actual_start = 0
-        else:
-            pages_to_extract = reader.pages
-            actual_start = 0
-        
-        # 提取文本
-        extracted_text = ""
-        for i, page in enumerate(pages_to_extract):
-            page_text = page.extract_text()
-            if page_text.strip():
-                if include_page_numbers:
-                    extracted_text += f"\n--- Page {actual_start + i + 1} ---\n"
-                extracted_text += page_text
-                extracted_text += "\n"
+        # 整本转换且不需要页码标记时优先使用pdftotext
+        if (_PDFTOTEXT and not include_page_numbers and start_page is None and end_page is None
+                and encoding.lower().replace('-', '').replace('_', '') == 'utf8'):
+            converted = await _run_pdftotext(pdf_path, output_file_path)
+            if converted is not None:
+                total_pages, word_count, char_count = converted
+                return {
+                    'success': True,
+                    'pdf_path': pdf_path,
+                    'output_path': str(output_file_path),
+                    'total_pages': total_pages,
+                    'extracted_pages': total_pages,
+                    'word_count': word_count,
+                    'character_count': char_count,
+                    'output_file_size_bytes': os.path.getsize(output_file_path),
+                    'encoding': encoding,
+                    'include_page_numbers': include_page_numbers
+                }
+            debug_print("pdftotext failed, falling back to in-process extraction", debug)
         
-        # 写入文本文件
-        with open(output_file_path, 'w', encoding=encoding) as f:
-            f.write(extracted_text.strip())
+        total_pages, pages_to_extract = await asyncio.to_thread(_extract_pages, pdf_path, start_page, end_page)
         
-        word_count = len(extracted_text.split())
-        char_count = len(extracted_text)
+        # 逐页写入文本文件
+        word_count, char_count = await asyncio.to_thread(
+            _write_pages_text, pages_to_extract, output_file_path, include_page_numbers, encoding
+        )
         file_size = os.path.getsize(output_file_path)
         
         return {
@@ -345,9 +586,14 @@ async def process_arxiv_paper(
             'pdf_size_mb': download_result['file_size_mb']
         }
         
-        # Step 2: Extract text if requested
+        # Step 2: Extract text if requested, saving it in the same pass
         if extract_text and PDF_READER_AVAILABLE:
-            text_result = await extract_pdf_text(pdf_path=pdf_path, debug=debug)
+            text_file_path = Path(pdf_path).with_suffix('.txt') if save_text_file else None
+            text_result = await extract_pdf_text(
+                pdf_path=pdf_path,
+                save_to=str(text_file_path) if text_file_path else None,
+                debug=debug
+            )
             
             if text_result.get('success'):
                 result.update({
@@ -357,24 +603,17 @@ async def process_arxiv_paper(
                     'character_count': text_result['character_count']
                 })
                 
-                # Step 3: Save text file if requested
+                # Step 3: Report the saved text file if requested
                 if save_text_file:
-                    text_file_path = Path(pdf_path).with_suffix('.txt')
-                    convert_result = await convert_pdf_to_text(
-                        pdf_path=pdf_path,
-                        output_path=str(text_file_path),
-                        debug=debug
-                    )
-                    
-                    if convert_result.get('success'):
+                    if 'output_path' in text_result:
                         result.update({
                             'text_file_saved': True,
-                            'text_file_path': convert_result['output_path'],
-                            'text_file_size_bytes': convert_result['output_file_size_bytes']
+                            'text_file_path': text_result['output_path'],
+                            'text_file_size_bytes': text_result['output_file_size_bytes']
                         })
                     else:
                         result['text_file_saved'] = False
-                        result['text_save_error'] = convert_result.get('error')
+                        result['text_save_error'] = text_result.get('save_error')
                 else:
                     result['text_content'] = text_result['text_content']
             else:
@@ -1,77 +1,176 @@
 """Semantic Scholar API client with full endpoint support."""
 
+import asyncio
 import json
-from typing import List, Optional, Dict, Any, Union
+import weakref
+from typing import List, Optional, Dict, Any, Tuple, Union
+from urllib.parse import urlparse
 import aiohttp
 from models import SemanticScholarPaper, AuthorInfo, SearchResult
 from config import Config
 from utils import (
-    debug_print, AsyncContextManager, RateLimiter, 
-    handle_rate_limit_retry, save_json_to_file, chunk_list
+    debug_print, AdaptiveRateLimiter, LRUCache, 
+    handle_rate_limit_retry, save_json_to_file, get_timestamp
 )
 
+# JSON serialization imports
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Response bodies and POST payloads are (de)serialized with orjson when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+_json_dumps = (lambda obj: orjson.dumps(obj).decode()) if orjson is not None else json.dumps
+
 
 class SemanticScholarClient:
     """Client for interacting with Semantic Scholar API."""
     
     def __init__(self, debug: bool = Config.DEBUG_MODE):
         self.debug = debug
-        self.rate_limiter = RateLimiter()
         self.base_url = Config.SEMANTIC_SCHOLAR_BASE_URL
+        # Shared by every client so a 429 slows down all callers, not just one
+        self.rate_limiter = AdaptiveRateLimiter.for_host(urlparse(self.base_url).netloc)
         self.headers = Config.get_api_headers()
+        # One (session, request slots) pair per event loop, since sessions are bound to their loop
+        self._loop_sessions = weakref.WeakKeyDictionary()
+        # Decoded bodies of successful paper/author lookups, keyed by URL (id and fields)
+        self._response_cache = LRUCache(Config.API_RESPONSE_CACHE_SIZE, ttl=Config.API_RESPONSE_CACHE_TTL)
+    
+    async def __aenter__(self) -> 'SemanticScholarClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    def _loop_session(self) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        """Return the running loop's keep-alive session and request slots, creating them on first use.
+        
+        Sessions are bound to the event loop they were created on, so each
+        loop gets its own; ``close()`` must be awaited on every loop used.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._loop_sessions.get(loop)
+        if entry is None or entry[0].closed:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers=self.headers,
+                json_serialize=_json_dumps,
+                connector=aiohttp.TCPConnector(
+                    limit=Config.SEMANTIC_SCHOLAR_MAX_CONNECTIONS,
+                    limit_per_host=Config.SEMANTIC_SCHOLAR_MAX_CONNECTIONS,
+                    ttl_dns_cache=300
+                )
+            )
+            # Requests beyond the pool size wait here rather than inside the
+            # session, where the wait for a free connection counts toward the timeout
+            entry = self._loop_sessions[loop] = (
+                session, asyncio.Semaphore(Config.SEMANTIC_SCHOLAR_MAX_CONNECTIONS)
+            )
+        return entry
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive HTTP session for the running event loop."""
+        return self._loop_session()[0]
+    
+    async def close(self) -> None:
+        """Close the HTTP session of the running event loop."""
+        entry = self._loop_sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None and not entry[0].closed:
+            await entry[0].close()
+    
+    async def _request(self, method: str, url: str, **kwargs) -> Tuple[Optional[int], Any]:
+        """Send a rate-limited request with retries over the shared session.
+        
+        Returns ``(status, data)`` where ``data`` is the decoded JSON body of a
+        200 response and None otherwise; ``status`` is None if no response was
+        received. The connection is always released back to the pool.
+        """
+        session, request_slots = self._loop_session()
+        send = session.post if method == 'POST' else session.get
+        
+        async def make_request():
+            await self.rate_limiter.wait()
+            return await send(url, **kwargs)
+        
+        async with request_slots:
+            response = await handle_rate_limit_retry(
+                make_request, debug=self.debug, rate_limiter=self.rate_limiter
+            )
+            if response is None:
+                return None, None
+            
+            try:
+                if response.status == 200:
+                    return response.status, await response.json(loads=_json_loads)
+                return response.status, None
+            finally:
+                response.release()
+    
+    async def _cached_get(self, url: str) -> Tuple[Optional[int], Any]:
+        """GET ``url`` like ``_request``, serving repeated successful lookups from the cache.
+        
+        Only decoded JSON is cached; callers build fresh model objects from it.
+        """
+        data = self._response_cache.get(url)
+        if data is not None:
+            return 200, data
+        
+        status, data = await self._request('GET', url)
+        if status == 200:
+            self._response_cache.set(url, data)
+        return status, data
     
     # Paper Data Endpoints
     
-    async def get_paper(self, paper_id: str, fields: Optional[List[str]] = None) -> Optional[SemanticScholarPaper]:
-        """Get paper details by ID (ArXiv ID, DOI, Corpus ID, etc.)."""
+    async def get_paper(
+        self,
+        paper_id: str,
+        fields: Optional[List[str]] = None,
+        cache: bool = True
+    ) -> Optional[SemanticScholarPaper]:
+        """Get paper details by ID (ArXiv ID, DOI, Corpus ID, etc.).
+        
+        ``cache=False`` skips the client's response cache, for callers that
+        keep their own paper cache.
+        """
         debug_print(f"Fetching paper details for: {paper_id}", self.debug)
         
         if fields is None:
-            fields = Config.PAPER_FIELDS
-        
-        fields_str = ','.join(fields)
+            fields_str = Config.get_paper_fields_string()
+        else:
+            fields_str = ','.join(fields)
         url = f"{self.base_url}/paper/{paper_id}?fields={fields_str}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                return SemanticScholarPaper.from_dict(data)
-            else:
-                debug_print(f"Failed to fetch paper {paper_id}: {response.status if response else 'No response'}", self.debug)
-                return None
+        status, data = await (self._cached_get(url) if cache else self._request('GET', url))
+        
+        if status == 200:
+            return SemanticScholarPaper.from_dict(data)
+        else:
+            debug_print(f"Failed to fetch paper {paper_id}: {status or 'No response'}", self.debug)
+            return None
     
     async def get_paper_authors(self, paper_id: str, fields: Optional[List[str]] = None) -> List[AuthorInfo]:
         """Get authors of a paper."""
         debug_print(f"Fetching authors for paper: {paper_id}", self.debug)
         
         if fields is None:
-            fields = Config.AUTHOR_FIELDS
-        
-        fields_str = ','.join(fields)
+            fields_str = Config.get_author_fields_string()
+        else:
+            fields_str = ','.join(fields)
         url = f"{self.base_url}/paper/{paper_id}/authors?fields={fields_str}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                authors = []
-                for author_data in data.get('data', []):
-                    authors.append(AuthorInfo.from_dict(author_data))
-                return authors
-            else:
-                debug_print(f"Failed to fetch authors for paper {paper_id}", self.debug)
-                return []
+        status, data = await self._cached_get(url)
+        
+        if status == 200:
+            authors = []
+            for author_data in data.get('data', []):
+                authors.append(AuthorInfo.from_dict(author_data))
+            return authors
+        else:
+            debug_print(f"Failed to fetch authors for paper {paper_id}", self.debug)
+            return []
     
     async def get_paper_citations(
         self, 
@@ -84,29 +183,23 @@ class SemanticScholarClient:
         debug_print(f"Fetching citations for paper: {paper_id}", self.debug)
         
         if fields is None:
-            fields = Config.CITATION_FIELDS
-        
-        fields_str = ','.join(fields)
+            fields_str = Config.get_citation_fields_string()
+        else:
+            fields_str = ','.join(fields)
         url = f"{self.base_url}/paper/{paper_id}/citations?fields={fields_str}&limit={limit}&offset={offset}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                citations = []
-                for citation_data in data.get('data', []):
-                    citing_paper = citation_data.get('citingPaper', {})
-                    if citing_paper:
-                        citations.append(SemanticScholarPaper.from_dict(citing_paper))
-                return citations
-            else:
-                debug_print(f"Failed to fetch citations for paper {paper_id}", self.debug)
-                return []
+        status, data = await self._request('GET', url)
+        
+        if status == 200:
+            citations = []
+            for citation_data in data.get('data', []):
+                citing_paper = citation_data.get('citingPaper', {})
+                if citing_paper:
+                    citations.append(SemanticScholarPaper.from_dict(citing_paper))
+            return citations
+        else:
+            debug_print(f"Failed to fetch citations for paper {paper_id}", self.debug)
+            return []
     
     async def get_paper_references(
         self, 
@@ -119,29 +212,23 @@ class SemanticScholarClient:
         debug_print(f"Fetching references for paper: {paper_id}", self.debug)
         
         if fields is None:
-            fields = Config.CITATION_FIELDS
-        
-        fields_str = ','.join(fields)
+            fields_str = Config.get_citation_fields_string()
+        else:
+            fields_str = ','.join(fields)
         url = f"{self.base_url}/paper/{paper_id}/references?fields={fields_str}&limit={limit}&offset={offset}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                references = []
-                for ref_data in data.get('data', []):
-                    cited_paper = ref_data.get('citedPaper', {})
-                    if cited_paper:
-                        references.append(SemanticScholarPaper.from_dict(cited_paper))
-                return references
-            else:
-                debug_print(f"Failed to fetch references for paper {paper_id}", self.debug)
-                return []
+        status, data = await self._request('GET', url)
+        
+        if status == 200:
+            references = []
+            for ref_data in data.get('data', []):
+                cited_paper = ref_data.get('citedPaper', {})
+                if cited_paper:
+                    references.append(SemanticScholarPaper.from_dict(cited_paper))
+            return references
+        else:
+            debug_print(f"Failed to fetch references for paper {paper_id}", self.debug)
+            return []
     
     async def search_papers(
         self,
@@ -153,20 +240,27 @@ class SemanticScholarClient:
         min_citation_count: Optional[int] = None,
         limit: int = 100,
         offset: int = 0,
-        fields: Optional[List[str]] = None
+        fields: Optional[List[str]] = None,
+        raw: bool = False
     ) -> SearchResult:
-        """Search for papers with advanced filtering."""
+        """Search for papers with advanced filtering.
+        
+        With ``raw=True`` the result's papers are plain dicts in the
+        ``SemanticScholarPaper.to_dict`` form instead of model objects.
+        """
         debug_print(f"Searching papers with query: {query}", self.debug)
         
         if fields is None:
-            fields = Config.PAPER_FIELDS
+            fields_str = Config.get_paper_fields_string()
+        else:
+            fields_str = ','.join(fields)
         
         # Build query parameters
         params = {
             'query': query,
             'limit': limit,
             'offset': offset,
-            'fields': ','.join(fields)
+            'fields': fields_str
         }
         
         if year:
@@ -182,28 +276,56 @@ class SemanticScholarClient:
         
         url = f"{self.base_url}/paper/search"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url, params=params)
+        status, data = await self._request('GET', url, params=params)
+        
+        if status == 200:
+            convert = SemanticScholarPaper.dict_from_api if raw else SemanticScholarPaper.from_dict
+            papers = [convert(paper_data) for paper_data in data.get('data', [])]
             
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
+            return SearchResult(
+                total=data.get('total', 0),
+                offset=data.get('offset', 0),
+                next_offset=data.get('next', None),
+                papers=papers
+            )
+        else:
+            debug_print(f"Failed to search papers: {status or 'No response'}", self.debug)
+            return SearchResult(total=0, offset=0, next_offset=None, papers=[])
+    
+    async def get_paper_batch(
+        self,
+        paper_ids: List[str],
+        fields: Optional[List[str]] = None
+    ) -> Optional[List[Optional[SemanticScholarPaper]]]:
+        """Get up to ``Config.BATCH_SIZE`` papers with a single /paper/batch request.
+        
+        The result has one slot per requested ID (None for IDs that were not
+        found); None is returned if the request itself failed.
+        """
+        if fields is None:
+            fields_str = Config.get_paper_fields_string()
+        else:
+            fields_str = ','.join(fields)
+        
+        url = f"{self.base_url}/paper/batch"
+        params = {'fields': fields_str}
+        payload = {'ids': paper_ids}
+        
+        status, data = await self._request('POST', url, params=params, json=payload)
+        
+        if status == 200:
             
-            if response and response.status == 200:
-                data = await response.json()
-                papers = []
-                for paper_data in data.get('data', []):
-                    papers.append(SemanticScholarPaper.from_dict(paper_data))
-                
-                return SearchResult(
-                    total=data.get('total', 0),
-                    offset=data.get('offset', 0),
-                    next_offset=data.get('next', None),
-                    papers=papers
-                )
-            else:
-                debug_print(f"Failed to search papers: {response.status if response else 'No response'}", self.debug)
-                return SearchResult(total=0, offset=0, next_offset=None, papers=[])
+            # Save raw response for debugging
+            if self.debug:
+                await asyncio.to_thread(save_json_to_file, data, "batch_response.json")
+            
+            return [
+                SemanticScholarPaper.from_dict(paper_data) if paper_data else None
+                for paper_data in data
+            ]
+        else:
+            debug_print(f"Failed to fetch paper batch: {status or 'No response'}", self.debug)
+            return None
     
     async def get_paper_bulk(
         self, 
@@ -213,42 +335,29 @@ class SemanticScholarClient:
         """Get multiple papers in bulk (up to 500 per request)."""
         debug_print(f"Fetching {len(paper_ids)} papers in bulk", self.debug)
         
-        if fields is None:
-            fields = Config.PAPER_FIELDS
-        
         all_papers = []
         
-        # Split into chunks of 500 (API limit)
-        chunks = chunk_list(paper_ids, Config.BATCH_SIZE)
+        # Split into chunks of 500 (API limit); each chunk is sliced only once
+        # its request can start, so pending chunks hold no copies of the IDs
+        num_chunks = -(-len(paper_ids) // Config.BATCH_SIZE)
+        semaphore = asyncio.Semaphore(Config.PAPER_FETCH_CONCURRENCY)
         
-        for i, chunk in enumerate(chunks):
-            debug_print(f"Processing chunk {i+1}/{len(chunks)} with {len(chunk)} papers", self.debug)
-            
-            url = f"{self.base_url}/paper/batch"
-            payload = {
-                'ids': chunk,
-                'fields': fields
-            }
+        async def fetch_chunk(i: int) -> Optional[List[Optional[SemanticScholarPaper]]]:
+            async with semaphore:
+                chunk = paper_ids[i * Config.BATCH_SIZE:(i + 1) * Config.BATCH_SIZE]
+                debug_print(f"Processing chunk {i+1}/{num_chunks} with {len(chunk)} papers", self.debug)
+                return await self.get_paper_batch(chunk, fields)
+        
+        # Chunks are requested concurrently; gather keeps them in input order
+        results = await asyncio.gather(*(fetch_chunk(i) for i in range(num_chunks)))
+        
+        for i, papers in enumerate(results):
+            if papers is None:
+                debug_print(f"Failed to fetch chunk {i+1}", self.debug)
+                continue
             
-            async with AsyncContextManager() as session:
-                async def make_request():
-                    await self.rate_limiter.wait()
-                    return await session.post(url, json=payload)
-                
-                response = await handle_rate_limit_retry(make_request, debug=self.debug)
-                
-                if response and response.status == 200:
-                    data = await response.json()
-                    
-                    # Save raw response for debugging
-                    if self.debug:
-                        save_json_to_file(data, f"batch_response_chunk_{i+1}.json")
-                    
-                    for paper_data in data:
-                        if paper_data:  # Skip None entries
-                            all_papers.append(SemanticScholarPaper.from_dict(paper_data))
-                else:
-                    debug_print(f"Failed to fetch chunk {i+1}: {response.status if response else 'No response'}", self.debug)
+            # Skip IDs that were not found
+            all_papers.extend(paper for paper in papers if paper)
         
         debug_print(f"Successfully fetched {len(all_papers)} papers from bulk request", self.debug)
         return all_papers
@@ -260,24 +369,18 @@ class SemanticScholarClient:
         debug_print(f"Fetching author details for: {author_id}", self.debug)
         
         if fields is None:
-            fields = Config.AUTHOR_FIELDS
-        
-        fields_str = ','.join(fields)
+            fields_str = Config.get_author_fields_string()
+        else:
+            fields_str = ','.join(fields)
         url = f"{self.base_url}/author/{author_id}?fields={fields_str}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                return AuthorInfo.from_dict(data)
-            else:
-                debug_print(f"Failed to fetch author {author_id}", self.debug)
-                return None
+        status, data = await self._cached_get(url)
+        
+        if status == 200:
+            return AuthorInfo.from_dict(data)
+        else:
+            debug_print(f"Failed to fetch author {author_id}", self.debug)
+            return None
     
     async def get_author_papers(
         self, 
@@ -290,27 +393,21 @@ class SemanticScholarClient:
         debug_print(f"Fetching papers for author: {author_id}", self.debug)
         
         if fields is None:
-            fields = Config.PAPER_FIELDS
-        
-        fields_str = ','.join(fields)
+            fields_str = Config.get_paper_fields_string()
+        else:
+            fields_str = ','.join(fields)
         url = f"{self.base_url}/author/{author_id}/papers?fields={fields_str}&limit={limit}&offset={offset}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                papers = []
-                for paper_data in data.get('data', []):
-                    papers.append(SemanticScholarPaper.from_dict(paper_data))
-                return papers
-            else:
-                debug_print(f"Failed to fetch papers for author {author_id}", self.debug)
-                return []
+        status, data = await self._request('GET', url)
+        
+        if status == 200:
+            papers = []
+            for paper_data in data.get('data', []):
+                papers.append(SemanticScholarPaper.from_dict(paper_data))
+            return papers
+        else:
+            debug_print(f"Failed to fetch papers for author {author_id}", self.debug)
+            return []
     
     async def search_authors(
         self,
@@ -323,33 +420,72 @@ class SemanticScholarClient:
         debug_print(f"Searching authors with query: {query}", self.debug)
         
         if fields is None:
-            fields = Config.AUTHOR_FIELDS
+            fields_str = Config.get_author_fields_string()
+        else:
+            fields_str = ','.join(fields)
         
         params = {
             'query': query,
             'limit': limit,
             'offset': offset,
-            'fields': ','.join(fields)
+            'fields': fields_str
         }
         
         url = f"{self.base_url}/author/search"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url, params=params)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                authors = []
-                for author_data in data.get('data', []):
-                    authors.append(AuthorInfo.from_dict(author_data))
-                return authors
-            else:
-                debug_print(f"Failed to search authors: {response.status if response else 'No response'}", self.debug)
-                return []
+        status, data = await self._request('GET', url, params=params)
+        
+        if status == 200:
+            authors = []
+            for author_data in data.get('data', []):
+                authors.append(AuthorInfo.from_dict(author_data))
+            return authors
+        else:
+            debug_print(f"Failed to search authors: {status or 'No response'}", self.debug)
+            return []
+    
+    async def search_authors_with_papers(
+        self,
+        query: str,
+        limit: int = 1,
+        paper_limit: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Tuple[AuthorInfo, List[SemanticScholarPaper]]]:
+        """Search for authors and get their papers in the same request.
+        
+        ``fields`` may mix author fields and ``papers.*`` fields; by default
+        the configured author and author-paper fields are requested. At most
+        ``paper_limit`` papers are kept per author.
+        """
+        debug_print(f"Searching authors with papers, query: {query}", self.debug)
+        
+        if fields is None:
+            fields_str = f"{Config.get_author_fields_string()},{Config.get_author_paper_fields_string()}"
+        else:
+            fields_str = ','.join(fields)
+        
+        params = {
+            'query': query,
+            'limit': limit,
+            'fields': fields_str
+        }
+        
+        url = f"{self.base_url}/author/search"
+        
+        status, data = await self._request('GET', url, params=params)
+        
+        if status == 200:
+            results = []
+            for author_data in data.get('data', []):
+                papers_data = author_data.get('papers') or []
+                if paper_limit is not None:
+                    papers_data = papers_data[:paper_limit]
+                papers = [SemanticScholarPaper.from_dict(paper_data) for paper_data in papers_data]
+                results.append((AuthorInfo.from_dict(author_data), papers))
+            return results
+        else:
+            debug_print(f"Failed to search authors: {status or 'No response'}", self.debug)
+            return []
     
     # Recommendations API
     
@@ -357,37 +493,36 @@ class SemanticScholarClient:
         self,
         paper_id: str,
         fields: Optional[List[str]] = None,
-        limit: int = 100
-    ) -> List[SemanticScholarPaper]:
-        """Get paper recommendations based on a paper."""
+        limit: int = 100,
+        raw: bool = False
+    ) -> List[Union[SemanticScholarPaper, Dict[str, Any]]]:
+        """Get paper recommendations based on a paper.
+        
+        With ``raw=True`` the recommendations are plain dicts in the
+        ``SemanticScholarPaper.to_dict`` form instead of model objects.
+        """
         debug_print(f"Fetching recommendations for paper: {paper_id}", self.debug)
         
         if fields is None:
-            fields = Config.PAPER_FIELDS
+            fields_str = Config.get_paper_fields_string()
+        else:
+            fields_str = ','.join(fields)
         
         params = {
-            'fields': ','.join(fields),
+            'fields': fields_str,
             'limit': limit
         }
         
         url = f"{self.base_url}/recommendations/v1/papers/forpaper/{paper_id}"
         
-        async with AsyncContextManager() as session:
-            async def make_request():
-                await self.rate_limiter.wait()
-                return await session.get(url, params=params)
-            
-            response = await handle_rate_limit_retry(make_request, debug=self.debug)
-            
-            if response and response.status == 200:
-                data = await response.json()
-                recommendations = []
-                for rec_data in data.get('recommendedPapers', []):
-                    recommendations.append(SemanticScholarPaper.from_dict(rec_data))
-                return recommendations
-            else:
-                debug_print(f"Failed to get recommendations for paper {paper_id}", self.debug)
-                return []
+        status, data = await self._request('GET', url, params=params)
+        
+        if status == 200:
+            convert = SemanticScholarPaper.dict_from_api if raw else SemanticScholarPaper.from_dict
+            return [convert(rec_data) for rec_data in data.get('recommendedPapers', [])]
+        else:
+            debug_print(f"Failed to get recommendations for paper {paper_id}", self.debug)
+            return []
     
     # Utility Methods
     
@@ -405,12 +540,12 @@ class SemanticScholarClient:
         if not main_paper:
             return {'error': f'Paper {paper_id} not found'}
         
-        # Get citations and references
-        citations = await self.get_paper_citations(paper_id)
-        references = await self.get_paper_references(paper_id)
-        
-        # Get recommendations
-        recommendations = await self.get_paper_recommendations(paper_id)
+        # Get citations, references and recommendations concurrently
+        citations, references, recommendations = await asyncio.gather(
+            self.get_paper_citations(paper_id),
+            self.get_paper_references(paper_id),
+            self.get_paper_recommendations(paper_id)
+        )
         
         analysis_result = {
             'main_paper': main_paper.to_dict(),
@@ -419,11 +554,11 @@ class SemanticScholarClient:
             'citing_papers': [paper.to_dict() for paper in citations],
             'referenced_papers': [paper.to_dict() for paper in references],
             'recommendations': [paper.to_dict() for paper in recommendations[:10]],  # Top 10
-            'analysis_timestamp': save_json_to_file({}, f"citation_analysis_{paper_id}.json")
+            'analysis_timestamp': get_timestamp()
         }
         
-        # Save comprehensive analysis
-        save_json_to_file(analysis_result, f"comprehensive_analysis_{paper_id}.json")
+        # Save comprehensive analysis without blocking the event loop
+        await asyncio.to_thread(save_json_to_file, analysis_result, f"comprehensive_analysis_{paper_id}.json")
         
         debug_print(f"Citation analysis complete: {len(citations)} citations, {len(references)} references", self.debug)
         
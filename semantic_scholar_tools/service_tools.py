@@ -4,6 +4,11 @@ from typing import Dict, Any
 from config import Config
 
 # PDF处理相关导入检查
+try:
+    import fitz  # type: ignore
+except ImportError:
+    fitz = None
+
 try:
     from pypdf import PdfReader  # type: ignore
 except ImportError:
@@ -54,6 +59,6 @@ async def get_service_info(
                 'get_service_info'
             ]
         },
-        'pdf_processing_available': PdfReader is not None,
+        'pdf_processing_available': PdfReader is not None or fitz is not None,
         'debug_mode': debug
     }
\ No newline at end of file
@@ -1,53 +1,140 @@
 """Utility functions for the MCP server."""
 
 import asyncio
+import functools
+import inspect
 import json
+import re
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Callable, Set, Tuple
 import aiohttp
 from config import Config
 
+# JSON serialization imports
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+# Sentinel for cache lookups where None is a legitimate cached value
+_MISSING = object()
+
+# Result handed to SingleFlight waiters when the caller running the call was cancelled
+_LEADER_CANCELLED = object()
+
+# ArXiv IDs, new style (e.g. 2301.12345 or 1234.5678v1) or old style (e.g. cs/0701001)
+_ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5}(?:v\d+)?|[a-z-]+/\d{7}(?:v\d+)?)')
+# Fast path for the common case of an already-clean new-style ID
+_NEW_ARXIV_ID_RE = re.compile(r'\d{4}\.\d{4,5}(?:v\d+)?')
+
 
 class RateLimiter:
-    """Rate limiter for API requests."""
+    """Rate limiter for API requests.
+    
+    Use ``RateLimiter.for_host`` to share one limiter between every client that
+    talks to the same host, so separate clients cannot each run at the limit.
+    """
+    
+    _host_limiters: Dict[str, 'RateLimiter'] = {}
     
     def __init__(self, delay: float = Config.DEFAULT_RATE_LIMIT_DELAY):
         self.delay = delay
         self.last_request_time = 0.0
     
+    @classmethod
+    def for_host(cls, host: str, delay: float = Config.DEFAULT_RATE_LIMIT_DELAY) -> 'RateLimiter':
+        """Get the process-wide rate limiter for ``host``, creating it on first use."""
+        limiter = cls._host_limiters.get(host)
+        if limiter is None:
+            limiter = cls._host_limiters[host] = cls(delay)
+        return limiter
+    
     async def wait(self) -> None:
         """Wait if necessary to respect rate limits."""
         current_time = time.time()
-        time_since_last = current_time - self.last_request_time
         
-        if time_since_last < self.delay:
-            wait_time = self.delay - time_since_last
-            await asyncio.sleep(wait_time)
+        # Reserve the next slot before sleeping so concurrent callers queue up
+        # behind each other instead of all waking at the same moment
+        scheduled_time = max(current_time, self.last_request_time + self.delay)
+        self.last_request_time = scheduled_time
         
-        self.last_request_time = time.time()
+        if scheduled_time > current_time:
+            await asyncio.sleep(scheduled_time - current_time)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter whose spacing adapts to the server's rate-limit responses.
+    
+    Every 429 multiplies the delay between requests by ``backoff_factor`` (up
+    to ``max_delay``), slowing down all callers sharing the limiter instead of
+    only the one that was rejected. Each success shrinks the delay by
+    ``recovery_factor`` back towards the configured minimum.
+    """
+    
+    _host_limiters: Dict[str, 'AdaptiveRateLimiter'] = {}
+    
+    def __init__(
+        self,
+        delay: float = Config.DEFAULT_RATE_LIMIT_DELAY,
+        max_delay: float = Config.MAX_RATE_LIMIT_DELAY,
+        backoff_factor: float = Config.BACKOFF_FACTOR,
+        recovery_factor: float = Config.RATE_LIMIT_RECOVERY_FACTOR
+    ):
+        super().__init__(delay)
+        self.min_delay = delay
+        self.max_delay = max_delay
+        self.backoff_factor = backoff_factor
+        self.recovery_factor = recovery_factor
+        self.consecutive_rate_limits = 0
+    
+    def on_rate_limited(self) -> None:
+        """Widen the spacing between requests after a 429."""
+        self.consecutive_rate_limits += 1
+        self.delay = min(self.delay * self.backoff_factor, self.max_delay)
+    
+    def on_success(self) -> None:
+        """Decay the spacing back towards the minimum after a success."""
+        self.consecutive_rate_limits = 0
+        self.delay = max(self.delay * self.recovery_factor, self.min_delay)
 
 
 async def handle_rate_limit_retry(
     request_func: Callable,
     max_retries: int = Config.MAX_RETRIES,
     backoff_factor: float = Config.BACKOFF_FACTOR,
-    debug: bool = Config.DEBUG_MODE
+    debug: bool = Config.DEBUG_MODE,
+    retry_statuses: Tuple[int, ...] = (429,),
+    rate_limiter: Optional[AdaptiveRateLimiter] = None
 ) -> Optional[aiohttp.ClientResponse]:
-    """Handle rate limiting with exponential backoff retry."""
+    """Handle rate limiting with exponential backoff retry.
+    
+    Responses whose status is in ``retry_statuses`` are released and retried.
+    If ``rate_limiter`` is given it is told about successes and 429s so it can
+    adapt the request rate.
+    """
     
     for attempt in range(max_retries + 1):
         try:
             response = await request_func()
             
             if response.status == 200:
+                if rate_limiter is not None:
+                    rate_limiter.on_success()
                 return response
-            elif response.status == 429:  # Rate limited
+            elif response.status in retry_statuses:  # Rate limited / unavailable
+                if response.status == 429 and rate_limiter is not None:
+                    rate_limiter.on_rate_limited()
                 if attempt < max_retries:
                     wait_time = backoff_factor ** attempt
                     if debug:
                         print(f"Rate limited. Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
+                    response.release()
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -71,6 +158,266 @@ async def handle_rate_limit_retry(
     return None
 
 
+class LRUCache:
+    """Size-bounded least-recently-used cache with optional entry expiry.
+    
+    ``ttl`` (seconds) applies to every entry unless overridden per ``set`` call;
+    ``None`` means entries never expire.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[Any, Tuple[Optional[float], Any]]' = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for ``key`` and mark it as recently used."""
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return default
+        
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``, evicting the least recently used entry when full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._data.clear()
+    
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class PersistentCache:
+    """JSON key/value store in a SQLite file, for data worth keeping across restarts.
+    
+    The database is opened on first use. ``get`` and ``set`` run the SQLite
+    calls in a worker thread; storage errors are logged and treated as misses
+    so a broken cache file never fails the caller. Expired rows are deleted
+    when the database is opened and again every ``purge_interval`` writes.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        ttl: Optional[float] = None,
+        purge_interval: int = Config.PERSISTENT_CACHE_PURGE_INTERVAL
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.purge_interval = purge_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache '
+                '(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)')
+            self._conn = conn
+            self._purge_expired()
+        return self._conn
+    
+    def _purge_expired(self) -> None:
+        """Delete rows past their expiry; caller holds the lock."""
+        self._conn.execute('DELETE FROM cache WHERE expires_at <= ?', (time.time(),))
+        self._writes = 0
+    
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return _MISSING
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return _MISSING
+        return orjson.loads(value) if orjson is not None else json.loads(value)
+    
+    def _set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        data = orjson.dumps(value) if orjson is not None else json.dumps(value).encode()
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._connect().execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, data, expires_at)
+            )
+            self._writes += 1
+            if self._writes >= self.purge_interval:
+                self._purge_expired()
+    
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored value for ``key``, or ``default`` if absent or expired."""
+        try:
+            value = await asyncio.to_thread(self._get, key)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            debug_print(f"Persistent cache read failed for {key}: {str(e)}")
+            return default
+        return default if value is _MISSING else value
+    
+    async def set(self, key: str, value: Any, ttl: Any = _MISSING) -> None:
+        """Store a JSON-serializable ``value``; ``ttl`` overrides the default expiry."""
+        try:
+            await asyncio.to_thread(self._set, key, value, self.ttl if ttl is _MISSING else ttl)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            debug_print(f"Persistent cache write failed for {key}: {str(e)}")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single in-flight call.
+    
+    If the caller running the shared call is cancelled, its waiters are not:
+    one of them takes over and runs its own ``func`` instead.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Any, asyncio.Future] = {}
+    
+    async def do(self, key: Any, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func`` for ``key``, or wait for the call already running for it."""
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            # Shield so a cancelled follower does not cancel the shared call
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # Wake the waiters so one of them retries instead of failing with our cancellation
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no follower is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+class MicroBatcher:
+    """Collect items submitted within a short window and process them as one batch.
+    
+    ``batch_func`` receives the list of submitted items and must return one
+    result per item, in order; a result that is an exception instance is
+    raised to that item's caller only.
+    """
+    
+    def __init__(
+        self,
+        batch_func: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 100,
+        delay: float = 0.01
+    ):
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Running batch tasks; the loop keeps only weak references to tasks
+        self._batch_tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue ``item`` for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending state from a previous event loop can never complete
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+            self._batch_tasks = set()
+        
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.create_task(self._flush_after_delay())
+        
+        return await future
+    
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.delay)
+        self._timer = None
+        self._dispatch()
+    
+    def _dispatch(self) -> None:
+        """Hand the pending items to a background batch call."""
+        batch, self._pending = self._pending, []
+        if batch:
+            task = self._loop.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.batch_func([item for item, _ in batch])
+        except BaseException as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        
+        # A short result list must not leave the remaining callers waiting forever
+        if len(results) != len(batch):
+            error = RuntimeError(f"Batch function returned {len(results)} results for {len(batch)} items")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+
 def save_json_to_file(data: Dict[str, Any], filename: str, directory: Path = Config.JSON_FILES_DIR) -> str:
     """Save data to JSON file with timestamp."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -79,8 +426,11 @@ def save_json_to_file(data: Dict[str, Any], filename: str, directory: Path = Con
     
     directory.mkdir(parents=True, exist_ok=True)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
     
     return str(filepath)
 
@@ -88,6 +438,9 @@ def save_json_to_file(data: Dict[str, Any], filename: str, directory: Path = Con
 def load_json_from_file(filepath: str) -> Optional[Dict[str, Any]]:
     """Load data from JSON file."""
     try:
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(Path(filepath).read_bytes())
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError) as e:
@@ -102,48 +455,71 @@ def create_directory_structure(base_path: Path, subdirs: List[str]) -> None:
         (base_path / subdir).mkdir(parents=True, exist_ok=True)
 
 
+# (epoch second, formatted string) of the last get_timestamp call
+_last_timestamp: Tuple[int, str] = (-1, '')
+
+
 def get_timestamp() -> str:
-    """Get current timestamp string."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    """Get current timestamp string.
+    
+    The string only changes once per second, so it is formatted at most once
+    per second and reused by every call within that second.
+    """
+    global _last_timestamp
+    second = int(time.time())
+    if _last_timestamp[0] != second:
+        _last_timestamp = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _last_timestamp[1]
+
+
+_FILENAME_TRANSLATION = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename.strip()
+    return filename.translate(_FILENAME_TRANSLATION).strip()
 
 
-def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
-    """Split list into chunks of specified size."""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def chunk_list(lst: List[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split list into chunks of specified size, yielding each chunk as it is needed."""
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
 
 
 def extract_arxiv_id(url_or_id: str) -> Optional[str]:
     """Extract ArXiv ID from URL or return ID if already in correct format."""
-    import re
-    
-    # Pattern for ArXiv ID (e.g., 2301.12345 or 1234.5678v1)
-    arxiv_pattern = r'(\d{4}\.\d{4,5}(?:v\d+)?|[a-z-]+/\d{7}(?:v\d+)?)'
+    if _NEW_ARXIV_ID_RE.fullmatch(url_or_id):
+        return url_or_id
     
     # If it's a URL, extract the ID
     if 'arxiv.org' in url_or_id:
-        match = re.search(arxiv_pattern, url_or_id)
+        match = _ARXIV_ID_RE.search(url_or_id)
         return match.group(1) if match else None
     
     # If it's already an ID, validate and return
-    if re.match(f'^{arxiv_pattern}$', url_or_id):
+    if _ARXIV_ID_RE.fullmatch(url_or_id):
         return url_or_id
     
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def canonical_paper_id(paper_id: str) -> str:
+    """Normalize a paper identifier: ArXiv URLs and IDs become the bare ArXiv ID.
+    
+    Other identifiers (DOIs, Semantic Scholar IDs) are returned stripped.
+    """
+    paper_id = paper_id.strip()
+    return extract_arxiv_id(paper_id) or paper_id
+
+
 def format_authors(authors: List[Dict[str, Any]]) -> str:
     """Format author list for display."""
     if not authors:
         return "Unknown"
     
+    # Only the first three names are shown; a fourth is enough to know "et al." applies
     author_names = []
     for author in authors:
         if isinstance(author, dict):
@@ -153,6 +529,8 @@ def format_authors(authors: List[Dict[str, Any]]) -> str:
         
         if name:
             author_names.append(name)
+            if len(author_names) > 3:
+                break
     
     if len(author_names) <= 3:
         return ", ".join(author_names)
@@ -167,6 +545,37 @@ def debug_print(message: str, debug: bool = Config.DEBUG_MODE) -> None:
         print(f"[{timestamp}] DEBUG: {message}")
 
 
+def catch_tool_errors(prefix: str) -> Callable:
+    """Decorate an async tool so an uncaught exception becomes an error result.
+    
+    The exception is reported as ``{'success': False, 'error': f'{prefix}: {e}'}``
+    and logged when the call's ``debug`` argument is true.
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        parameters = list(inspect.signature(func).parameters.values())
+        debug_index = next((i for i, param in enumerate(parameters) if param.name == 'debug'), None)
+        debug_default = parameters[debug_index].default if debug_index is not None else Config.DEBUG_MODE
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                error_msg = f"{prefix}: {str(e)}"
+                if 'debug' in kwargs:
+                    debug = kwargs['debug']
+                elif debug_index is not None and debug_index < len(args):
+                    debug = args[debug_index]
+                else:
+                    debug = debug_default
+                debug_print(error_msg, debug)
+                return {'success': False, 'error': error_msg}
+        
+        return wrapper
+    
+    return decorator
+
+
 class AsyncContextManager:
     """Async context manager for HTTP sessions."""
     
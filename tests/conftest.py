@@ -6,6 +6,14 @@ import shutil
 from pathlib import Path
 
 
+@pytest.fixture(autouse=True)
+def clear_pdf_document_cache():
+    """Drop PDF documents cached by one test so mocks don't leak into the next."""
+    yield
+    from pdf_processing_tools import _open_doc
+    _open_doc.cache_clear()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
@@ -81,18 +89,34 @@ def event_loop():
 @pytest.fixture
 def mock_http_response():
     """Mock HTTP response for testing."""
+    class MockStreamReader:
+        def __init__(self, data):
+            self._data = data
+        
+        async def iter_chunked(self, n):
+            for i in range(0, len(self._data), n):
+                yield self._data[i:i + n]
+    
     class MockResponse:
-        def __init__(self, status=200, json_data=None, text_data=None):
+        def __init__(self, status=200, json_data=None, text_data=None, content_length=None):
             self.status = status
+            self.content_length = content_length
             self._json_data = json_data or {}
             self._text_data = text_data or ""
+            self.content = MockStreamReader(self._text_data.encode('utf-8'))
         
-        async def json(self):
+        async def json(self, loads=None):
             return self._json_data
         
         async def text(self):
             return self._text_data
         
+        async def read(self):
+            return self._text_data.encode('utf-8')
+        
+        def release(self):
+            pass
+        
         async def __aenter__(self):
             return self
         
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'semantic_scholar_tools'))
 from arxiv_client import ArxivClient
 from semantic_scholar_client import SemanticScholarClient
 from models import ArxivPaper, SemanticScholarPaper, SearchResult
+from config import Config
 
 
 class TestArxivClient:
@@ -24,6 +25,16 @@ class TestArxivClient:
         assert client.base_url == 'http://export.arxiv.org/api/query'
         assert hasattr(client, 'rate_limiter')
     
+    @pytest.mark.asyncio
+    async def test_session_reused_and_closed(self):
+        """Test that one HTTP session is shared and closed on exit."""
+        async with ArxivClient(debug=False) as client:
+            session = client._get_session()
+            assert client._get_session() is session
+        
+        assert session.closed
+        assert client._session is None
+    
     @pytest.mark.asyncio
     async def test_get_paper_by_id_success(self):
         """Test successful paper retrieval by ID."""
@@ -99,6 +110,119 @@ class TestArxivClient:
             assert papers[1].title == "Second Paper"
             mock_search.assert_called_once_with('machine learning', max_results=2)
     
+    @pytest.mark.asyncio
+    async def test_get_papers_by_ids_preserves_order(self, mock_http_response):
+        """Test batched ID lookup returns papers aligned with the requested IDs."""
+        client = ArxivClient(debug=False)
+        
+        xml_content = '''<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><id>http://arxiv.org/abs/2301.00002v1</id><title>Second</title></entry>
+            <entry><id>http://arxiv.org/abs/2301.00001v3</id><title>First</title></entry>
+        </feed>'''
+        
+        session = Mock()
+        session.get = AsyncMock(return_value=mock_http_response(text_data=xml_content))
+        
+        with patch.object(client, '_get_session', return_value=session):
+            papers = await client.get_papers_by_ids(['2301.00001', '2301.99999', 'arXiv:2301.00002v1'])
+        
+        assert [p.title if p else None for p in papers] == ['First', None, 'Second']
+        session.get.assert_called_once()
+        assert 'id_list=2301.00001,2301.99999,2301.00002v1' in session.get.call_args[0][0]
+    
+    @pytest.mark.asyncio
+    async def test_get_papers_by_ids_retries_rejected_batch_per_id(self, mock_http_response):
+        """Test that a batch rejected for one malformed ID still resolves the valid IDs."""
+        client = ArxivClient(debug=False)
+        
+        def respond(url):
+            if 'id_list=2301.00001,not-an-id,2301.00002' in url:
+                return mock_http_response(status=400)
+            for arxiv_id, title in (('2301.00001', 'First'), ('2301.00002', 'Second')):
+                if f'id_list={arxiv_id}' in url:
+                    return mock_http_response(text_data=(
+                        '<feed xmlns="http://www.w3.org/2005/Atom">'
+                        f'<entry><id>http://arxiv.org/abs/{arxiv_id}v1</id><title>{title}</title></entry>'
+                        '</feed>'
+                    ))
+            return mock_http_response(status=400)
+        
+        session = Mock()
+        session.get = AsyncMock(side_effect=respond)
+        
+        with patch.object(client, '_get_session', return_value=session), \
+             patch.object(client.rate_limiter, 'wait', new=AsyncMock()):
+            papers = await client.get_papers_by_ids(['2301.00001', 'not-an-id', '2301.00002'])
+        
+        assert [p.title if p else None for p in papers] == ['First', None, 'Second']
+        assert session.get.call_count == 1 + 3  # the rejected batch, then one query per ID
+    
+    @pytest.mark.asyncio
+    async def test_search_streams_entries_across_chunks(self, mock_http_response):
+        """Test that entries split across response chunks are parsed incrementally."""
+        client = ArxivClient(debug=False)
+        
+        xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><id>http://arxiv.org/abs/2301.00001v1</id><title>First</title></entry>
+            <entry><id>http://arxiv.org/abs/2301.00002v1</id><title>Second</title></entry>
+        </feed>'''
+        
+        session = Mock()
+        session.get = AsyncMock(return_value=mock_http_response(text_data=xml_content))
+        
+        with patch.object(client, '_get_session', return_value=session), \
+             patch('arxiv_client._STREAM_CHUNK_SIZE', 7):
+            papers = await client.search_papers('test')
+        
+        assert [p.arxiv_id for p in papers] == ['2301.00001', '2301.00002']
+    
+    @pytest.mark.asyncio
+    async def test_repeated_lookup_served_from_cache(self, mock_http_response):
+        """Test that an identical ArXiv query only hits the network once."""
+        client = ArxivClient(debug=False)
+        
+        xml_content = '''<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><id>http://arxiv.org/abs/2301.00001v1</id><title>Cached</title></entry>
+        </feed>'''
+        
+        session = Mock()
+        session.get = AsyncMock(return_value=mock_http_response(text_data=xml_content))
+        
+        with patch.object(client, '_get_session', return_value=session):
+            first = await client.get_paper_by_id('2301.00001')
+            second = await client.get_paper_by_id('2301.00001')
+        
+        assert first.title == second.title == 'Cached'
+        session.get.assert_called_once()
+    
+    def test_build_search_url_encodes_query(self):
+        """Test that search URLs join terms with AND and escape reserved characters."""
+        client = ArxivClient(debug=False)
+        
+        url = client._build_search_url('all:' + ' AND '.join('deep  learning & c++'.split()), 5, 'relevance', 'descending')
+        
+        assert 'search_query=all:deep+AND+learning+AND+%26+AND+c%2B%2B&' in url
+        assert url.endswith('max_results=5&sortBy=relevance&sortOrder=descending')
+    
+    @pytest.mark.asyncio
+    async def test_fetch_retries_service_unavailable(self, mock_http_response):
+        """Test that a 503 from ArXiv is released and retried."""
+        client = ArxivClient(debug=False)
+        
+        unavailable = mock_http_response(status=503)
+        unavailable.release = Mock()
+        session = Mock()
+        session.get = AsyncMock(side_effect=[unavailable, mock_http_response(text_data='<feed/>')])
+        
+        with patch.object(client, '_get_session', return_value=session), \
+             patch('utils.asyncio.sleep', new=AsyncMock()):
+            content = await client._fetch('http://export.arxiv.org/api/query?id_list=x')
+        
+        assert content == b'<feed/>'
+        assert session.get.call_count == 2
+        unavailable.release.assert_called_once()
+    
     def test_parse_arxiv_response_invalid_xml(self):
         """Test parsing invalid XML response."""
         client = ArxivClient(debug=False)
@@ -107,6 +231,35 @@ class TestArxivClient:
         result = client._parse_arxiv_response(invalid_xml)
         assert result is None
     
+    def test_parse_arxiv_search_response_accepts_bytes(self):
+        """Test that raw response bytes are parsed without decoding to str."""
+        client = ArxivClient(debug=False)
+        
+        xml_content = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            '<entry><id>http://arxiv.org/abs/2301.00001v1</id><title>Caf\u00e9</title></entry>'
+            '</feed>'
+        ).encode('utf-8')
+        
+        papers = client._parse_arxiv_search_response(xml_content)
+        assert [p.title for p in papers] == ['Caf\u00e9']
+    
+    def test_parse_entry_strips_version_from_id(self):
+        """Test that entry IDs are extracted without their version suffix."""
+        client = ArxivClient(debug=False)
+        
+        import xml.etree.ElementTree as ET
+        for id_url, expected in [
+            ('http://arxiv.org/abs/2301.12345v2', '2301.12345'),
+            ('http://arxiv.org/abs/cs/0301001v1', 'cs/0301001'),
+            ('http://arxiv.org/abs/2301.12345', '2301.12345'),
+        ]:
+            entry = ET.fromstring(
+                f'<entry xmlns="http://www.w3.org/2005/Atom"><id>{id_url}</id><title>T</title></entry>'
+            )
+            assert client._parse_entry(entry).arxiv_id == expected
+    
     def test_parse_entry_missing_fields(self):
         """Test parsing entry with missing fields."""
         client = ArxivClient(debug=False)
@@ -120,9 +273,8 @@ class TestArxivClient:
         '''
         
         entry = ET.fromstring(xml_content)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
         
-        paper = client._parse_entry(entry, ns)
+        paper = client._parse_entry(entry)
         assert paper is not None
         assert paper.title == "Minimal Paper"
         assert paper.authors == []
@@ -140,6 +292,35 @@ class TestSemanticScholarClient:
         assert hasattr(client, 'rate_limiter')
         assert hasattr(client, 'headers')
     
+    def test_each_event_loop_gets_its_own_session(self):
+        """Test that sessions and request slots are per loop and closed on the loop that made them."""
+        client = SemanticScholarClient(debug=False)
+        
+        async def current_session():
+            return client._loop_session()
+        
+        old_loop = asyncio.new_event_loop()
+        try:
+            old_session, old_slots = old_loop.run_until_complete(current_session())
+            
+            async def on_new_loop():
+                try:
+                    return await current_session()
+                finally:
+                    await client.close()
+            
+            new_session, new_slots = asyncio.run(on_new_loop())
+            
+            assert new_session is not old_session
+            assert new_slots is not old_slots
+            assert new_session.closed
+            # Closing on the new loop leaves the old loop's session to its own close()
+            assert not old_session.closed
+            old_loop.run_until_complete(client.close())
+            assert old_session.closed
+        finally:
+            old_loop.close()
+    
     @pytest.mark.asyncio
     async def test_get_paper_success(self):
         """Test successful paper retrieval."""
@@ -268,6 +449,103 @@ class TestSemanticScholarClient:
             assert search_result.papers[0].title == 'Search Result 1'
             mock_search.assert_called_once_with('machine learning')
     
+    @pytest.mark.asyncio
+    async def test_requests_share_one_session(self, mock_http_response):
+        """Test that requests reuse one keep-alive session until the client is closed."""
+        client = SemanticScholarClient(debug=False)
+        response = mock_http_response(json_data={'data': []})
+        
+        with patch('aiohttp.ClientSession.get', new=AsyncMock(return_value=response)), \
+             patch.object(client.rate_limiter, 'wait', new=AsyncMock()):
+            async with client:
+                await client.get_paper_authors('123456')
+                session = client._get_session()
+                await client.get_paper_authors('654321')
+                assert client._get_session() is session
+        
+        assert session.closed
+        assert asyncio.get_running_loop() not in client._loop_sessions
+    
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_served_from_cache(self, mock_http_response):
+        """Test that repeat paper lookups with the same fields skip the network."""
+        client = SemanticScholarClient(debug=False)
+        paper_data = {
+            'paperId': '123456', 'title': 'Cached Paper', 'abstract': None, 'authors': [],
+            'year': 2023, 'venue': None, 'url': None, 'externalIds': None,
+            'publicationTypes': None, 'publicationDate': None, 'journal': None
+        }
+        mock_get = AsyncMock(side_effect=lambda *args, **kwargs: mock_http_response(json_data=paper_data))
+        
+        with patch('aiohttp.ClientSession.get', new=mock_get), \
+             patch.object(client.rate_limiter, 'wait', new=AsyncMock()):
+            async with client:
+                first = await client.get_paper('123456')
+                second = await client.get_paper('123456')
+                assert mock_get.call_count == 1
+                assert second is not first and second.title == 'Cached Paper'
+                
+                await client.get_paper('123456', fields=['title'])
+                assert mock_get.call_count == 2
+                
+                # Callers with their own paper cache bypass the client's
+                await client.get_paper('123456', cache=False)
+                assert mock_get.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_bounded_by_pool_size(self, mock_http_response):
+        """Test that concurrent callers never have more requests in flight than pooled connections."""
+        client = SemanticScholarClient(debug=False)
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def fake_get(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_http_response(json_data={'data': []})
+        
+        with patch.object(Config, 'SEMANTIC_SCHOLAR_MAX_CONNECTIONS', 2), \
+             patch('aiohttp.ClientSession.get', new=AsyncMock(side_effect=fake_get)), \
+             patch.object(client.rate_limiter, 'wait', new=AsyncMock()):
+            async with client:
+                await asyncio.gather(*(client.get_paper_authors(str(i)) for i in range(5)))
+        
+        assert max_in_flight == 2
+    
+    @pytest.mark.asyncio
+    async def test_search_authors_with_papers(self, mock_http_response):
+        """Test that author search returns each author's papers from one request."""
+        paper_data = {
+            'paperId': 'paper1', 'title': 'Author Paper 1', 'abstract': None,
+            'authors': [], 'year': 2023, 'citationCount': 15, 'venue': None,
+            'url': None, 'externalIds': {}, 'publicationTypes': [],
+            'publicationDate': None, 'journal': None
+        }
+        response = mock_http_response(json_data={'data': [{
+            'authorId': 'author123',
+            'name': 'Test Author',
+            'aliases': None,
+            'affiliations': [],
+            'homepage': None,
+            'paperCount': 3,
+            'citationCount': 45,
+            'hIndex': 2,
+            'papers': [paper_data, dict(paper_data, paperId='paper2'), dict(paper_data, paperId='paper3')]
+        }]})
+        
+        with patch('aiohttp.ClientSession.get', new=AsyncMock(return_value=response)) as mock_get:
+            async with SemanticScholarClient(debug=False) as client:
+                results = await client.search_authors_with_papers('Test Author', limit=1, paper_limit=2)
+        
+        assert mock_get.call_count == 1
+        assert 'papers.title' in mock_get.call_args.kwargs['params']['fields']
+        author, papers = results[0]
+        assert author.author_id == 'author123'
+        assert [paper.paper_id for paper in papers] == ['paper1', 'paper2']
+    
     @pytest.mark.asyncio
     async def test_get_paper_bulk(self):
         """Test bulk paper retrieval."""
@@ -324,6 +602,30 @@ class TestSemanticScholarClient:
             assert papers[1].paper_id == 'bulk2'
             mock_bulk.assert_called_once_with(['bulk1', 'missing', 'bulk2'])
     
+    @pytest.mark.asyncio
+    async def test_get_paper_bulk_fetches_chunks_concurrently(self):
+        """Test that bulk chunks are requested together and combined in input order."""
+        client = SemanticScholarClient(debug=False)
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def fake_batch(chunk, fields=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if chunk == ['p3', 'p4']:
+                return None  # failed chunk is skipped
+            return [Mock(paper_id=pid) if pid != 'missing' else None for pid in chunk]
+        
+        with patch.object(Config, 'BATCH_SIZE', 2), \
+             patch.object(client, 'get_paper_batch', side_effect=fake_batch):
+            papers = await client.get_paper_bulk(['p1', 'missing', 'p3', 'p4', 'p5'])
+        
+        assert [paper.paper_id for paper in papers] == ['p1', 'p5']
+        assert max_in_flight == 3
+    
     @pytest.mark.asyncio
     async def test_analyze_paper_citations(self):
         """Test comprehensive citation analysis."""
@@ -386,7 +688,25 @@ class TestSemanticScholarClient:
             assert analysis['reference_count'] == 1
             assert len(analysis['recommendations']) == 1
             mock_analyze.assert_called_once_with('main123')
-
+    
+    
+    @pytest.mark.asyncio
+    async def test_analyze_paper_citations_writes_one_file(self):
+        """Test that the analysis is saved once and stamped with the time, not a file path."""
+        client = SemanticScholarClient(debug=False)
+        main_paper = Mock()
+        main_paper.to_dict.return_value = {'paper_id': 'main123'}
+        
+        with patch.object(client, 'get_paper', new=AsyncMock(return_value=main_paper)), \
+             patch.object(client, 'get_paper_citations', new=AsyncMock(return_value=[])), \
+             patch.object(client, 'get_paper_references', new=AsyncMock(return_value=[])), \
+             patch.object(client, 'get_paper_recommendations', new=AsyncMock(return_value=[])), \
+             patch('semantic_scholar_client.get_timestamp', return_value='2024-01-01 12:00:00'), \
+             patch('semantic_scholar_client.save_json_to_file') as mock_save:
+            analysis = await client.analyze_paper_citations('main123')
+        
+        assert analysis['analysis_timestamp'] == '2024-01-01 12:00:00'
+        mock_save.assert_called_once_with(analysis, 'comprehensive_analysis_main123.json')
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
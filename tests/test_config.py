@@ -103,6 +103,15 @@ class TestConfig:
         assert 'paperId' in citation_fields_str
         assert 'citationCount' in citation_fields_str
     
+    def test_fields_string_memoized(self):
+        """Test that field strings are cached until the field list is replaced."""
+        assert Config.get_paper_fields_string() is Config.get_paper_fields_string()
+        
+        with patch.object(Config, 'PAPER_FIELDS', ['paperId', 'title']):
+            assert Config.get_paper_fields_string() == 'paperId,title'
+        
+        assert Config.get_paper_fields_string() == ','.join(Config.PAPER_FIELDS)
+    
     def test_directory_paths(self):
         """Test directory path configuration."""
         assert isinstance(Config.BASE_DIR, Path)
@@ -126,6 +135,15 @@ class TestConfig:
             Config.ensure_directories()
         except Exception as e:
             pytest.fail(f"ensure_directories() raised an exception: {e}")
+    
+    def test_ensure_directories_runs_once(self):
+        """Test that directories are only created on the first call."""
+        Config.ensure_directories()
+        
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            Config.ensure_directories()
+        
+        mock_mkdir.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -39,6 +39,19 @@ from pdf_processing_tools import (
 )
 
 from service_tools import get_service_info
+from utils import PersistentCache
+import paper_analysis_tools
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_caches(tmp_path, monkeypatch):
+    """Keep cached papers from leaking between tests that mock the client differently."""
+    paper_analysis_tools._paper_cache.clear()
+    paper_analysis_tools._recommendation_cache.clear()
+    store = PersistentCache(tmp_path / 'papers.sqlite3')
+    monkeypatch.setattr(paper_analysis_tools, '_paper_store', store)
+    yield
+    store.close()
 
 
 class TestMCPServer:
@@ -168,11 +181,12 @@ class TestMCPServer:
             )
         ]
         
+        # The tool asks the client for raw dicts
         mock_search_result = SearchResult(
             total=1,
             offset=0,
             next_offset=None,
-            papers=mock_papers
+            papers=[paper.to_dict() for paper in mock_papers]
         )
         
         with patch('semantic_scholar_client.SemanticScholarClient.search_papers') as mock_search:
@@ -180,6 +194,7 @@ class TestMCPServer:
             
             result = await search_papers_by_keywords('machine learning', max_results=10)
             
+            assert mock_search.call_args.kwargs['raw'] == True
             assert 'papers' in result
             assert len(result['papers']) == 1
             assert result['papers'][0]['title'] == 'Machine Learning Paper'
@@ -216,9 +231,9 @@ class TestMCPServer:
             ]
         }
         
-        with patch('semantic_scholar_client.SemanticScholarClient.search_authors') as mock_search_authors:
+        with patch('semantic_scholar_client.SemanticScholarClient.search_authors_with_papers') as mock_search_authors:
             with patch('semantic_scholar_client.SemanticScholarClient.get_author_papers') as mock_author_papers:
-                # Mock author search result
+                # Mock author search result, with the author's papers in the same response
                 from models import AuthorInfo
                 mock_author = AuthorInfo(
                     name='Test Author', 
@@ -230,14 +245,13 @@ class TestMCPServer:
                     citation_count=200,
                     h_index=8
                 )
-                mock_search_authors.return_value = [mock_author]
-                
-                # Mock author papers
                 mock_papers = [SemanticScholarPaper.from_dict(mock_author_data['papers'][0])]
-                mock_author_papers.return_value = mock_papers
+                mock_search_authors.return_value = [(mock_author, mock_papers)]
                 
                 result = await search_papers_by_author('Test Author', max_results=10)
             
+            mock_search_authors.assert_called_once_with('Test Author', limit=1, paper_limit=10)
+            mock_author_papers.assert_not_called()
             assert 'author_info' in result
             assert 'papers' in result
             assert result['author_info']['name'] == 'Test Author'
@@ -281,6 +295,33 @@ class TestMCPServer:
             assert result['paper']['paper_id'] == 'details123'
             assert result['paper']['title'] == 'Detailed Paper'
             assert result['paper']['citation_count'] == 15
+            
+            with patch('semantic_scholar_client.SemanticScholarClient.get_paper_citations') as mock_citations, \
+                 patch('semantic_scholar_client.SemanticScholarClient.get_paper_references') as mock_references:
+                mock_citations.return_value = [mock_paper]
+                mock_references.side_effect = RuntimeError('references unavailable')
+                
+                result = await get_paper_details('details123', include_citations=True, include_references=True)
+            
+            assert result['success'] == True
+            assert result['citation_count'] == 1
+            assert result['citations'][0]['paper_id'] == 'details123'
+            assert result['references_error'] == 'references unavailable'
+            assert 'references' not in result
+    
+    @pytest.mark.asyncio
+    async def test_paper_lookups_are_cached_by_normalized_id(self):
+        """Test that repeated lookups of the same paper reuse the cached result."""
+        with patch('semantic_scholar_client.SemanticScholarClient.get_paper') as mock_get:
+            mock_get.return_value = None
+            
+            first = await get_paper_details('https://arxiv.org/abs/2301.12345')
+            second = await get_paper_details('2301.12345')
+            
+            assert first['success'] == False
+            assert second['success'] == False
+            # The shared entry was fetched with the same normalized ID it is keyed by
+            mock_get.assert_called_once_with('2301.12345', cache=False)
     
     @pytest.mark.asyncio
     async def test_get_arxiv_paper(self):
@@ -515,10 +556,12 @@ class TestMCPServer:
         ]
         
         with patch('semantic_scholar_client.SemanticScholarClient.get_paper_recommendations') as mock_rec:
-            mock_rec.return_value = mock_recommendations
+            # The tool asks the client for raw dicts
+            mock_rec.return_value = [paper.to_dict() for paper in mock_recommendations]
             
             result = await get_paper_recommendations('base123', max_results=5)
             
+            assert mock_rec.call_args.kwargs['raw'] == True
             assert 'recommendations' in result
             assert len(result['recommendations']) == 1
             assert result['recommendations'][0]['title'] == 'Recommended Paper 1'
@@ -565,38 +608,226 @@ class TestMCPServer:
             assert 'Requirement-Based Literature Review' in result['filepath']
             assert 'Multi-turn reinforcement learning' in result['filepath']
     
+    @pytest.mark.asyncio
+    async def test_create_requirement_based_review_fetches_concurrently(self):
+        """Test that paper lookups overlap and failed lookups are skipped."""
+        paper = SemanticScholarPaper(
+            paper_id='ok1',
+            title='Found Paper',
+            abstract=None,
+            authors=[],
+            year=2023,
+            citation_count=0,
+            reference_count=0,
+            influential_citation_count=0,
+            venue=None,
+            url=None,
+            arxiv_id=None,
+            doi=None,
+            corpus_id=None,
+            external_ids={},
+            publication_types=[],
+            publication_date=None,
+            journal=None
+        )
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def fake_get_paper(paper_id, cache=True):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if paper_id == 'boom':
+                raise RuntimeError('upstream failure')
+            return paper if paper_id == 'ok1' else None
+        
+        with patch('paper_manager.PaperManager.create_requirement_based_review') as mock_create:
+            mock_create.return_value = 'review.md'
+            
+            # A failed /paper/batch request falls back to individual lookups
+            with patch('semantic_scholar_client.SemanticScholarClient.get_paper_batch', return_value=None), \
+                 patch('semantic_scholar_client.SemanticScholarClient.get_paper', side_effect=fake_get_paper):
+                result = await create_requirement_based_review(['ok1', 'missing', 'boom'], ['req'])
+            
+            assert result['success'] == True
+            assert result['papers_analyzed'] == 1
+            assert max_in_flight == 3
+            assert mock_create.call_args[0][0] == [paper]
+    
+    @pytest.mark.asyncio
+    async def test_paper_lookup_reuses_disk_cache(self):
+        """Test that papers stored on disk are served after the memory cache is cleared."""
+        paper = SemanticScholarPaper(
+            paper_id='ok1',
+            title='Found Paper',
+            abstract=None,
+            authors=[],
+            year=2023,
+            citation_count=0,
+            reference_count=0,
+            influential_citation_count=0,
+            venue=None,
+            url=None,
+            arxiv_id=None,
+            doi=None,
+            corpus_id=None,
+            external_ids={},
+            publication_types=[],
+            publication_date=None,
+            journal=None
+        )
+        
+        with patch('semantic_scholar_client.SemanticScholarClient.get_paper') as mock_get:
+            mock_get.return_value = paper
+            assert await paper_analysis_tools._cached_get_paper('ok1') == paper
+            
+            # Simulate a restart: the in-memory cache is empty, the disk store is not
+            paper_analysis_tools._paper_cache.clear()
+            assert await paper_analysis_tools._cached_get_paper('ok1') == paper
+            
+            mock_get.assert_called_once_with('ok1', cache=False)
+    
+    @pytest.mark.asyncio
+    async def test_create_requirement_based_review_batches_lookups(self):
+        """Test that concurrent paper lookups share one /paper/batch request."""
+        paper = SemanticScholarPaper(
+            paper_id='ok1',
+            title='Found Paper',
+            abstract=None,
+            authors=[],
+            year=2023,
+            citation_count=0,
+            reference_count=0,
+            influential_citation_count=0,
+            venue=None,
+            url=None,
+            arxiv_id=None,
+            doi=None,
+            corpus_id=None,
+            external_ids={},
+            publication_types=[],
+            publication_date=None,
+            journal=None
+        )
+        
+        with patch('paper_manager.PaperManager.create_requirement_based_review') as mock_create:
+            mock_create.return_value = 'review.md'
+            
+            with patch('semantic_scholar_client.SemanticScholarClient.get_paper_batch') as mock_batch, \
+                 patch('semantic_scholar_client.SemanticScholarClient.get_paper') as mock_get:
+                mock_batch.return_value = [paper, None]
+                result = await create_requirement_based_review(['ok1', 'missing'], ['req'])
+            
+            assert result['success'] == True
+            assert result['papers_analyzed'] == 1
+            mock_batch.assert_called_once_with(['ok1', 'missing'])
+            mock_get.assert_not_called()
+            assert mock_create.call_args[0][0] == [paper]
+    
     # ===== PDF Processing Tests =====
     
     @pytest.mark.asyncio
-    async def test_download_arxiv_pdf(self):
+    async def test_download_arxiv_pdf(self, mock_http_response):
         """Test ArXiv PDF download tool."""
         # Mock successful download
-        mock_response = Mock()
-        mock_response.status = 200
-        mock_response.read.return_value = b'fake pdf content'
+        mock_response = mock_http_response(200, text_data='fake pdf content')
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
         
-        with patch('urllib.request.urlopen') as mock_urlopen:
+        with patch('pdf_processing_tools._get_download_session', return_value=mock_session):
             with patch('os.path.getsize') as mock_getsize:
                 with patch('pathlib.Path.mkdir') as mock_mkdir:
-                    with patch('builtins.open', mock_open()) as mock_file:
-                        mock_urlopen.return_value.__enter__.return_value = mock_response
-                        mock_getsize.return_value = 1024000  # 1MB
-                        
+                    with patch('builtins.open', mock_open()) as mock_file, patch('os.replace') as mock_replace:
                         result = await download_arxiv_pdf('2301.07041')
                         
                         assert result['success'] == True
+                        # The body goes to a temporary file that is moved into place once complete
+                        mock_file.assert_called_once_with(Path('downloads/2301.07041.pdf.part'), 'wb')
+                        mock_replace.assert_called_once_with(
+                            Path('downloads/2301.07041.pdf.part'), Path('downloads/2301.07041.pdf')
+                        )
                         assert result['arxiv_id'] == '2301.07041'
-                        assert result['file_size_mb'] == 0.98
+                        # The size comes from the bytes written, not a stat() of the file
+                        assert result['file_size_bytes'] == len(b'fake pdf content')
+                        mock_getsize.assert_not_called()
+                        mock_file().write.assert_called_once_with(b'fake pdf content')
+                        mock_session.get.assert_called_once_with('https://arxiv.org/pdf/2301.07041.pdf')
                         assert 'local_path' in result
     
     @pytest.mark.asyncio
-    async def test_download_arxiv_pdf_not_found(self):
+    async def test_download_arxiv_pdf_checks_content_length(self, mock_http_response, tmp_path):
+        """Test that downloads of known size are preallocated and truncated bodies are discarded."""
+        mock_session = Mock()
+        mock_session.get.return_value = mock_http_response(200, text_data='fake pdf content', content_length=16)
+        
+        with patch('pdf_processing_tools._get_download_session', return_value=mock_session):
+            result = await download_arxiv_pdf('2301.07041', download_dir=str(tmp_path))
+        
+        assert result['success'] == True
+        assert result['file_size_bytes'] == 16
+        assert (tmp_path / '2301.07041.pdf').read_bytes() == b'fake pdf content'
+        
+        mock_session.get.return_value = mock_http_response(200, text_data='fake pdf', content_length=16)
+        with patch('pdf_processing_tools._get_download_session', return_value=mock_session):
+            result = await download_arxiv_pdf('2301.07042', download_dir=str(tmp_path))
+        
+        assert result['success'] == False
+        assert 'received 8 of 16 bytes' in result['error']
+        assert not (tmp_path / '2301.07042.pdf').exists()
+        assert not (tmp_path / '2301.07042.pdf.part').exists()
+    
+    @pytest.mark.asyncio
+    async def test_download_arxiv_pdf_interrupted_stream_leaves_no_file(self, mock_http_response, tmp_path):
+        """Test that a body cut off mid-stream leaves neither a partial PDF nor a temporary file."""
+        import aiohttp
+        
+        existing = tmp_path / '2301.07041.pdf'
+        existing.write_bytes(b'previous complete pdf')
+        
+        async def broken_stream(n):
+            yield b'x' * 1000
+            raise aiohttp.ClientPayloadError('Response payload is not completed')
+        
+        response = mock_http_response(200, content_length=100000)
+        response.content.iter_chunked = broken_stream
+        mock_session = Mock()
+        mock_session.get.return_value = response
+        
+        with patch('pdf_processing_tools._get_download_session', return_value=mock_session):
+            result = await download_arxiv_pdf('2301.07041', download_dir=str(tmp_path))
+        
+        assert result['success'] == False
+        assert 'not completed' in result['error']
+        # The earlier copy is untouched and no partial file is left behind
+        assert existing.read_bytes() == b'previous complete pdf'
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['2301.07041.pdf']
+    
+    @pytest.mark.asyncio
+    async def test_download_session_is_reused_until_closed(self):
+        """Test that PDF downloads share one HTTP session per event loop."""
+        from pdf_processing_tools import _get_download_session, close_download_session
+        
+        session = _get_download_session()
+        try:
+            assert _get_download_session() is session
+        finally:
+            await close_download_session()
+        assert session.closed
+        
+        new_session = _get_download_session()
+        assert new_session is not session
+        await close_download_session()
+    
+    @pytest.mark.asyncio
+    async def test_download_arxiv_pdf_not_found(self, mock_http_response):
         """Test ArXiv PDF download with 404 error."""
-        from urllib.error import HTTPError
+        mock_session = Mock()
+        mock_session.get.return_value = mock_http_response(404)
         
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_urlopen.side_effect = HTTPError(None, 404, 'Not Found', None, None)
-            
+        with patch('pdf_processing_tools._get_download_session', return_value=mock_session), \
+             patch('pathlib.Path.mkdir'):
             result = await download_arxiv_pdf('invalid_id')
             
             assert result['success'] == False
@@ -613,8 +844,8 @@ class TestMCPServer:
         mock_reader = Mock()
         mock_reader.pages = [mock_page]
         
-        with patch('pdf_processing_tools.PdfReader') as mock_pdf_reader:
-            with patch('os.path.exists') as mock_exists:
+        with patch('pdf_processing_tools.fitz', None), patch('pdf_processing_tools.PdfReader') as mock_pdf_reader:
+            with patch('os.path.exists') as mock_exists, patch('os.path.getmtime', return_value=0.0):
                 mock_pdf_reader.return_value = mock_reader
                 mock_exists.return_value = True
                 
@@ -625,6 +856,117 @@ class TestMCPServer:
                 assert result['word_count'] == 9  # "This is page 1 content." has 9 words
                 assert 'This is page 1 content.' in result['text_content']
     
+    @pytest.mark.asyncio
+    async def test_extract_pdf_text_with_pymupdf(self):
+        """Test that PyMuPDF is preferred for text extraction when installed."""
+        pages = {0: 'First page.', 1: '', 2: 'Third page.'}
+        mock_doc = Mock()
+        mock_doc.page_count = 3
+        mock_doc.load_page.side_effect = lambda i: Mock(get_text=Mock(return_value=pages[i]))
+        mock_fitz = Mock()
+        mock_fitz.open.return_value = mock_doc
+        
+        with patch('pdf_processing_tools.fitz', mock_fitz), patch('pdf_processing_tools.PdfReader') as mock_pdf_reader:
+            with patch('os.path.exists', return_value=True), patch('os.path.getmtime', return_value=0.0):
+                result = await extract_pdf_text('/fake/path/test.pdf', start_page=1)
+        
+        mock_pdf_reader.assert_not_called()
+        mock_fitz.open.assert_called_once_with('/fake/path/test.pdf')
+        assert result['total_pages'] == 3
+        assert result['extracted_pages'] == 2
+        assert result['text_content'] == '--- Page 3 ---\nThird page.'
+    
+    def test_extract_pages_splits_large_ranges_across_workers(self):
+        """Test that large page ranges are extracted in contiguous chunks and keep page order."""
+        from concurrent.futures import ThreadPoolExecutor
+        from pdf_processing_tools import _extract_pages
+        
+        mock_doc = Mock()
+        mock_doc.page_count = 300
+        mock_doc.load_page.side_effect = lambda i: Mock(get_text=Mock(return_value=f'page {i + 1}'))
+        mock_fitz = Mock()
+        mock_fitz.open.return_value = mock_doc
+        
+        # Threads stand in for processes so the mocked document is shared
+        with ThreadPoolExecutor(max_workers=4) as pool, \
+             patch('pdf_processing_tools.fitz', mock_fitz), \
+             patch('pdf_processing_tools._get_pdf_pool', return_value=pool), \
+             patch('os.path.getmtime', return_value=0.0):
+            total_pages, pages = _extract_pages('/fake/path/test.pdf', 2, 201, num_workers=4)
+        
+        assert total_pages == 300
+        assert pages == [(i, f'page {i}') for i in range(3, 203)]
+        assert mock_fitz.open.call_count == 1 + 4  # page count, then once per chunk
+    
+    def test_extract_pages_falls_back_in_process_when_pool_fails(self):
+        """Test that a failing extraction pool is discarded and pages are read in-process."""
+        from concurrent.futures.process import BrokenProcessPool
+        from pdf_processing_tools import _extract_pages
+        
+        mock_doc = Mock()
+        mock_doc.page_count = 300
+        mock_doc.load_page.side_effect = lambda i: Mock(get_text=Mock(return_value=f'page {i + 1}'))
+        mock_fitz = Mock()
+        mock_fitz.open.return_value = mock_doc
+        mock_pool = Mock()
+        mock_pool.map.side_effect = BrokenProcessPool('worker died')
+        
+        with patch('pdf_processing_tools.fitz', mock_fitz), \
+             patch('pdf_processing_tools._get_pdf_pool', return_value=mock_pool), \
+             patch('pdf_processing_tools.close_pdf_pool') as mock_close_pool, \
+             patch('os.path.getmtime', return_value=0.0):
+            total_pages, pages = _extract_pages('/fake/path/test.pdf', 2, 201, num_workers=4)
+        
+        assert total_pages == 300
+        assert pages == [(i, f'page {i}') for i in range(3, 203)]
+        assert mock_fitz.open.call_count == 1  # the cached document served the fallback
+        mock_close_pool.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_parsed_pdf_shared_until_file_changes(self):
+        """Test that extract and convert share one parsed document per file version."""
+        mock_page = Mock()
+        mock_page.extract_text.return_value = 'Shared page text.'
+        mock_reader = Mock()
+        mock_reader.pages = [mock_page]
+        
+        with patch('pdf_processing_tools.fitz', None), \
+             patch('pdf_processing_tools.PdfReader', return_value=mock_reader) as mock_pdf_reader, \
+             patch('os.path.exists', return_value=True), \
+             patch('os.path.getmtime', return_value=1.0) as mock_getmtime, \
+             patch('builtins.open', mock_open()), \
+             patch('os.path.getsize', return_value=17):
+            await extract_pdf_text('/fake/path/test.pdf')
+            await convert_pdf_to_text('/fake/path/test.pdf')
+            assert mock_pdf_reader.call_count == 1
+            
+            # A rewritten file gets a fresh parse
+            mock_getmtime.return_value = 2.0
+            result = await extract_pdf_text('/fake/path/test.pdf')
+            assert mock_pdf_reader.call_count == 2
+        
+        assert result['text_content'] == '--- Page 1 ---\nShared page text.'
+    
+    @pytest.mark.asyncio
+    async def test_extract_pdf_text_save_to(self, tmp_path):
+        """Test that extracted text can be written to a file in the same pass."""
+        mock_page = Mock()
+        mock_page.extract_text.return_value = 'Saved page text.'
+        mock_reader = Mock()
+        mock_reader.pages = [mock_page]
+        output = tmp_path / 'out' / 'paper.txt'
+        
+        with patch('pdf_processing_tools.fitz', None), \
+             patch('pdf_processing_tools.PdfReader', return_value=mock_reader), \
+             patch('os.path.exists', return_value=True), \
+             patch('os.path.getmtime', return_value=0.0):
+            result = await extract_pdf_text('/fake/path/test.pdf', save_to=str(output))
+        
+        assert result['success'] == True
+        assert output.read_text(encoding='utf-8') == result['text_content']
+        assert result['output_path'] == str(output)
+        assert result['output_file_size_bytes'] == output.stat().st_size
+    
     @pytest.mark.asyncio
     async def test_extract_pdf_text_no_pypdf(self):
         """Test PDF text extraction when pypdf is not available."""
@@ -656,11 +998,11 @@ class TestMCPServer:
         mock_reader = Mock()
         mock_reader.pages = [mock_page]
         
-        with patch('pdf_processing_tools.PdfReader') as mock_pdf_reader:
+        with patch('pdf_processing_tools.fitz', None), patch('pdf_processing_tools.PdfReader') as mock_pdf_reader:
             with patch('os.path.exists') as mock_exists:
                 with patch('pathlib.Path.mkdir') as mock_mkdir:
                     with patch('builtins.open', mock_open()) as mock_file:
-                        with patch('os.path.getsize') as mock_getsize:
+                        with patch('os.path.getsize') as mock_getsize, patch('os.path.getmtime', return_value=0.0):
                             mock_pdf_reader.return_value = mock_reader
                             mock_exists.return_value = True
                             mock_getsize.return_value = 512
@@ -673,6 +1015,28 @@ class TestMCPServer:
                             assert result['output_file_size_bytes'] == 512
                             assert 'output_path' in result
     
+    @pytest.mark.asyncio
+    async def test_convert_pdf_to_text_uses_pdftotext(self, tmp_path):
+        """Test that whole-document conversions without page markers go through pdftotext."""
+        output = tmp_path / 'paper.txt'
+        
+        async def fake_pdftotext(*args, **kwargs):
+            Path(args[-1]).write_text('First page\fSecond page text\f', encoding='utf-8')
+            return Mock(wait=AsyncMock(return_value=0))
+        
+        with patch('pdf_processing_tools._PDFTOTEXT', '/usr/bin/pdftotext'), \
+             patch('pdf_processing_tools.PdfReader') as mock_pdf_reader, \
+             patch('os.path.exists', return_value=True), \
+             patch('asyncio.create_subprocess_exec', side_effect=fake_pdftotext) as mock_exec:
+            result = await convert_pdf_to_text('/fake/path/test.pdf', str(output), include_page_numbers=False)
+        
+        mock_pdf_reader.assert_not_called()
+        assert mock_exec.call_args.args[:3] == ('/usr/bin/pdftotext', '-enc', 'UTF-8')
+        assert result['success'] == True
+        assert result['total_pages'] == 2
+        assert result['word_count'] == 5
+        assert result['output_file_size_bytes'] == output.stat().st_size
+    
     @pytest.mark.asyncio
     async def test_process_arxiv_paper(self):
         """Test one-stop ArXiv paper processing tool."""
@@ -684,18 +1048,13 @@ class TestMCPServer:
             'file_size_mb': 1.5
         }
         
-        # Mock text extraction result
+        # Mock text extraction result, saved to the text file in the same pass
         mock_text_result = {
             'success': True,
             'total_pages': 10,
             'word_count': 5000,
             'character_count': 30000,
-            'text_content': 'Extracted paper content...'
-        }
-        
-        # Mock text conversion result
-        mock_convert_result = {
-            'success': True,
+            'text_content': 'Extracted paper content...',
             'output_path': '/fake/path/2301.07041.txt',
             'output_file_size_bytes': 25000
         }
@@ -706,7 +1065,6 @@ class TestMCPServer:
                     with patch('pdf_processing_tools.PdfReader') as mock_pdf_reader:
                         mock_download.return_value = mock_download_result
                         mock_extract.return_value = mock_text_result
-                        mock_convert.return_value = mock_convert_result
                         mock_pdf_reader.return_value = True  # Simulate pypdf available
                         
                         result = await process_arxiv_paper('2301.07041')
@@ -718,6 +1076,12 @@ class TestMCPServer:
                         assert result['text_file_saved'] == True
                         assert result['total_pages'] == 10
                         assert result['word_count'] == 5000
+                        assert result['text_file_path'] == '/fake/path/2301.07041.txt'
+                        assert result['text_file_size_bytes'] == 25000
+                        # The PDF is parsed once: extraction also writes the text file
+                        mock_extract.assert_called_once()
+                        assert mock_extract.call_args.kwargs['save_to'] == '/fake/path/2301.07041.txt'
+                        mock_convert.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_process_arxiv_paper_download_failed(self):
@@ -35,6 +35,22 @@ class TestArxivPaper:
         assert paper.arxiv_id == "2301.12345"
         assert "cs.AI" in paper.categories
     
+    def test_arxiv_paper_uses_slots(self):
+        """Test that ArxivPaper instances carry no per-instance __dict__."""
+        paper = ArxivPaper(
+            title="Test Paper",
+            authors=["Author One"],
+            abstract="Test abstract",
+            arxiv_id="2301.12345",
+            published_date="2023-01-01",
+            pdf_url="https://arxiv.org/pdf/2301.12345.pdf",
+            categories=["cs.AI"]
+        )
+        
+        assert not hasattr(paper, '__dict__')
+        with pytest.raises(AttributeError):
+            paper.unknown_attribute = 1
+    
     def test_arxiv_paper_to_dict(self):
         """Test converting ArxivPaper to dictionary."""
         paper = ArxivPaper(
@@ -178,6 +194,32 @@ class TestSemanticScholarPaper:
         assert reconstructed_paper.paper_id == original_paper.paper_id
         assert reconstructed_paper.title == original_paper.title
         assert reconstructed_paper.citation_count == original_paper.citation_count
+    
+    def test_dict_from_api_matches_model_round_trip(self):
+        """Test that dict_from_api gives the same dict as from_dict().to_dict()."""
+        api_data = {
+            'paperId': '123456',
+            'title': 'Test Paper',
+            'abstract': None,
+            'authors': [{'name': 'Author One', 'authorId': '1'}],
+            'year': 2023,
+            'citationCount': 10,
+            'venue': '',
+            'url': 'https://example.com/paper',
+            'externalIds': {'DOI': '10.1/abc'},
+            'publicationTypes': None,
+            'publicationDate': None,
+            'journal': None,
+            'tldr': {'text': 'Short summary'},
+            'fieldsOfStudy': ['Computer Science']
+        }
+        
+        expected = SemanticScholarPaper.from_dict(api_data).to_dict()
+        assert SemanticScholarPaper.dict_from_api(api_data) == expected
+        assert list(SemanticScholarPaper.dict_from_api(api_data)) == list(expected)
+        
+        with pytest.raises(TypeError):
+            SemanticScholarPaper.dict_from_api({'paperId': '123456', 'title': 'Test Paper'})
 
 
 class TestAuthorInfo:
@@ -220,6 +262,23 @@ class TestAuthorInfo:
         assert reconstructed.author_id == author.author_id
         assert reconstructed.name == author.name
         assert reconstructed.paper_count == author.paper_count
+    
+    def test_author_info_from_api_dict_ignores_unknown_fields(self):
+        """Test that API payload keys outside the model are dropped."""
+        author = AuthorInfo.from_dict({
+            'authorId': 'author123',
+            'name': 'Test Author',
+            'aliases': None,
+            'affiliations': None,
+            'homepage': None,
+            'paperCount': 50,
+            'citationCount': 1000,
+            'hIndex': 15,
+            'papers': [{'paperId': 'p1'}]
+        })
+        
+        assert author.author_id == 'author123'
+        assert author.h_index == 15
 
 
 class TestCitationAnalysisResult:
@@ -317,6 +376,10 @@ class TestCitationAnalysisResult:
         assert 'main_paper' in result_dict
         assert 'citing_papers' in result_dict
         assert 'total_citations' in result_dict
+        assert result_dict['main_paper']['title'] == "Main Paper"
+        assert result_dict['main_paper']['authors'] == [{"name": "Main Author", "authorId": "1"}]
+        assert result_dict['main_paper'] == main_paper.to_dict()
+        assert result_dict['citing_papers'] == []
         
         json_str = result.to_json()
         assert isinstance(json_str, str)
@@ -1,5 +1,6 @@
 """Tests for paper manager functionality."""
 
+import os
 import pytest
 import tempfile
 import shutil
@@ -10,7 +11,7 @@ from unittest.mock import Mock, patch, mock_open
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / 'semantic_scholar_tools'))
 
-from paper_manager import PaperManager
+from paper_manager import PaperManager, _requirement_matcher
 from models import ArxivPaper, SemanticScholarPaper, AuthorInfo
 from config import Config
 
@@ -115,8 +116,8 @@ class TestPaperManager:
         assert "cs.AI" in markdown
         assert "This is an ArXiv test abstract." in markdown
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_save_paper_to_markdown(self, mock_file):
+    @patch.object(Path, 'write_bytes')
+    def test_save_paper_to_markdown(self, mock_write):
         """Test saving paper to markdown file."""
         # Create test paper
         paper = SemanticScholarPaper(
@@ -142,16 +143,124 @@ class TestPaperManager:
         result = self.manager.save_paper_to_markdown(paper, "ML")
         
         # Check if file was "written"
-        mock_file.assert_called_once()
+        mock_write.assert_called_once()
+        assert mock_write.call_args.args[0].startswith(b"# Test Save Paper")
         assert ".md" in result
         assert "ML" in result
     
+    @pytest.mark.asyncio
+    async def test_save_papers_to_markdown(self):
+        """Test saving a mixed batch of papers concurrently."""
+        self.manager.md_files_dir = Path(self.temp_dir)
+        s2_paper = SemanticScholarPaper.from_dict({
+            'paperId': 's2-1',
+            'title': 'Batch Saved Paper',
+            'abstract': 'Abstract.',
+            'authors': [{'name': 'Test Author', 'authorId': '1'}],
+            'year': 2023,
+            'citationCount': 0,
+            'referenceCount': 0,
+            'influentialCitationCount': 0,
+            'venue': '',
+            'url': None,
+            'externalIds': {},
+            'publicationTypes': [],
+            'publicationDate': None,
+            'journal': None,
+        })
+        arxiv_paper = ArxivPaper(
+            title="Batch Saved ArXiv Paper",
+            authors=["Test Author"],
+            abstract="Abstract.",
+            arxiv_id="2301.00002",
+            published_date="2023-01-01",
+            pdf_url="https://arxiv.org/pdf/2301.00002.pdf",
+            categories=["cs.LG"]
+        )
+        
+        paths = await self.manager.save_papers_to_markdown([s2_paper, arxiv_paper], "batch")
+        
+        assert [Path(p).name for p in paths] == ['Batch Saved Paper.md', 'Batch Saved ArXiv Paper.md']
+        assert "**ArXiv ID**: 2301.00002" in Path(paths[1]).read_text(encoding='utf-8')
+    
     def test_search_papers_by_keyword(self):
         """Test searching papers by keyword."""
         # This method exists in PaperManager
         result = self.manager.search_papers_by_keyword("machine learning")
         assert isinstance(result, list)
     
+    def test_search_papers_by_keyword_tracks_file_changes(self):
+        """Test substring matching and that edited or deleted files are re-indexed."""
+        self.manager.md_files_dir = Path(self.temp_dir)
+        topic_dir = Path(self.temp_dir) / 'rl'
+        topic_dir.mkdir()
+        first = topic_dir / 'first.md'
+        second = topic_dir / 'second.md'
+        first.write_text('# Multi-turn Reinforcement Learning\n', encoding='utf-8')
+        second.write_text('# Vision Transformers\n', encoding='utf-8')
+        
+        def search(keyword):
+            return sorted(p['filename'] for p in self.manager.search_papers_by_keyword(keyword))
+        
+        assert search('reinforcement learning') == ['first.md']
+        assert search('inforce') == ['first.md']  # partial words still match
+        assert search('turn reinforcement lea') == ['first.md']
+        assert search('transformers') == ['second.md']
+        assert search('#') == ['first.md', 'second.md']
+        
+        second.write_text('# Reinforcement Learning from Human Feedback\n', encoding='utf-8')
+        os.utime(second, ns=(0, 0))  # force a different mtime even on coarse clocks
+        assert search('reinforcement learning') == ['first.md', 'second.md']
+        assert search('transformers') == []
+        
+        first.unlink()
+        assert search('reinforcement learning') == ['second.md']
+    
+    def test_saved_paper_is_indexed_without_rereading(self):
+        """Test that saving a paper updates the search index directly."""
+        self.manager.md_files_dir = Path(self.temp_dir)
+        paper = ArxivPaper(
+            title="Sparse Mixture of Experts",
+            authors=["Test Author"],
+            abstract="Routing tokens to experts.",
+            arxiv_id="2301.00001",
+            published_date="2023-01-01",
+            pdf_url="https://arxiv.org/pdf/2301.00001.pdf",
+            categories=["cs.LG"]
+        )
+        self.manager.save_arxiv_paper_to_markdown(paper, "moe")
+        
+        with patch('builtins.open', side_effect=AssertionError("file re-read")):
+            result = self.manager.search_papers_by_keyword("mixture of experts")
+        
+        assert [p['topic'] for p in result] == ['moe']
+    
+    def test_directory_listings_are_cached_until_mtime_changes(self):
+        """Test that unchanged directories are not listed again."""
+        self.manager.md_files_dir = Path(self.temp_dir)
+        topic_dir = Path(self.temp_dir) / 'nlp'
+        topic_dir.mkdir()
+        (topic_dir / 'a.md').write_text('# A\n', encoding='utf-8')
+        for directory in (topic_dir, Path(self.temp_dir)):
+            os.utime(directory, ns=(10**18, 10**18))  # well outside the racy window
+        
+        assert self.manager.get_paper_statistics()['papers_by_topic'] == {'nlp': 1}
+        with patch('paper_manager.os.scandir', side_effect=AssertionError("relisted")):
+            assert self.manager.organize_papers_by_topic() == {'nlp': ['a.md']}
+        
+        (topic_dir / 'b.md').write_text('# B\n', encoding='utf-8')
+        os.utime(topic_dir, ns=(10**18 + 1, 10**18 + 1))
+        assert sorted(self.manager.organize_papers_by_topic()['nlp']) == ['a.md', 'b.md']
+    
+    def test_requirement_matcher(self):
+        """Test that a requirement matches when any of its words is a substring."""
+        texts = ['deep reinforcement learning', 'graph neural networks', 'unrelated']
+        requirements = ['Reinforcement agents', 'neural OR learning', '']
+        
+        match = _requirement_matcher(requirements)
+        assert [match(text) for text in texts] == [{0, 1}, {1}, set()]
+        assert _requirement_matcher([])('anything') == set()
+    
     def test_organize_papers_by_topic(self):
         """Test organizing papers by topic."""
         # This method returns existing papers organized by topic
@@ -179,6 +288,14 @@ class TestPaperManager:
         assert isinstance(stats["papers_by_topic"], dict)
         assert isinstance(stats["topics"], list)
     
+    def test_get_paper_statistics_from_organization(self):
+        """Test that statistics can be derived from an existing organization without rescanning."""
+        organized = {'nlp': ['a.md', 'b.md'], 'cv': []}
+        with patch.object(PaperManager, '_scan_tree', side_effect=AssertionError("rescanned")):
+            stats = self.manager.get_paper_statistics(organized)
+        
+        assert stats == {'total_papers': 2, 'papers_by_topic': {'nlp': 2, 'cv': 0}, 'topics': ['nlp', 'cv']}
+    
     def test_generate_literature_review(self):
         """Test literature review generation."""
         # Test with a topic and requirements
@@ -192,6 +309,27 @@ class TestPaperManager:
         assert isinstance(result, str)
         assert ".md" in result or "No papers found" in result or "does not exist" in result
     
+    def test_generate_literature_review_reuses_parsed_papers(self):
+        """Test that unchanged papers are not re-read for a second review."""
+        self.manager.md_files_dir = Path(self.temp_dir)
+        topic_dir = Path(self.temp_dir) / 'rl'
+        topic_dir.mkdir()
+        paper_file = topic_dir / 'paper.md'
+        paper_file.write_text('# Deep RL\n- **ArXiv**: https://arxiv.org/abs/2301.00001\n', encoding='utf-8')
+        
+        self.manager.generate_literature_review('rl', ['deep'], 'first.md')
+        with patch('builtins.open', side_effect=AssertionError("file re-read")):
+            second = self.manager.generate_literature_review('rl', ['deep'], 'second.md')
+        review = Path(second).read_text(encoding='utf-8')
+        assert "#### Deep RL\n" in review
+        assert "https://arxiv.org/abs/2301.00001`" in review
+        
+        paper_file.write_text('# Graph Networks\n', encoding='utf-8')
+        os.utime(paper_file, ns=(0, 0))
+        third = Path(self.manager.generate_literature_review('rl', ['deep'], 'third.md')).read_text(encoding='utf-8')
+        assert "- Graph Networks" in third
+        assert "No papers found matching this requirement." in third
+    
     # Removed test_search_papers_in_collection as this method doesn't exist
     
     def test_create_requirement_based_review(self):
@@ -2,7 +2,9 @@
 
 import pytest
 import asyncio
+import inspect
 import json
+import sqlite3
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
@@ -12,9 +14,10 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / 'semantic_scholar_tools'))
 
 from utils import (
-    RateLimiter, handle_rate_limit_retry, save_json_to_file, 
+    RateLimiter, AdaptiveRateLimiter, LRUCache, PersistentCache, SingleFlight, MicroBatcher, handle_rate_limit_retry, save_json_to_file, 
     load_json_from_file, sanitize_filename, chunk_list, 
-    extract_arxiv_id, format_authors, debug_print, get_timestamp
+    extract_arxiv_id, format_authors, debug_print, get_timestamp, catch_tool_errors,
+    canonical_paper_id
 )
 
 
@@ -45,6 +48,309 @@ class TestRateLimiter:
         
         # Second call should take longer due to rate limiting
         assert second_wait_time >= 0.05  # Allow some tolerance
+    
+    def test_for_host_shares_limiter(self):
+        """Test that clients of the same host share a single limiter."""
+        limiter = RateLimiter.for_host('example.org')
+        
+        assert RateLimiter.for_host('example.org') is limiter
+        assert RateLimiter.for_host('other.example.org') is not limiter
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_waits_are_spaced(self):
+        """Test that concurrent callers are released one delay apart."""
+        limiter = RateLimiter(delay=0.05)
+        release_times = []
+        
+        async def request():
+            await limiter.wait()
+            release_times.append(asyncio.get_event_loop().time())
+        
+        await asyncio.gather(request(), request(), request())
+        
+        release_times.sort()
+        assert release_times[2] - release_times[0] >= 0.09
+
+
+class TestAdaptiveRateLimiter:
+    """Test cases for AdaptiveRateLimiter class."""
+    
+    def test_backs_off_on_rate_limit_and_recovers(self):
+        """Test that 429s widen the delay and successes shrink it back."""
+        limiter = AdaptiveRateLimiter(delay=1.0, max_delay=5.0, backoff_factor=2.0, recovery_factor=0.5)
+        
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        assert limiter.delay == 4.0
+        assert limiter.consecutive_rate_limits == 2
+        
+        limiter.on_rate_limited()
+        assert limiter.delay == 5.0  # capped at max_delay
+        
+        limiter.on_success()
+        assert limiter.delay == 2.5
+        assert limiter.consecutive_rate_limits == 0
+        
+        limiter.on_success()
+        limiter.on_success()
+        assert limiter.delay == 1.0  # never faster than the configured delay
+    
+    @pytest.mark.asyncio
+    async def test_retry_reports_to_limiter(self):
+        """Test that handle_rate_limit_retry feeds 429s and successes to the limiter."""
+        limiter = AdaptiveRateLimiter(delay=1.0, backoff_factor=2.0, recovery_factor=0.9)
+        statuses = iter([429, 200])
+        
+        async def mock_request():
+            mock_response = Mock()
+            mock_response.status = next(statuses)
+            return mock_response
+        
+        result = await handle_rate_limit_retry(
+            mock_request, max_retries=1, backoff_factor=0.01, rate_limiter=limiter
+        )
+        
+        assert result.status == 200
+        assert limiter.delay == pytest.approx(1.8)
+
+
+class TestLRUCache:
+    """Test cases for LRUCache class."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        
+        assert cache.get('a') == 1  # 'a' becomes most recently used
+        cache.set('c', 3)
+        
+        assert 'b' not in cache
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.get('b', 'missing') == 'missing'
+        assert len(cache) == 2
+    
+    def test_expired_entries_are_dropped(self):
+        """Test that entries are not returned after their TTL has elapsed."""
+        cache = LRUCache(maxsize=4, ttl=60)
+        
+        with patch('utils.time.monotonic', return_value=1000.0):
+            cache.set('long', 1)
+            cache.set('short', None, ttl=5)
+        
+        with patch('utils.time.monotonic', return_value=1010.0):
+            assert cache.get('long') == 1
+            assert cache.get('short', 'expired') == 'expired'
+        
+        with patch('utils.time.monotonic', return_value=1061.0):
+            assert 'long' not in cache
+
+
+class TestPersistentCache:
+    """Test cases for PersistentCache class."""
+    
+    @pytest.mark.asyncio
+    async def test_values_survive_reopening(self):
+        """Test that stored values can be read back by a new instance."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'cache' / 'store.sqlite3'
+            cache = PersistentCache(path)
+            await cache.set('paper', {'title': 'Test', 'year': 2023})
+            cache.close()
+            
+            reopened = PersistentCache(path)
+            assert await reopened.get('paper') == {'title': 'Test', 'year': 2023}
+            assert await reopened.get('missing', 'default') == 'default'
+            reopened.close()
+    
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self):
+        """Test that entries past their ttl are not returned."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = PersistentCache(Path(temp_dir) / 'store.sqlite3', ttl=60)
+            
+            with patch('utils.time.time', return_value=1000.0):
+                await cache.set('paper', [1, 2])
+                await cache.set('forever', [3], ttl=None)
+            
+            with patch('utils.time.time', return_value=1061.0):
+                assert await cache.get('paper') is None
+                assert await cache.get('forever') == [3]
+            cache.close()
+    
+    @pytest.mark.asyncio
+    async def test_expired_rows_are_deleted(self):
+        """Test that expired rows are removed on open and every purge_interval writes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'store.sqlite3'
+            cache = PersistentCache(path, ttl=60, purge_interval=3)
+            
+            def stored_keys():
+                conn = sqlite3.connect(str(path))
+                try:
+                    return sorted(key for key, in conn.execute('SELECT key FROM cache'))
+                finally:
+                    conn.close()
+            
+            with patch('utils.time.time', return_value=1000.0):
+                await cache.set('old', 1)
+                await cache.set('forever', 2, ttl=None)
+            
+            with patch('utils.time.time', return_value=1061.0):
+                await cache.set('new', 3)
+                assert stored_keys() == ['forever', 'new']
+                
+                await cache.set('stale', 4, ttl=0)
+                cache.close()
+                reopened = PersistentCache(path, ttl=60)
+                assert await reopened.get('new') == 3
+                assert stored_keys() == ['forever', 'new']
+                reopened.close()
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight class."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent callers with the same key trigger one call."""
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'result'
+        
+        results = await asyncio.gather(*(flight.do('key', fetch) for _ in range(5)))
+        
+        assert results == ['result'] * 5
+        assert len(calls) == 1
+        assert await flight.do('key', fetch) == 'result'
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Test that a failing call raises in every coalesced caller."""
+        flight = SingleFlight()
+        
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+        
+        results = await asyncio.gather(flight.do('key', fail), flight.do('key', fail), return_exceptions=True)
+        
+        assert all(isinstance(r, ValueError) for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_call_to_waiter(self):
+        """Test that cancelling the caller running the call does not cancel its waiters."""
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+            return 'result'
+        
+        leader = asyncio.create_task(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        
+        assert await follower == 'result'
+        assert len(calls) == 2  # the waiter ran the call itself
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher class."""
+    
+    @pytest.mark.asyncio
+    async def test_items_within_window_share_one_batch(self):
+        """Test that concurrent submissions are processed as one batch."""
+        batches = []
+        
+        async def process(items):
+            batches.append(items)
+            return [ValueError(item) if item == 'bad' else item.upper() for item in items]
+        
+        batcher = MicroBatcher(process, max_batch_size=10, delay=0.01)
+        results = await asyncio.gather(
+            batcher.submit('a'), batcher.submit('bad'), batcher.submit('b'),
+            return_exceptions=True
+        )
+        
+        assert batches == [['a', 'bad', 'b']]
+        assert results[0] == 'A' and results[2] == 'B'
+        assert isinstance(results[1], ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_short_result_list_fails_unmatched_items(self):
+        """Test that items without a result get an error instead of waiting forever."""
+        async def process(items):
+            return [item * 10 for item in items[:1]]
+        
+        batcher = MicroBatcher(process, max_batch_size=10, delay=0.01)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True),
+            timeout=1
+        )
+        
+        assert results[0] == 10
+        assert isinstance(results[1], RuntimeError)
+        assert not batcher._batch_tasks  # finished batch tasks are released
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_immediately(self):
+        """Test that batches are split at max_batch_size."""
+        batches = []
+        
+        async def process(items):
+            batches.append(items)
+            return items
+        
+        batcher = MicroBatcher(process, max_batch_size=2, delay=0.01)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        
+        assert results == [0, 1, 2, 3, 4]
+        assert batches == [[0, 1], [2, 3], [4]]
+
+
+class TestCatchToolErrors:
+    """Test cases for catch_tool_errors decorator."""
+    
+    @pytest.mark.asyncio
+    async def test_exception_becomes_error_result(self):
+        """Test that exceptions are returned as prefixed error dicts."""
+        @catch_tool_errors("Error doing thing")
+        async def tool(value: str, debug: bool = False):
+            """Tool docstring."""
+            if value == 'bad':
+                raise ValueError('boom')
+            return {'success': True, 'value': value}
+        
+        assert await tool('ok') == {'success': True, 'value': 'ok'}
+        assert await tool('bad') == {'success': False, 'error': 'Error doing thing: boom'}
+        assert tool.__doc__ == 'Tool docstring.'
+    
+    @pytest.mark.asyncio
+    async def test_logs_only_when_debug(self):
+        """Test that the call's debug argument controls logging."""
+        @catch_tool_errors("Error")
+        async def tool(value: str, debug: bool = False):
+            raise ValueError(value)
+        
+        with patch('builtins.print') as mock_print:
+            await tool('quiet')
+            mock_print.assert_not_called()
+            await tool('loud', True)
+            mock_print.assert_called_once()
 
 
 class TestHandleRateLimitRetry:
@@ -169,8 +475,10 @@ class TestUtilityFunctions:
         """Test list chunking functionality."""
         test_list = list(range(10))  # [0, 1, 2, ..., 9]
         
-        # Test chunking into groups of 3
+        # Test chunking into groups of 3; chunks are produced lazily
         chunks = chunk_list(test_list, 3)
+        assert inspect.isgenerator(chunks)
+        chunks = list(chunks)
         assert len(chunks) == 4  # [0,1,2], [3,4,5], [6,7,8], [9]
         assert chunks[0] == [0, 1, 2]
         assert chunks[1] == [3, 4, 5]
@@ -179,13 +487,13 @@ class TestUtilityFunctions:
     
     def test_chunk_empty_list(self):
         """Test chunking an empty list."""
-        chunks = chunk_list([], 5)
+        chunks = list(chunk_list([], 5))
         assert chunks == []
     
     def test_chunk_list_smaller_than_chunk_size(self):
         """Test chunking a list smaller than chunk size."""
         test_list = [1, 2, 3]
-        chunks = chunk_list(test_list, 5)
+        chunks = list(chunk_list(test_list, 5))
         assert len(chunks) == 1
         assert chunks[0] == [1, 2, 3]
     
@@ -203,6 +511,12 @@ class TestUtilityFunctions:
             extracted_id = extract_arxiv_id(url)
             assert extracted_id == expected_id
     
+    def test_canonical_paper_id(self):
+        """Test normalizing identifiers to a canonical form."""
+        assert canonical_paper_id('https://arxiv.org/abs/2301.12345v2') == '2301.12345v2'
+        assert canonical_paper_id(' 2301.12345 ') == '2301.12345'
+        assert canonical_paper_id(' 10.1000/XYZ123 ') == '10.1000/XYZ123'
+    
     def test_extract_arxiv_id_from_id(self):
         """Test extracting ArXiv ID when input is already an ID."""
         test_cases = [